@@ -0,0 +1,72 @@
+"""Latency and allocations of the response encoders for large responses.
+
+Compares FastAPI's default serialization of a `SchemaAPIRoute` response with the direct-to-bytes encoders:
+
+    python -m benchmarks.encoders --items 10000 50000
+"""
+import argparse
+import time
+import tracemalloc
+from typing import List, Optional, Tuple, Type
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_responseschema import SchemaAPIRoute
+from fastapi_responseschema.encoders import ResponseEncoder, PydanticResponseEncoder, OrjsonResponseEncoder
+from .routing_overhead import Item, ResponseSchema
+
+
+def build_client(encoder: Optional[ResponseEncoder], items: int) -> TestClient:
+    class Route(SchemaAPIRoute):
+        response_schema = ResponseSchema
+        response_encoder = encoder
+
+    app = FastAPI()
+    app.router.route_class = Route
+    payload = [Item(id=i, name=f"item-{i:032d}") for i in range(items)]
+
+    @app.get("/items", response_model=List[Item])
+    async def list_items():
+        return payload
+
+    return TestClient(app)
+
+
+def measure(client: TestClient, repeat: int) -> Tuple[int, float, int]:
+    size = len(client.get("/items").content)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        client.get("/items")
+    elapsed = (time.perf_counter() - start) / repeat
+    tracemalloc.start()
+    client.get("/items")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    encoders: List[Tuple[str, Optional[Type[ResponseEncoder]]]] = [
+        ("default", None),
+        ("pydantic", PydanticResponseEncoder),
+    ]
+    try:
+        import orjson  # noqa: F401
+
+        encoders.append(("orjson", OrjsonResponseEncoder))
+    except ImportError:
+        pass
+    print(f"{'items':>8}{'encoder':>10}{'size (MB)':>12}{'latency (ms)':>14}{'peak alloc (MB)':>17}")
+    for items in args.items:
+        for name, encoder_class in encoders:
+            client = build_client(encoder_class() if encoder_class else None, items)
+            size, elapsed, peak = measure(client, args.repeat)
+            print(f"{items:>8}{name:>10}{size / 2**20:>12.2f}{elapsed * 1e3:>14.1f}{peak / 2**20:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""In-process ASGI benchmark harness.
+
+Requests are sent straight to the ASGI application, without sockets or HTTP clients,
+so measurements only include the application and the framework.
+"""
+import asyncio
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from importlib.metadata import version
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+@dataclass
+class Measurement:
+    scenario: str
+    route: str
+    requests: int
+    rps: float
+    p50_us: float
+    p99_us: float
+    alloc_kib: float
+
+
+async def call(app: Any, path: str, method: str = "GET") -> Tuple[int, bytes]:
+    """Sends a single request to an ASGI application.
+
+    Args:
+        app (Any): The ASGI application.
+        path (str): Request path, with an optional query string.
+        method (str, optional): Request method. Defaults to "GET".
+
+    Returns:
+        Tuple[int, bytes]: The response status code and body.
+    """
+    url = urlsplit(path)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": url.path,
+        "raw_path": url.path.encode(),
+        "query_string": url.query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+    status = 0
+    body = bytearray()
+    request_sent = False
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()  # never disconnects
+        return {}  # pragma: no cover
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, bytes(body)
+
+
+async def _measure(app: Any, path: str, requests: int, alloc_samples: int) -> Tuple[List[int], float]:
+    for _ in range(min(requests, 50)):  # warm-up: route handlers, caches and parametrizations
+        await call(app, path)
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter_ns()
+        await call(app, path)
+        latencies.append(time.perf_counter_ns() - start)
+    peaks = []
+    for _ in range(alloc_samples):
+        tracemalloc.start()
+        await call(app, path)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return latencies, statistics.median(peaks) if peaks else 0.0
+
+
+def measure(scenario: str, route: str, app: Any, path: str, requests: int, alloc_samples: int = 5) -> Measurement:
+    """Measures the throughput, latency percentiles and allocations of an endpoint.
+
+    Args:
+        scenario (str): The scenario name.
+        route (str): The route class name.
+        app (Any): The ASGI application.
+        path (str): Request path.
+        requests (int): Number of timed requests.
+        alloc_samples (int, optional): Number of requests traced for allocations. Defaults to 5.
+
+    Returns:
+        Measurement: The measurement.
+    """
+    latencies, peak = asyncio.run(_measure(app, path, requests, alloc_samples))
+    latencies.sort()
+    return Measurement(
+        scenario=scenario,
+        route=route,
+        requests=requests,
+        rps=1e9 * len(latencies) / sum(latencies),
+        p50_us=latencies[len(latencies) // 2] / 1e3,
+        p99_us=latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] / 1e3,
+        alloc_kib=peak / 1024,
+    )
+
+
+def environment() -> Dict[str, str]:
+    """Describes the benchmark environment.
+
+    Returns:
+        Dict[str, str]: Python and library versions.
+    """
+    versions = {"python": platform.python_version(), "implementation": platform.python_implementation()}
+    for package in ("fastapi", "starlette", "pydantic", "fastapi-responseschema", "fastapi-pagination"):
+        try:
+            versions[package] = version(package)
+        except Exception:  # not installed
+            versions[package] = "n/a"
+    return versions
+
+
+def relative(measurements: List[Measurement], baseline_route: str) -> Dict[str, Dict[str, float]]:
+    """Computes every measurement relative to the baseline route of the same scenario.
+
+    Args:
+        measurements (List[Measurement]): The measurements.
+        baseline_route (str): The baseline route name.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Ratios keyed by `scenario/route`.
+    """
+    baselines = {m.scenario: m for m in measurements if m.route == baseline_route}
+    ratios = {}
+    for m in measurements:
+        base = baselines.get(m.scenario)
+        if base is None or m is base:
+            continue
+        ratios[f"{m.scenario}/{m.route}"] = {
+            "rps": m.rps / base.rps,
+            "p50": m.p50_us / base.p50_us,
+            "p99": m.p99_us / base.p99_us,
+            "alloc": m.alloc_kib / base.alloc_kib if base.alloc_kib else 0.0,
+        }
+    return ratios
+
+
+def report(measurements: List[Measurement], baseline_route: str) -> Dict[str, Any]:
+    """Builds the machine readable report.
+
+    Args:
+        measurements (List[Measurement]): The measurements.
+        baseline_route (str): The baseline route name.
+
+    Returns:
+        Dict[str, Any]: The report.
+    """
+    return {
+        "environment": environment(),
+        "baseline": baseline_route,
+        "measurements": [asdict(m) for m in measurements],
+        "relative": relative(measurements, baseline_route),
+    }
+
+
+def compare(current: Dict[str, Any], previous: Dict[str, Any], max_regression: float) -> List[str]:
+    """Compares the p50 ratios of two reports.
+    Ratios to the baseline route are compared instead of absolute values, so reports from different machines
+    remain comparable.
+
+    Args:
+        current (Dict[str, Any]): The current report.
+        previous (Dict[str, Any]): The previous report.
+        max_regression (float): Maximum accepted increase of a ratio, e.g. 0.1 for 10%.
+
+    Returns:
+        List[str]: A description of every regression.
+    """
+    regressions = []
+    for key, ratios in current["relative"].items():
+        before: Optional[Dict[str, float]] = previous.get("relative", {}).get(key)
+        if before is None:
+            continue
+        change = ratios["p50"] / before["p50"] - 1
+        if change > max_regression:
+            regressions.append(f"{key}: p50 ratio {before['p50']:.2f} -> {ratios['p50']:.2f} (+{change:.0%})")
+    return regressions
+
+
+def print_table(measurements: List[Measurement], baseline_route: str) -> None:
+    ratios = relative(measurements, baseline_route)
+    print(f"{'scenario':<22}{'route':<20}{'req/s':>10}{'p50 (us)':>11}{'p99 (us)':>11}{'alloc (KiB)':>13}{'p50 x':>8}")
+    for m in measurements:
+        ratio = ratios.get(f"{m.scenario}/{m.route}", {}).get("p50", 1.0)
+        print(
+            f"{m.scenario:<22}{m.route:<20}{m.rps:>10.0f}{m.p50_us:>11.1f}{m.p99_us:>11.1f}"
+            f"{m.alloc_kib:>13.1f}{ratio:>8.2f}"
+        )
+
+
+def dump(data: Dict[str, Any], path: str) -> None:
+    with open(path, "w") as output:
+        json.dump(data, output, indent=2)
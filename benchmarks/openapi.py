@@ -0,0 +1,61 @@
+"""OpenAPI generation and serving cost of `SchemaAPIRoute` applications with thousands of routes.
+
+Generates the document of applications with N and 2N synthetic routes, to check it scales linearly,
+and measures the requests of `openapi_url` served by FastAPI and by `cache_openapi`:
+
+    python -m benchmarks.openapi --routes 2500 --models 250
+"""
+import argparse
+import asyncio
+import time
+from typing import Type
+from fastapi.routing import APIRoute
+from fastapi_responseschema.openapi import cache_openapi
+from .harness import call
+from .startup import ROUTE_CLASSES, build_app
+
+
+def measure_generation(route_class: Type[APIRoute], routes: int, models: int) -> float:
+    app = build_app(route_class, routes, models)
+    start = time.perf_counter()
+    app.openapi()
+    return time.perf_counter() - start
+
+
+def measure_requests(route_class: Type[APIRoute], routes: int, models: int, cached: bool, repeat: int) -> float:
+    app = build_app(route_class, routes, models)
+    if cached:
+        cache_openapi(app)
+
+    async def run() -> float:
+        await call(app, "/openapi.json")  # generates the document
+        start = time.perf_counter()
+        for _ in range(repeat):
+            await call(app, "/openapi.json")
+        return (time.perf_counter() - start) / repeat
+
+    return asyncio.run(run())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--routes", type=int, default=2500)
+    parser.add_argument("--models", type=int, default=250)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{args.models} models")
+    print(f"{'route class':>16}{'routes':>8}{'openapi() (s)':>15}{'per route (us)':>16}")
+    for route_class in ROUTE_CLASSES:
+        for routes in (args.routes, 2 * args.routes):
+            elapsed = measure_generation(ROUTE_CLASSES[route_class], routes, args.models)
+            print(f"{route_class:>16}{routes:>8}{elapsed:>15.2f}{elapsed / routes * 1e6:>16.1f}")
+
+    print(f"\n{'openapi.json':>16}{'routes':>8}{'latency (ms)':>15}")
+    for cached in (False, True):
+        latency = measure_requests(ROUTE_CLASSES["SchemaAPIRoute"], args.routes, args.models, cached, args.repeat)
+        print(f"{'cache_openapi' if cached else 'FastAPI':>16}{args.routes:>8}{latency * 1e3:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
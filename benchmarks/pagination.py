@@ -0,0 +1,65 @@
+"""Latency of the pagination metadata construction, per page served.
+
+Compares `fastapi_pagination.links.create_links` with validated `PaginationMetadata` construction,
+the link template path and `PaginationMetadata.from_params`:
+
+    python -m benchmarks.pagination --repeat 100000
+"""
+import argparse
+import time
+from math import ceil
+from typing import Callable, List, Tuple
+from fastapi import Request
+from fastapi_pagination.api import _req_val
+from fastapi_pagination.links.bases import create_links
+from fastapi_responseschema.integrations.pagination import PaginationMetadata, PaginationParams
+
+TOTAL = 100000
+QUERY = "q=birds&sort=-id&page=3&page_size=50"
+
+
+def create_links_metadata(total: int, params: PaginationParams) -> PaginationMetadata:
+    return PaginationMetadata(
+        total=total,
+        page_size=params.page_size,
+        page=params.page,
+        links=create_links(
+            first={"page": 1},
+            last={"page": ceil(total / params.page_size) if total > 0 else 1},
+            next={"page": params.page + 1} if params.page * params.page_size < total else None,
+            prev={"page": params.page - 1} if 1 <= params.page - 1 else None,
+        ),
+    )
+
+
+def measure(build: Callable[[int, PaginationParams], PaginationMetadata], repeat: int) -> float:
+    params = PaginationParams(page=3, page_size=50)
+    build(TOTAL, params)  # warm-up, fills the link template cache
+    start = time.perf_counter()
+    for _ in range(repeat):
+        build(TOTAL, params)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20000)
+    args = parser.parse_args()
+
+    # every path reads the request URL from the fastapi-pagination context, as in a request
+    _req_val.set(Request({"type": "http", "path": "/birds", "query_string": QUERY.encode(), "headers": []}))
+    paths: List[Tuple[str, Callable[[int, PaginationParams], PaginationMetadata]]] = [
+        ("create_links", create_links_metadata),
+        ("from_abstract_page_create", PaginationMetadata.from_abstract_page_create),
+        ("from_params", PaginationMetadata.from_params),
+    ]
+    baseline = None
+    print(f"{'path':>28}{'latency (us)':>14}{'speedup':>10}")
+    for name, build in paths:
+        elapsed = measure(build, args.repeat)
+        baseline = baseline or elapsed
+        print(f"{name:>28}{elapsed * 1e6:>14.2f}{baseline / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
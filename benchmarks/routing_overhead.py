@@ -0,0 +1,81 @@
+"""Per-request overhead of `SchemaAPIRoute` compared to a plain `fastapi.routing.APIRoute`.
+
+Runs offline against an in-process application:
+
+    python -m benchmarks.routing_overhead --requests 5000
+"""
+import argparse
+import time
+from typing import Generic, List, TypeVar, Type
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from fastapi_responseschema import AbstractResponseSchema, SchemaAPIRoute
+
+
+T = TypeVar("T")
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+class ResponseSchema(AbstractResponseSchema[T], Generic[T]):
+    data: T
+    error: bool
+
+    @classmethod
+    def from_exception(cls, reason: T, status_code: int, **others):  # type: ignore[override]
+        return cls(data=reason, error=status_code >= 400)
+
+    @classmethod
+    def from_api_route(cls, content: T, status_code: int, **others):  # type: ignore[override]
+        return cls(data=content, error=status_code >= 400)
+
+
+class Route(SchemaAPIRoute):
+    response_schema = ResponseSchema
+
+
+def build_app(route_class: Type[APIRoute]) -> FastAPI:
+    app = FastAPI()
+    app.router.route_class = route_class
+
+    @app.get("/item", response_model=Item)
+    def item():
+        return {"id": 1, "name": "item"}
+
+    @app.get("/items", response_model=List[Item])
+    async def items():
+        return [{"id": i, "name": f"item-{i}"} for i in range(100)]
+
+    return app
+
+
+def measure(client: TestClient, path: str, requests: int) -> float:
+    for _ in range(min(requests, 100)):  # warm-up
+        client.get(path)
+    start = time.perf_counter()
+    for _ in range(requests):
+        client.get(path)
+    return (time.perf_counter() - start) / requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    baseline = TestClient(build_app(APIRoute))
+    wrapped = TestClient(build_app(Route))
+    print(f"{'path':<10}{'APIRoute (us)':>16}{'SchemaAPIRoute (us)':>22}{'overhead (us)':>16}")
+    for path in ("/item", "/items"):
+        base = measure(baseline, path, args.requests) * 1e6
+        schema = measure(wrapped, path, args.requests) * 1e6
+        print(f"{path:<10}{base:>16.1f}{schema:>22.1f}{schema - base:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Application startup cost of `SchemaAPIRoute` compared to a plain `fastapi.routing.APIRoute`.
+
+Builds an application with N synthetic routes, returning one of M models or a list of them,
+and reports the construction time and the peak memory allocated while building it.
+Every measurement runs in a fresh interpreter, as every worker of a deployment boots from scratch:
+
+    python -m benchmarks.startup --routes 2500 --models 250
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from pydantic import create_model
+from fastapi_responseschema import AbstractResponseSchema, SchemaAPIRoute
+
+
+T = TypeVar("T")
+
+
+class ResponseSchema(AbstractResponseSchema[T], Generic[T]):
+    data: T
+    error: bool
+
+    @classmethod
+    def from_exception(cls, reason: T, status_code: int, **others):  # type: ignore[override]
+        return cls(data=reason, error=status_code >= 400)
+
+    @classmethod
+    def from_api_route(cls, content: T, status_code: int, **others):  # type: ignore[override]
+        return cls(data=content, error=status_code >= 400)
+
+
+class Route(SchemaAPIRoute):
+    response_schema = ResponseSchema
+
+
+class TrustedRoute(Route):
+    trust_response_schema = True
+
+
+ROUTE_CLASSES: Dict[str, Type[APIRoute]] = {"APIRoute": APIRoute, "SchemaAPIRoute": Route, "trusted": TrustedRoute}
+
+
+def build_app(route_class: Type[APIRoute], routes: int, models: int) -> FastAPI:
+    response_models = [create_model(f"Model{i}", id=(int, ...), name=(str, ...)) for i in range(models)]
+    app = FastAPI()
+    app.router.route_class = route_class
+    for i in range(routes):
+
+        def endpoint(item_id: int, q: Optional[str] = None) -> Any:
+            return None
+
+        model = response_models[i % models]
+        app.get(f"/route-{i}/{{item_id}}", response_model=List[model] if i % 2 else model)(endpoint)  # type: ignore
+    return app
+
+
+def measure(route_class: str, routes: int, models: int, memory: bool) -> float:
+    if memory:
+        tracemalloc.start()
+        build_app(ROUTE_CLASSES[route_class], routes, models)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak / 2**20
+    start = time.perf_counter()
+    build_app(ROUTE_CLASSES[route_class], routes, models)
+    return time.perf_counter() - start
+
+
+def run_isolated(route_class: str, routes: int, models: int, memory: bool) -> float:
+    command = [sys.executable, "-m", "benchmarks.startup", "--routes", str(routes), "--models", str(models)]
+    command += ["--child", route_class] + (["--memory"] if memory else [])
+    return json.loads(subprocess.run(command, check=True, capture_output=True, text=True).stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--routes", type=int, default=2500)
+    parser.add_argument("--models", type=int, default=250)
+    parser.add_argument("--child", choices=list(ROUTE_CLASSES), help=argparse.SUPPRESS)
+    parser.add_argument("--memory", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        print(json.dumps(measure(args.child, args.routes, args.models, args.memory)))
+        return
+
+    baseline = None
+    print(f"{args.routes} routes, {args.models} models")
+    print(f"{'route class':>16}{'boot (s)':>10}{'ratio':>8}{'peak memory (MiB)':>20}")
+    for route_class in ROUTE_CLASSES:
+        elapsed = run_isolated(route_class, args.routes, args.models, memory=False)
+        peak = run_isolated(route_class, args.routes, args.models, memory=True)
+        baseline = baseline or elapsed
+        print(f"{route_class:>16}{elapsed:>10.2f}{elapsed / baseline:>7.2f}x{peak:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
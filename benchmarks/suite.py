@@ -0,0 +1,179 @@
+"""Benchmark suite comparing `SchemaAPIRoute` variants against a plain `fastapi.routing.APIRoute` baseline.
+
+Every scenario runs offline against in-process ASGI applications:
+
+    python -m benchmarks.suite --requests 1000 --output bench.json
+    python -m benchmarks.suite --compare bench.json --max-regression 0.1
+
+Run the suite in environments with pydantic v1 and v2 installed and compare the JSON reports
+to evaluate both major versions.
+"""
+import argparse
+import json
+import sys
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar, Union
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi_responseschema import SchemaAPIRoute, respond, wrap_app_responses
+from fastapi_responseschema.encoders import PydanticResponseEncoder
+from fastapi_responseschema.exceptions import NotFound
+from .harness import Measurement, compare, dump, measure, print_table, report
+from .routing_overhead import Item, ResponseSchema
+
+try:
+    from fastapi_pagination import Page, add_pagination, paginate
+    from fastapi_responseschema.integrations.pagination import (
+        AbstractPagedResponseSchema,
+        PagedSchemaAPIRoute,
+        PaginationMetadata,
+        PaginationParams,
+    )
+except ImportError:  # pragma: no cover
+    Page = None  # type: ignore
+
+
+T = TypeVar("T")
+BASELINE = "APIRoute"
+ITEMS = [Item(id=i, name=f"item-{i}") for i in range(1000)]
+
+
+class Route(SchemaAPIRoute):
+    response_schema = ResponseSchema
+
+
+class TrustedRoute(Route):
+    trust_response_schema = True
+
+
+class EncodedRoute(Route):
+    response_encoder = PydanticResponseEncoder()
+
+
+if Page is not None:
+
+    class PagedResponseSchema(AbstractPagedResponseSchema[T], Generic[T]):
+        data: Union[Sequence[T], T]
+        error: bool
+        pagination: Optional[PaginationMetadata] = None
+
+        @classmethod
+        def create(cls, items: Sequence[T], params: PaginationParams, total: int):  # type: ignore[override]
+            pagination = PaginationMetadata.from_abstract_page_create(total=total, params=params)
+            return cls(data=items, error=False, pagination=pagination)
+
+        @classmethod
+        def from_exception(cls, reason: T, status_code: int, **others):  # type: ignore[override]
+            return cls(data=reason, error=status_code >= 400)
+
+        @classmethod
+        def from_api_route(cls, content: Any, status_code: int, **others):  # type: ignore[override]
+            return cls(data=content.data, error=status_code >= 400, pagination=content.pagination)
+
+
+def build_app(route_class: Type[APIRoute]) -> FastAPI:
+    app = FastAPI()
+    is_schema_route = issubclass(route_class, SchemaAPIRoute)
+    if is_schema_route:
+        wrap_app_responses(app, route_class)  # type: ignore
+    else:
+        app.router.route_class = route_class
+
+    @app.get("/small-sync", response_model=Item)
+    def small_sync():
+        return ITEMS[0]
+
+    @app.get("/small-async", response_model=Item)
+    async def small_async():
+        return ITEMS[0]
+
+    @app.get("/large-sync", response_model=List[Item])
+    def large_sync():
+        return ITEMS
+
+    @app.get("/large-async", response_model=List[Item])
+    async def large_async():
+        return ITEMS
+
+    @app.get("/respond", response_model=Item)
+    async def with_metadata():
+        return respond(ITEMS[0], description="with metadata") if is_schema_route else ITEMS[0]
+
+    @app.get("/error", response_model=Item)
+    async def error():
+        raise NotFound(detail="missing")
+
+    if Page is not None:
+        paged_model: Any = Page[Item]
+        if is_schema_route:
+
+            class PagedRoute(PagedSchemaAPIRoute, route_class):  # type: ignore
+                response_schema = ResponseSchema
+                paged_response_schema = PagedResponseSchema
+
+            paged_model = PagedResponseSchema[Item]
+            app.router.route_class = PagedRoute
+
+        @app.get("/paged", response_model=paged_model)
+        async def paged():
+            return paginate(ITEMS)
+
+        add_pagination(app)
+    return app
+
+
+SCENARIOS: List[Tuple[str, str]] = [
+    ("small-object-sync", "/small-sync"),
+    ("small-object-async", "/small-async"),
+    ("large-list-sync", "/large-sync"),
+    ("large-list-async", "/large-async"),
+    ("respond-metadata", "/respond"),
+    ("error", "/error"),
+    ("paged", "/paged?page=3&page_size=50"),
+]
+ROUTES: Dict[str, Type[APIRoute]] = {
+    BASELINE: APIRoute,
+    "SchemaAPIRoute": Route,
+    "trusted": TrustedRoute,
+    "encoder": EncodedRoute,
+}
+
+
+def run(requests: int, scenarios: Optional[List[str]] = None, log: Callable[[str], Any] = print) -> List[Measurement]:
+    apps = {name: build_app(route_class) for name, route_class in ROUTES.items()}
+    measurements = []
+    for scenario, path in SCENARIOS:
+        if scenarios and scenario not in scenarios:
+            continue
+        if path.startswith("/paged") and Page is None:
+            log(f"skipping {scenario}: fastapi-pagination is not installed")
+            continue
+        for name, app in apps.items():
+            measurements.append(measure(scenario, name, app, path, requests))
+    return measurements
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500, help="timed requests per scenario and route")
+    parser.add_argument("--scenario", action="append", choices=[name for name, _ in SCENARIOS])
+    parser.add_argument("--output", help="writes the JSON report to this file")
+    parser.add_argument("--compare", help="a previous JSON report to compare with")
+    parser.add_argument("--max-regression", type=float, default=0.1, help="accepted increase of the p50 ratios")
+    args = parser.parse_args()
+
+    measurements = run(args.requests, args.scenario)
+    print_table(measurements, BASELINE)
+    data = report(measurements, BASELINE)
+    if args.output:
+        dump(data, args.output)
+    if args.compare:
+        with open(args.compare) as previous:
+            regressions = compare(data, json.load(previous), args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
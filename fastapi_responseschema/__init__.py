@@ -1,9 +1,35 @@
-from .interfaces import AbstractResponseSchema
-from .routing import respond, SchemaAPIRoute
-from .helpers import wrap_app_responses, wrap_error_responses
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .interfaces import AbstractResponseSchema
+    from .routing import respond, SchemaAPIRoute
+    from .helpers import wrap_app_responses, wrap_error_responses
 
 
 __version__ = "2.1.0"
 
 
 __all__ = ["AbstractResponseSchema", "respond", "SchemaAPIRoute", "wrap_app_responses", "wrap_error_responses"]
+
+# The public API is imported on first access, so importing the package does not import FastAPI and pydantic.
+_lazy_attributes = {
+    "AbstractResponseSchema": "interfaces",
+    "respond": "routing",
+    "SchemaAPIRoute": "routing",
+    "wrap_app_responses": "helpers",
+    "wrap_error_responses": "helpers",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _lazy_attributes.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_lazy_attributes})
@@ -1,8 +1,11 @@
-from typing import Any, Dict, Set, Union
-from importlib.metadata import version
+import json
+from typing import Any, Callable, Dict, Set, Tuple, Type, TypeVar, Union
+from pydantic import VERSION as PYDANTIC_VERSION
 from pydantic import BaseModel  # noqa: E402
+from fastapi.encoders import jsonable_encoder
 
-PYDANTIC_MAJOR = int(version("pydantic").split(".")[0])
+PYDANTIC_MAJOR = int(str(PYDANTIC_VERSION).split(".")[0])  # read from the imported package, not the distributions
+TModel = TypeVar("TModel", bound=BaseModel)
 
 try:
     from fastapi.encoders import DictIntStrAny, SetIntStr  # type: ignore
@@ -12,15 +15,77 @@ except ImportError:
 
 
 if PYDANTIC_MAJOR < 2:
+    from pydantic import parse_obj_as
     from pydantic.generics import GenericModel as PydanticGenericModel  # noqa: F401
     from pydantic.utils import lenient_issubclass, lenient_isinstance  # noqa: F401
 
-    def model_to_dict(model: BaseModel) -> dict:
-        return model.dict()
+    def model_to_dict(model: BaseModel, **options: Any) -> dict:
+        return model.dict(**options)
+
+    def model_to_json(model: BaseModel, **options: Any) -> bytes:
+        return model.json(**options).encode("utf-8")
+
+    def model_to_jsonable(model: Any, **options: Any) -> Any:
+        return jsonable_encoder(model, **options)
+
+    def get_model_field_names(model: Type[BaseModel]) -> Tuple[str, ...]:
+        return tuple(model.__fields__)  # type: ignore[arg-type]
+
+    def build_model(model: Type[TModel], **values: Any) -> TModel:
+        return model.construct(**values)  # validation dominates building small models
+
+    def get_type_serializer(type_: Any) -> Callable[..., bytes]:
+        def serialize(value: Any, **options: Any) -> bytes:
+            data = jsonable_encoder(parse_obj_as(type_, value), **options)
+            return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        return serialize
 
 else:
     from pydantic import BaseModel as PydanticGenericModel  # noqa: F401
-    from pydantic.v1.utils import lenient_issubclass, lenient_isinstance  # noqa: F401
+    from typing import get_origin
+    from pydantic import TypeAdapter
+
+    # `pydantic.v1.utils` provides these, but importing it loads the whole `pydantic.v1` package
+    def lenient_isinstance(o: Any, class_or_tuple: Any) -> bool:
+        try:
+            return isinstance(o, class_or_tuple)
+        except TypeError:
+            return False
+
+    def lenient_issubclass(cls: Any, class_or_tuple: Any) -> bool:
+        try:
+            return isinstance(cls, type) and issubclass(cls, class_or_tuple)
+        except TypeError:
+            if get_origin(cls) is not None:  # e.g. `list[int]` is an instance of `type` on python < 3.11
+                return False
+            raise
+
+    def model_to_dict(model: BaseModel, **options: Any) -> dict:
+        return model.model_dump(**options)
+
+    def model_to_json(model: BaseModel, **options: Any) -> bytes:
+        return model.__pydantic_serializer__.to_json(
+            model, **options
+        )  # skips the `str` round trip of `model_dump_json`
+
+    def get_model_field_names(model: Type[BaseModel]) -> Tuple[str, ...]:
+        return tuple(model.model_fields)  # type: ignore[arg-type]
+
+    def build_model(model: Type[TModel], **values: Any) -> TModel:
+        return model(
+            **values
+        )  # validates: pydantic-core validates small models faster than `model_construct` builds them
+
+    def model_to_jsonable(model: Any, **options: Any) -> Any:
+        if isinstance(model, BaseModel):
+            return model.model_dump(mode="json", **options)
+        return jsonable_encoder(model, **options)
+
+    def get_type_serializer(type_: Any) -> Callable[..., bytes]:
+        adapter = TypeAdapter(type_)
+
+        def serialize(value: Any, **options: Any) -> bytes:
+            return adapter.dump_json(adapter.validate_python(value, from_attributes=True), **options)
 
-    def model_to_dict(model: BaseModel) -> dict:
-        return model.model_dump()
+        return serialize
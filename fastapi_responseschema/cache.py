@@ -0,0 +1,503 @@
+from __future__ import annotations
+import asyncio
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+from starlette.requests import Request
+from starlette.responses import Response
+from .registry import RegistryStats
+
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """Thread-safe, size bounded, least recently used cache."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Caches are always bounded.
+
+        Args:
+            maxsize (int, optional): Maximum number of entries. Defaults to 1024.
+        """
+        if maxsize < 1:
+            raise ValueError("`maxsize` must be a positive integer.")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, V]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Returns the cached value, marking it as recently used.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Optional[V]: The cached value or None.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Stores a value, evicting the least recently used entries when full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (V): The value to cache.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """Removes an entry if present.
+
+        Args:
+            key (Hashable): The cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drops every entry and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> RegistryStats:
+        """Returns the cache counters.
+
+        Returns:
+            RegistryStats: A snapshot of the cache counters.
+        """
+        return RegistryStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._entries),
+            maxsize=self.maxsize,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CachedResponse(NamedTuple):
+    """A fully encoded response.
+
+    Args:
+        body (bytes): The encoded response body.
+        status_code (int): The response status code.
+        headers (dict): The response headers, including content type and length.
+    """
+
+    body: bytes
+    status_code: int
+    headers: dict
+
+
+class ErrorResponseCache(LRUCache[CachedResponse]):
+    """Caches the encoded error responses built by `wrap_error_responses`.
+
+    Only exceptions declaring `cacheable_response = True` (as the fixed status subclasses of
+    `BaseGenericHTTPException` do) or listed in `cacheable_exceptions` are cached,
+    keyed on exception class, status code, detail, headers and extra params.
+    Error response schemas must not depend on the request to be cached.
+    """
+
+    def __init__(self, maxsize: int = 1024, cacheable_exceptions: Tuple[Type[Exception], ...] = ()) -> None:
+        """Additional exception classes can be declared cacheable.
+
+        Args:
+            maxsize (int, optional): Maximum number of cached responses. Defaults to 1024.
+            cacheable_exceptions (Tuple[Type[Exception], ...], optional): Additional cacheable exception classes, \
+                e.g. `starlette.exceptions.HTTPException` for router generated 404 and 405. Defaults to ().
+        """
+        super().__init__(maxsize=maxsize)
+        self.cacheable_exceptions = cacheable_exceptions
+
+    def is_cacheable(self, exception: Exception) -> bool:
+        """Evaluates whether or not the error response for the exception can be cached.
+
+        Args:
+            exception (Exception): The raised exception.
+
+        Returns:
+            bool: wether or not the error response can be cached.
+        """
+        return getattr(exception, "cacheable_response", False) or isinstance(exception, self.cacheable_exceptions)
+
+    def get_key(self, exception: Exception, status_code: int) -> Optional[Hashable]:
+        """Builds the cache key for an exception.
+
+        Args:
+            exception (Exception): The raised exception.
+            status_code (int): The response status code.
+
+        Returns:
+            Optional[Hashable]: The cache key, None if the exception is not cacheable.
+        """
+        if not self.is_cacheable(exception):
+            return None
+        headers = getattr(exception, "headers", None)
+        extra_params = getattr(exception, "extra_params", None)
+        key = (
+            type(exception),
+            status_code,
+            getattr(exception, "detail", None),
+            tuple(sorted(headers.items())) if headers else None,
+            tuple(sorted(extra_params.items())) if extra_params else None,
+        )
+        try:
+            hash(key)
+        except TypeError:  # unhashable details or params are never cached
+            return None
+        return key
+
+
+class ResponseStorage(ABC):
+    """Stores the encoded responses of a `ResponseCache`.
+
+    Subclasses must implement `ResponseStorage.get`, `ResponseStorage.set`, `ResponseStorage.delete`
+    and `ResponseStorage.clear`, they can be called concurrently from several threads.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:  # pragma: no cover
+        """Returns a stored response, marking it as recently used.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[CachedResponse]: The response, None when it is not stored or expired.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, response: CachedResponse, ttl: float) -> None:  # pragma: no cover
+        """Stores a response, evicting the least recently used ones when full.
+
+        Args:
+            key (str): The cache key.
+            response (CachedResponse): The encoded response.
+            ttl (float): Seconds the response is served for.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:  # pragma: no cover
+        """Removes a response if present.
+
+        Args:
+            key (str): The cache key.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:  # pragma: no cover
+        """Removes every response."""
+        pass
+
+
+class MemoryResponseStorage(ResponseStorage):
+    """Stores the responses in the process memory, bounded in number of responses and body bytes."""
+
+    def __init__(self, maxsize: int = 1024, max_bytes: int = 64 * 2**20) -> None:
+        """Both limits are enforced, evicting the least recently used responses.
+
+        Args:
+            maxsize (int, optional): Maximum number of responses. Defaults to 1024.
+            max_bytes (int, optional): Maximum size of the stored bodies, in bytes. Defaults to 64 MiB.
+        """
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[str, Tuple[float, CachedResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, response: CachedResponse, ttl: float) -> None:
+        if len(response.body) > self.max_bytes:
+            return
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self.size += len(response.body)
+            while len(self._entries) > self.maxsize or self.size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1].body)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_FILE_HEADER = struct.Struct(">dHI")  # expiration timestamp, status code, headers length
+
+
+class FileResponseStorage(ResponseStorage):
+    """Stores the responses as files shared by the worker processes of a server, e.g. `uvicorn --workers 4`.
+    Use a directory on a memory backed filesystem, e.g. `/dev/shm/myapp`, so that responses never hit the disk:
+    files are memory mapped when read and replaced atomically when written.
+
+    The size limit is enforced by the process writing the response that exceeds it,
+    evicting the least recently used responses.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 2**20) -> None:
+        """The directory is created if needed, it must only be used by a single storage.
+
+        Args:
+            directory (str): The directory storing the responses.
+            max_bytes (int, optional): Maximum size of the stored responses, in bytes. Defaults to 256 MiB.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._estimated_size = self._scan()[0]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.response")
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                expires_at, status_code, headers_length = _FILE_HEADER.unpack_from(mapped)
+                if time.time() >= expires_at:
+                    response = None
+                else:
+                    start = _FILE_HEADER.size
+                    headers = json.loads(mapped[start : start + headers_length])
+                    response = CachedResponse(
+                        body=mapped[start + headers_length :], status_code=status_code, headers=headers
+                    )
+        except (OSError, ValueError, struct.error):  # missing, being replaced or corrupted files
+            return None
+        if response is None:
+            self.delete(key)
+            return None
+        try:
+            os.utime(path)  # the modification time orders the least recently used responses
+        except OSError:
+            pass
+        return response
+
+    def set(self, key: str, response: CachedResponse, ttl: float) -> None:
+        headers = json.dumps(response.headers).encode()
+        size = _FILE_HEADER.size + len(headers) + len(response.body)
+        if size > self.max_bytes:
+            return
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(_FILE_HEADER.pack(time.time() + ttl, response.status_code, len(headers)))
+                file.write(headers)
+                file.write(response.body)
+            os.replace(temporary_path, self._path(key))
+        except OSError:
+            try:
+                os.unlink(temporary_path)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._estimated_size += size
+            if self._estimated_size > self.max_bytes:
+                self._estimated_size = self._evict()
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        for _, path, _ in self._scan()[1]:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        self._estimated_size = 0
+
+    def _scan(self) -> Tuple[int, list]:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".response"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, entry.path, stat.st_size))
+        return sum(size for _, _, size in entries), entries
+
+    def _evict(self) -> int:
+        size, entries = self._scan()
+        for _, path, entry_size in sorted(entries):
+            if size <= self.max_bytes * 0.9:  # leaves room for the next responses
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            size -= entry_size
+        return size
+
+
+class ResponseCache:
+    """Caches the encoded responses of GET routes, keyed on path, query string, selected request headers
+    and route response model.
+
+    Only `200` responses with a body are cached, without `Set-Cookie` or `Cache-Control: no-store` / `private` headers.
+    Concurrent requests for a missing key wait for the first one, so that a single request computes the response.
+    """
+
+    def __init__(
+        self,
+        storage: Optional[ResponseStorage] = None,
+        ttl: float = 60.0,
+        vary_headers: Sequence[str] = ("authorization", "cookie"),
+    ) -> None:
+        """Responses that depend on request headers must list them in `vary_headers`.
+
+        Args:
+            storage (Optional[ResponseStorage], optional): Stores the responses, \
+                a `MemoryResponseStorage` when None. Defaults to None.
+            ttl (float, optional): Seconds the responses are served for. Defaults to 60.0.
+            vary_headers (Sequence[str], optional): Request headers added to the key, the default ones \
+                keep responses of different users apart. Defaults to ("authorization", "cookie").
+        """
+        self.storage = storage if storage is not None else MemoryResponseStorage()
+        self.ttl = ttl
+        self.vary_headers = tuple(name.lower() for name in vary_headers)
+        self._pending: Dict[str, "asyncio.Future[Optional[CachedResponse]]"] = {}
+
+    def get_key(self, request: Request, response_model: Any) -> str:
+        """Builds the cache key of a request.
+
+        Args:
+            request (Request): The request.
+            response_model (Any): The route response model.
+
+        Returns:
+            str: The cache key.
+        """
+        parts = [
+            repr(response_model),
+            request.url.path,
+            sorted(request.query_params.multi_items()),
+            [request.headers.get(name) for name in self.vary_headers],
+        ]
+        return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+    def to_cached_response(self, response: Response) -> Optional[CachedResponse]:
+        """Evaluates whether or not a response can be cached.
+
+        Args:
+            response (Response): The route response.
+
+        Returns:
+            Optional[CachedResponse]: The response to store, None if it can not be cached.
+        """
+        body = getattr(response, "body", None)
+        if response.status_code != 200 or not isinstance(body, bytes) or "set-cookie" in response.headers:
+            return None
+        cache_control = response.headers.get("cache-control", "").lower()
+        if "no-store" in cache_control or "private" in cache_control:
+            return None
+        return CachedResponse(body=body, status_code=response.status_code, headers=dict(response.headers))
+
+    async def serve(self, key: str, call_next: Callable[[], Awaitable[Response]]) -> Response:
+        """Serves a stored response, or computes and stores it.
+
+        Args:
+            key (str): The cache key.
+            call_next (Callable[[], Awaitable[Response]]): Computes the response.
+
+        Returns:
+            Response: The response.
+        """
+        cached = self.storage.get(key)
+        if cached is None:
+            pending = self._pending.get(key)
+            if pending is None:
+                return await self._compute(key, call_next)
+            cached = await asyncio.shield(pending)
+            if cached is None:  # the response could not be cached
+                return await call_next()
+        return Response(content=cached.body, status_code=cached.status_code, headers=cached.headers)
+
+    async def _compute(self, key: str, call_next: Callable[[], Awaitable[Response]]) -> Response:
+        pending: "asyncio.Future[Optional[CachedResponse]]" = asyncio.get_running_loop().create_future()
+        self._pending[key] = pending
+        cached = None
+        try:
+            response = await call_next()
+            cached = self.to_cached_response(response)
+            if cached is not None:
+                self.storage.set(key, cached, self.ttl)
+            return response
+        finally:
+            del self._pending[key]
+            pending.set_result(cached)  # errors let the waiting requests compute their own response
+
+    def clear(self) -> None:
+        """Removes every cached response."""
+        self.storage.clear()
@@ -0,0 +1,135 @@
+from __future__ import annotations
+from contextvars import ContextVar
+from dataclasses import dataclass
+from hashlib import blake2b
+from typing import Any, Optional
+from starlette.responses import Response, StreamingResponse
+
+
+@dataclass
+class ConditionalRequest:
+    """The conditional state of a GET or HEAD request served by a route with `etag = True`.
+
+    Args:
+        if_none_match (Optional[str]): The `If-None-Match` request header.
+        etag (Optional[str], optional): The ETag provided with `respond(..., etag=...)`. Defaults to None.
+    """
+
+    if_none_match: Optional[str]
+    etag: Optional[str] = None
+
+
+_current_conditional: ContextVar[Optional[ConditionalRequest]] = ContextVar(
+    "fastapi_responseschema_conditional", default=None
+)
+
+
+def make_etag(version: Any) -> str:
+    """Builds a strong ETag from an application provided version, e.g. a revision number or an update timestamp.
+
+    Args:
+        version (Any): The version, quoted ETags are kept as they are.
+
+    Returns:
+        str: The ETag.
+    """
+    version = str(version)
+    if version.startswith('"') or version.startswith("W/"):
+        return version
+    return f'"{version}"'
+
+
+def hash_etag(hasher: Any) -> str:
+    """Builds a strong ETag from a hash of the response body.
+
+    Args:
+        hasher (Any): A `hashlib` hash updated with the response body.
+
+    Returns:
+        str: The ETag.
+    """
+    return f'"{hasher.hexdigest()}"'
+
+
+def new_hasher() -> Any:
+    """Returns the hash computing the ETags of the response bodies.
+
+    Returns:
+        Any: A `hashlib.blake2b` hash.
+    """
+    return blake2b(digest_size=16)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluates an `If-None-Match` header, with the weak comparison of RFC 9110.
+
+    Args:
+        if_none_match (Optional[str]): The `If-None-Match` request header.
+        etag (str): The ETag of the current representation.
+
+    Returns:
+        bool: wether or not the client representation is up to date.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if (candidate[2:] if candidate.startswith("W/") else candidate) == opaque:
+            return True
+    return False
+
+
+def not_modified(etag: str, response: Optional[Response] = None) -> Response:
+    """Builds a `304 Not Modified` response.
+
+    Args:
+        etag (str): The ETag of the current representation.
+        response (Optional[Response], optional): The full response, its headers are kept but the content ones. \
+            Defaults to None.
+
+    Returns:
+        Response: The response without body.
+    """
+    not_modified_response = Response(status_code=304, background=response.background if response else None)
+    raw_headers = [
+        (name, value)
+        for name, value in (response.raw_headers if response is not None else [])
+        if name not in (b"content-length", b"content-type", b"etag")
+    ]
+    not_modified_response.raw_headers = raw_headers + [(b"etag", etag.encode("latin-1"))]
+    return not_modified_response
+
+
+async def apply_etag(response: Response, conditional: ConditionalRequest) -> Response:
+    """Sets the ETag of a successful response, answering `304 Not Modified` when the client representation matches.
+    Streamed responses only get the ETag provided by `respond`, hashing them would buffer the whole body.
+    An ETag already set on the response, e.g. by the response cache, is kept.
+
+    Args:
+        response (Response): The route response.
+        conditional (ConditionalRequest): The conditional state of the request.
+
+    Returns:
+        Response: The response with its ETag, or a `304 Not Modified` response.
+    """
+    if response.status_code != 200:
+        return response
+    if conditional.etag is not None:
+        etag = conditional.etag
+    elif "etag" in response.headers:  # e.g. replayed by the response cache
+        etag = response.headers["etag"]
+    elif isinstance(response, StreamingResponse):
+        return response
+    elif isinstance(getattr(response, "body", None), (bytes, memoryview)):
+        hasher = new_hasher()
+        hasher.update(response.body)
+        etag = hash_etag(hasher)
+    else:  # e.g. file responses
+        return response
+    if etag_matches(conditional.if_none_match, etag):
+        return not_modified(etag, response)
+    response.headers["etag"] = etag
+    return response
@@ -0,0 +1,103 @@
+from __future__ import annotations
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from ._compat import model_to_dict, model_to_json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore
+
+
+def render_json(content: Any) -> bytes:
+    """Renders JSON compatible content like `fastapi.responses.JSONResponse` does.
+
+    Args:
+        content (Any): JSON compatible content.
+
+    Returns:
+        bytes: The rendered content.
+    """
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+class ResponseEncoder(ABC):
+    """Encodes response schema instances straight to the response body.
+
+    Subclasses must implement `ResponseEncoder.encode`.
+    """
+
+    media_type: str = "application/json"
+
+    @abstractmethod
+    def encode(self, content: Any, **options: Any) -> bytes:  # pragma: no cover
+        """Encodes the content, usually a response schema instance, to bytes.
+
+        Args:
+            content (Any): The content to encode.
+            **options: The `response_model_*` serialization options: `include`, `exclude`, `by_alias`, \
+                `exclude_unset`, `exclude_defaults` and `exclude_none`.
+
+        Returns:
+            bytes: The encoded content.
+        """
+        pass
+
+
+class PydanticResponseEncoder(ResponseEncoder):
+    """Encodes models with pydantic's own JSON serializer, without building an intermediate `dict`.
+
+    Content that is not a pydantic model is encoded like `fastapi.responses.JSONResponse` does.
+    """
+
+    def encode(self, content: Any, **options: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return model_to_json(content, **options)
+        return render_json(jsonable_encoder(content, **options))
+
+
+class OrjsonResponseEncoder(ResponseEncoder):
+    """Encodes responses with [orjson](https://github.com/ijl/orjson).
+
+    Raises:
+        ImportError: when `orjson` is not installed.
+    """
+
+    def __init__(self, option: Optional[int] = None) -> None:
+        """The encoder can be configured with orjson options.
+
+        Args:
+            option (Optional[int], optional): `orjson.OPT_*` flags passed to `orjson.dumps`. Defaults to None.
+        """
+        if orjson is None:  # pragma: no cover
+            raise ImportError("`orjson` must be installed to use OrjsonResponseEncoder.")
+        self.option = option
+
+    def encode(self, content: Any, **options: Any) -> bytes:
+        data = model_to_dict(content, **options) if isinstance(content, BaseModel) else content
+        return orjson.dumps(data, default=jsonable_encoder, option=self.option)
+
+
+class MsgspecResponseEncoder(ResponseEncoder):
+    """Encodes responses with [msgspec](https://jcristharif.com/msgspec/).
+
+    Raises:
+        ImportError: when `msgspec` is not installed.
+    """
+
+    def __init__(self) -> None:
+        if msgspec is None:  # pragma: no cover
+            raise ImportError("`msgspec` must be installed to use MsgspecResponseEncoder.")
+        self._encoder = msgspec.json.Encoder(enc_hook=jsonable_encoder)
+
+    def encode(self, content: Any, **options: Any) -> bytes:  # pragma: no cover
+        data = model_to_dict(content, **options) if isinstance(content, BaseModel) else content
+        return self._encoder.encode(data)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, ClassVar
 from starlette import status
 from fastapi.exceptions import HTTPException as FastAPIHTTPException
 
@@ -8,6 +8,7 @@ class BaseGenericHTTPException(FastAPIHTTPException):
     """BaseClass for HTTPExceptions with additional data"""
 
     status_code: Optional[int] = None  # type: ignore
+    cacheable_response: ClassVar[bool] = False
 
     def __init__(self, detail: Any = None, headers: Optional[Dict[str, Any]] = None, **extra_params: Any) -> None:
         """Instances can be initialized with a set of extra params.
@@ -53,6 +54,7 @@ class InternalServerError(BaseGenericHTTPException):
     """
 
     status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    cacheable_response = True
 
 
 class BadRequest(BaseGenericHTTPException):
@@ -64,6 +66,7 @@ class BadRequest(BaseGenericHTTPException):
     """
 
     status_code = status.HTTP_400_BAD_REQUEST
+    cacheable_response = True
 
 
 class Unauthorized(BaseGenericHTTPException):
@@ -75,6 +78,7 @@ class Unauthorized(BaseGenericHTTPException):
     """
 
     status_code = status.HTTP_401_UNAUTHORIZED
+    cacheable_response = True
 
 
 class Forbidden(BaseGenericHTTPException):
@@ -86,6 +90,7 @@ class Forbidden(BaseGenericHTTPException):
     """
 
     status_code = status.HTTP_403_FORBIDDEN
+    cacheable_response = True
 
 
 class NotFound(BaseGenericHTTPException):
@@ -97,6 +102,7 @@ class NotFound(BaseGenericHTTPException):
     """
 
     status_code = status.HTTP_404_NOT_FOUND
+    cacheable_response = True
 
 
 class MethodNotAllowed(BaseGenericHTTPException):
@@ -108,6 +114,7 @@ class MethodNotAllowed(BaseGenericHTTPException):
     """
 
     status_code = status.HTTP_405_METHOD_NOT_ALLOWED
+    cacheable_response = True
 
 
 class Conflict(BaseGenericHTTPException):
@@ -119,6 +126,7 @@ class Conflict(BaseGenericHTTPException):
     """
 
     status_code = status.HTTP_409_CONFLICT
+    cacheable_response = True
 
 
 class Gone(BaseGenericHTTPException):
@@ -130,6 +138,7 @@ class Gone(BaseGenericHTTPException):
     """
 
     status_code = status.HTTP_410_GONE
+    cacheable_response = True
 
 
 class UnprocessableEntity(BaseGenericHTTPException):
@@ -141,3 +150,4 @@ class UnprocessableEntity(BaseGenericHTTPException):
     """
 
     status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    cacheable_response = True
@@ -1,49 +1,101 @@
 from __future__ import annotations
-from typing import Any, Type
-from fastapi import FastAPI
+from time import perf_counter
+from typing import Any, Optional, Type
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
-from fastapi.exceptions import RequestValidationError
-from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from .routing import SchemaAPIRoute
-from .exceptions import BaseGenericHTTPException
-from .interfaces import AbstractResponseSchema
+from .interfaces import AbstractResponseSchema, ExceptionAdapterRegistry, HTTPExceptionAdapter, exception_adapters
+from .encoders import ResponseEncoder
+from .cache import CachedResponse, ErrorResponseCache
+from .instrumentation import Instrumentation
 from ._compat import model_to_dict
 
 
-def wrap_error_responses(app: FastAPI, error_response_schema: Type[AbstractResponseSchema]) -> FastAPI:
+def wrap_error_responses(
+    app: FastAPI,
+    error_response_schema: Type[AbstractResponseSchema],
+    response_encoder: Optional[ResponseEncoder] = None,
+    error_cache: Optional[ErrorResponseCache] = None,
+    instrumentation: Optional[Instrumentation] = None,
+    adapters: Optional[ExceptionAdapterRegistry] = None,
+) -> FastAPI:
     """Wraps all exception handlers with the provided response schema.
+    An exception handler is added for every exception class registered in the adapters registry.
 
     Args:
         app (FastAPI): A FastAPI application instance.
         error_response_schema (Type[AbstractResponseSchema]): Response schema wrapper model.
+        response_encoder (Optional[ResponseEncoder], optional): Encodes the error responses straight to bytes. \
+            Defaults to None.
+        error_cache (Optional[ErrorResponseCache], optional): Caches the encoded responses of cacheable exceptions. \
+            Defaults to None.
+        instrumentation (Optional[Instrumentation], optional): Receives the error handling timings and sizes. \
+            Defaults to None.
+        adapters (Optional[ExceptionAdapterRegistry], optional): Adapts the handled exceptions, \
+            `exception_adapters` when None. Defaults to None.
 
     Returns:
         FastAPI: The application instance
     """
+    # due to: https://github.com/python/mypy/issues/12392 FIXME: when gets fixed
+    model = error_response_schema[Any]  # type: ignore
+    adapters = adapters or exception_adapters
+
+    def build_response(request: Request, exc: Exception, adapted: HTTPExceptionAdapter) -> Response:
+        content = model.from_adapted_exception(request=request, adapted=adapted)
+        headers = adapted.headers if adapted.headers is not None else getattr(exc, "headers", None)
+        if response_encoder is not None:
+            return Response(
+                content=response_encoder.encode(content),
+                status_code=adapted.status_code,
+                headers=headers,
+                media_type=response_encoder.media_type,
+            )
+        return JSONResponse(content=model_to_dict(content), status_code=adapted.status_code, headers=headers)
 
     async def exception_handler(request, exc):
-        status_code = getattr(exc, "status_code") if not isinstance(exc, RequestValidationError) else 422
-        # due to: https://github.com/python/mypy/issues/12392 FIXME: when gets fixed
-        model = error_response_schema[Any]  # type: ignore
-        return JSONResponse(
-            content=model_to_dict(model.from_exception_handler(request=request, exception=exc)),
-            status_code=status_code,
-            headers=getattr(exc, "headers", dict()),
-        )
-
-    app.add_exception_handler(RequestValidationError, exception_handler)
-    app.add_exception_handler(StarletteHTTPException, exception_handler)
-    app.add_exception_handler(BaseGenericHTTPException, exception_handler)
+        adapted = adapters.adapt(exc)  # type: ignore
+        key = error_cache.get_key(exc, adapted.status_code) if error_cache is not None else None
+        if key is None:
+            return build_response(request, exc, adapted)
+        cached = error_cache.get(key)  # type: ignore
+        if cached is None:
+            response = build_response(request, exc, adapted)
+            cached = CachedResponse(body=response.body, status_code=adapted.status_code, headers=dict(response.headers))
+            error_cache.set(key, cached)  # type: ignore
+            return response
+        return Response(content=cached.body, status_code=cached.status_code, headers=cached.headers)
+
+    async def instrumented_exception_handler(request, exc):
+        start = perf_counter()
+        response = await exception_handler(request, exc)
+        route = getattr(request.scope.get("route"), "path", "unmatched")  # raw paths would explode cardinality
+        instrumentation.record_timing(route, "error", perf_counter() - start)  # type: ignore
+        instrumentation.record_size(route, "error", len(response.body))  # type: ignore
+        return response
+
+    handler = instrumented_exception_handler if instrumentation is not None else exception_handler
+    for exception_class in adapters.exception_classes():
+        app.add_exception_handler(exception_class, handler)
     return app
 
 
-def wrap_app_responses(app: FastAPI, route_class: Type[SchemaAPIRoute]) -> FastAPI:
+def wrap_app_responses(
+    app: FastAPI,
+    route_class: Type[SchemaAPIRoute],
+    error_cache: Optional[ErrorResponseCache] = None,
+    adapters: Optional[ExceptionAdapterRegistry] = None,
+) -> FastAPI:
     """Wraps all app defaults responses
 
     Args:
         app (FastAPI): A FastAPI application instance.
         route_class (Type[SchemaAPIRoute]): The SchemaAPIRoute with your response schemas.
+        error_cache (Optional[ErrorResponseCache], optional): Caches the encoded responses of cacheable exceptions. \
+            Defaults to None.
+        adapters (Optional[ExceptionAdapterRegistry], optional): Adapts the handled exceptions, \
+            `exception_adapters` when None. Defaults to None.
 
     Returns:
         FastAPI: The application instance.
@@ -52,5 +104,12 @@ def wrap_app_responses(app: FastAPI, route_class: Type[SchemaAPIRoute]) -> FastA
     err_schema = getattr(route_class, "error_response_schema")
     if err_schema is None:
         err_schema = route_class.response_schema
-    app = wrap_error_responses(app, error_response_schema=err_schema)
+    app = wrap_error_responses(
+        app,
+        error_response_schema=err_schema,
+        response_encoder=route_class.response_encoder,
+        error_cache=error_cache,
+        instrumentation=route_class.instrumentation,
+        adapters=adapters,
+    )
     return app
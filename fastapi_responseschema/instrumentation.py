@@ -0,0 +1,200 @@
+from __future__ import annotations
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+
+DURATION_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+SIZE_BUCKETS: Tuple[float, ...] = tuple(float(4**exponent) for exponent in range(4, 13))  # 256 B to 16 MB
+
+
+class Instrumentation:
+    """Receives the per-request measurements of `SchemaAPIRoute` and `wrap_error_responses`.
+
+    Subclasses override the `record_*` methods to forward measurements to their own sink.
+    Routes without instrumentation take no measurement at all.
+
+    Timing phases:
+
+    - `endpoint`: the endpoint execution.
+    - `wrap`: building the response schema with `from_api_route`, including the response encoder.
+    - `encode`: the response encoder alone, encoding trusted response schemas too.
+    - `validate`: FastAPI validating the endpoint output against the wrapped response model.
+    - `serialize`: FastAPI serializing the validated response schema (pydantic v2 only).
+    - `render`: the JSON encoding of the response class.
+    - `handler`: the whole FastAPI request handler: dependencies, endpoint, validation and JSON encoding.
+    - `error`: the `wrap_error_responses` exception handler.
+
+    Size phases:
+
+    - `response`: the body of non streaming responses.
+    - `error`: the body of error responses.
+    """
+
+    def record_timing(self, route: str, phase: str, seconds: float) -> None:  # pragma: no cover
+        """Records the duration of a phase.
+
+        Args:
+            route (str): The route path, `unmatched` for errors raised outside routes.
+            phase (str): The measured phase.
+            seconds (float): The phase duration in seconds.
+        """
+        pass
+
+    def record_size(self, route: str, phase: str, size: int) -> None:  # pragma: no cover
+        """Records the size of a payload.
+
+        Args:
+            route (str): The route path, `unmatched` for errors raised outside routes.
+            phase (str): The measured phase.
+            size (int): The payload size in bytes.
+        """
+        pass
+
+
+@dataclass
+class Histogram:
+    """Cumulative histogram of observed values.
+
+    Args:
+        buckets (Sequence[float]): Upper bounds of the buckets.
+        counts (List[int]): Observations per bucket, the last one counting values above every bound.
+        sum (float): Sum of the observed values.
+        count (int): Number of observations.
+    """
+
+    buckets: Sequence[float]
+    counts: List[int] = field(default_factory=list)
+    sum: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        """Adds an observation.
+
+        Args:
+            value (float): The observed value.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile as the upper bound of the bucket containing it.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float: The estimated quantile, `inf` when it falls above every bucket.
+        """
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= rank and cumulative > 0:
+                return bound
+        return float("inf")
+
+
+class HistogramCollector(Instrumentation):
+    """Thread-safe in-memory collector aggregating measurements in histograms per route and phase."""
+
+    def __init__(
+        self, duration_buckets: Sequence[float] = DURATION_BUCKETS, size_buckets: Sequence[float] = SIZE_BUCKETS
+    ) -> None:
+        """Histograms buckets can be customized.
+
+        Args:
+            duration_buckets (Sequence[float], optional): Upper bounds, in seconds, of the timing buckets. \
+                Defaults to DURATION_BUCKETS.
+            size_buckets (Sequence[float], optional): Upper bounds, in bytes, of the size buckets. \
+                Defaults to SIZE_BUCKETS.
+        """
+        self.duration_buckets = tuple(sorted(duration_buckets))
+        self.size_buckets = tuple(sorted(size_buckets))
+        self.timings: Dict[Tuple[str, str], Histogram] = {}
+        self.sizes: Dict[Tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def record_timing(self, route: str, phase: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self.timings.get((route, phase))
+            if histogram is None:
+                histogram = self.timings[(route, phase)] = Histogram(buckets=self.duration_buckets)
+            histogram.observe(seconds)
+
+    def record_size(self, route: str, phase: str, size: int) -> None:
+        with self._lock:
+            histogram = self.sizes.get((route, phase))
+            if histogram is None:
+                histogram = self.sizes[(route, phase)] = Histogram(buckets=self.size_buckets)
+            histogram.observe(size)
+
+    def clear(self) -> None:
+        """Drops every collected measurement."""
+        with self._lock:
+            self.timings.clear()
+            self.sizes.clear()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+def _render_histograms(name: str, help_text: str, histograms: Dict[Tuple[str, str], Histogram]) -> List[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for (route, phase), histogram in sorted(histograms.items()):
+        labels = f'route="{_escape_label(route)}",phase="{_escape_label(phase)}"'
+        cumulative = 0
+        for bound, count in zip(list(histogram.buckets) + [float("inf")], histogram.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{_format_value(bound)}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {_format_value(histogram.sum)}")
+        lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
+def to_prometheus_text(collector: HistogramCollector, namespace: str = "fastapi_responseschema") -> str:
+    """Renders the collected histograms in the Prometheus text exposition format.
+
+    Args:
+        collector (HistogramCollector): The collector to export.
+        namespace (str, optional): Metrics name prefix. Defaults to "fastapi_responseschema".
+
+    Returns:
+        str: The metrics in Prometheus text format.
+    """
+    with collector._lock:
+        lines = _render_histograms(
+            f"{namespace}_phase_duration_seconds", "Duration of the response schema phases.", collector.timings
+        )
+        lines += _render_histograms(
+            f"{namespace}_payload_size_bytes", "Size of the encoded response payloads.", collector.sizes
+        )
+    return "\n".join(lines) + "\n"
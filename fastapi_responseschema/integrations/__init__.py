@@ -0,0 +1,18 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from . import pagination as pagination
+
+# Integrations require optional dependencies: they are only imported on first access.
+_integrations = ("pagination",)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _integrations:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(f".{name}", __name__)
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_integrations})
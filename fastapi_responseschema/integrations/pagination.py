@@ -1,12 +1,43 @@
+import binascii
+import json
+import threading
+import time
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from contextvars import ContextVar
+from itertools import chain
 from math import ceil
-from typing import Generic, TypeVar, Type, Any, Optional, ClassVar, Protocol
-from fastapi import Query
-from fastapi_pagination.bases import AbstractPage, AbstractParams, RawParams
-from fastapi_pagination.links.bases import Links, create_links
+from typing import (
+    Generic,
+    TypeVar,
+    Type,
+    Any,
+    Optional,
+    ClassVar,
+    Protocol,
+    NamedTuple,
+    Callable,
+    Sequence,
+    Awaitable,
+    Tuple,
+    List,
+    Dict,
+    Hashable,
+    Iterable,
+    Mapping,
+    Union,
+    Coroutine,
+)
+from fastapi import Query, Request, Response
+from fastapi_pagination.api import create_page, request, resolve_params
+from fastapi_pagination.bases import AbstractPage, AbstractParams, RawParams, CursorRawParams
+from fastapi_pagination.links.bases import Links
 from pydantic import BaseModel
 from pydantic.types import conint
+from fastapi_responseschema.cache import LRUCache
+from fastapi_responseschema.exceptions import BadRequest
 from fastapi_responseschema.routing import SchemaAPIRoute
 from fastapi_responseschema.interfaces import AbstractResponseSchema
+from fastapi_responseschema._compat import build_model, lenient_issubclass
 
 
 T = TypeVar("T")
@@ -21,28 +52,126 @@ class SupportedParams(Protocol):  # pragma: no cover
         pass
 
 
+class LinkTemplate(NamedTuple):
+    """Pagination links of a request URL, split around a query parameter, e.g. `page`.
+
+    Args:
+        prefix (str): The link up to the parameter value.
+        suffix (str): The link from the parameter value.
+        base (str): The link without the parameter.
+    """
+
+    prefix: str
+    suffix: str
+    base: str
+
+    def link(self, value: Any) -> str:
+        """Builds the link to a page.
+
+        Args:
+            value (Any): The parameter value, e.g. the page number.
+
+        Returns:
+            str: The link path and query string.
+        """
+        return f"{self.prefix}{value}{self.suffix}"
+
+
+PAGE_MARKER = "fastapi-responseschema-page"
+link_templates: LRUCache[LinkTemplate] = LRUCache(maxsize=1024)
+
+
+def get_link_template(req: Request, param: str = "page") -> LinkTemplate:
+    """Returns the link template of a request, built once per path and query parameters other than `param`.
+
+    Args:
+        req (Request): The paginated request.
+        param (str, optional): The query parameter selecting the page. Defaults to "page".
+
+    Returns:
+        LinkTemplate: The link template.
+    """
+    key = (param, req.url.path, tuple(item for item in req.query_params.multi_items() if item[0] != param))
+    template = link_templates.get(key)
+    if template is None:
+        url = req.url.include_query_params(**{param: PAGE_MARKER})  # as `fastapi_pagination.links.create_links` does
+        prefix, suffix = f"{url.path}?{url.query}".split(PAGE_MARKER, 1)
+        base = req.url.remove_query_params(param)
+        template = LinkTemplate(
+            prefix=prefix, suffix=suffix, base=f"{base.path}?{base.query}" if base.query else base.path
+        )
+        link_templates.set(key, template)
+    return template
+
+
+def _only_path(req: Request) -> str:
+    return f"{req.url.path}?{req.url.query}" if req.url.query else req.url.path
+
+
+def create_page_links(
+    total: Optional[int], params: SupportedParams, has_next: Optional[bool] = None, total_is_estimate: bool = False
+) -> Links:
+    """Builds the same links as `fastapi_pagination.links.create_links`, from the request link template.
+    The `last` link is only built from exact totals. The links are not validated with pydantic v1.
+
+    Args:
+        total (Optional[int]): Total number of items, None when it is not counted.
+        params (SupportedParams): A FastaAPI Pagination Params instance.
+        has_next (Optional[bool], optional): wether or not there is a next page, \
+            evaluated from the total when None. Defaults to None.
+        total_is_estimate (bool, optional): wether or not the total is an estimate. Defaults to False.
+
+    Returns:
+        Links: The pagination links.
+    """
+    req = request()
+    template = get_link_template(req)
+    if has_next is None:
+        has_next = total is not None and params.page * params.page_size < total
+    exact_total = None if total_is_estimate else total
+    return build_model(
+        Links,
+        self=_only_path(req),
+        first=template.link(1),
+        last=template.link(ceil(exact_total / params.page_size) or 1) if exact_total is not None else None,
+        next=template.link(params.page + 1) if has_next else None,
+        prev=template.link(params.page - 1) if 1 <= params.page - 1 else None,
+    )
+
+
 class PaginationMetadata(BaseModel):
     """Pagination metadata model for pagination info.
 
     Args:
-        total (int): Total number of items.
+        total (Optional[int]): Total number of items, None when it is not counted.
         page_size (int): Number of items per page.
         page (int): Page number.
         links (dict): Object containing pagination links.
+        total_is_estimate (bool): wether or not the total is an estimate. Defaults to False.
     """
 
-    total: conint(ge=0)  # type: ignore
+    total: Optional[conint(ge=0)] = None  # type: ignore
     page_size: conint(ge=0)  # type: ignore
     page: conint(ge=1)  # type: ignore
     links: Links
+    total_is_estimate: bool = False
 
     @classmethod
-    def from_abstract_page_create(cls, total: int, params: SupportedParams) -> "PaginationMetadata":
+    def from_abstract_page_create(
+        cls,
+        total: Optional[int],
+        params: SupportedParams,
+        has_next: Optional[bool] = None,
+        total_is_estimate: bool = False,
+    ) -> "PaginationMetadata":
         """Create pagination metadata from an abstract page.
 
         Args:
-            total (int): Total number of items.
+            total (Optional[int]): Total number of items, None when it is not counted.
             params (SupportedParams): A FastaAPI Pagination Params instance.
+            has_next (Optional[bool], optional): wether or not there is a next page, \
+                evaluated from the total when None. Defaults to None.
+            total_is_estimate (bool, optional): wether or not the total is an estimate. Defaults to False.
 
         Returns:
             PaginationMetadata: PaginationMetadata instance
@@ -51,12 +180,45 @@ class PaginationMetadata(BaseModel):
             total=total,
             page_size=params.page_size,
             page=params.page,
-            links=create_links(
-                first={"page": 1},
-                last={"page": ceil(total / params.page_size) if total > 0 else 1},
-                next={"page": params.page + 1} if params.page * params.page_size < total else None,
-                prev={"page": params.page - 1} if 1 <= params.page - 1 else None,
-            ),
+            links=create_page_links(total, params, has_next, total_is_estimate),
+            total_is_estimate=total_is_estimate,
+        )
+
+    @classmethod
+    def from_params(
+        cls,
+        total: Optional[int],
+        params: SupportedParams,
+        has_next: Optional[bool] = None,
+        total_is_estimate: bool = False,
+    ) -> "PaginationMetadata":
+        """Create pagination metadata from the values of `PaginationParams`, without parsing the request URL again:
+        the links are formatted from the cached link template and `total` is checked to not be negative.
+        The models are constructed without validation with pydantic v1 only, pydantic v2 validates them
+        as it is faster than `model_construct` for these small models.
+
+        Args:
+            total (Optional[int]): Total number of items, None when it is not counted.
+            params (SupportedParams): A FastaAPI Pagination Params instance.
+            has_next (Optional[bool], optional): wether or not there is a next page, \
+                evaluated from the total when None. Defaults to None.
+            total_is_estimate (bool, optional): wether or not the total is an estimate. Defaults to False.
+
+        Raises:
+            ValueError: when `total` is negative.
+
+        Returns:
+            PaginationMetadata: PaginationMetadata instance
+        """
+        if total is not None and total < 0:
+            raise ValueError("`total` must be greater than or equal to 0.")
+        return build_model(
+            cls,
+            total=total,
+            page_size=params.page_size,
+            page=params.page,
+            links=create_page_links(total, params, has_next, total_is_estimate),
+            total_is_estimate=total_is_estimate,
         )
 
 
@@ -79,7 +241,10 @@ class PaginationParams(BaseModel, AbstractParams):  # pragma: no cover
 
 
 class AbstractPagedResponseSchema(AbstractPage[T], AbstractResponseSchema[T], Generic[T]):
-    """Abstract generic model for building response schema interfaces with pagination logic."""
+    """Abstract generic model for building response schema interfaces with pagination logic.
+    `create` receives a None `total` when it is not counted, `paginate_offset` also passes the `has_next`
+    and `total_is_estimate` keyword arguments, see `PaginationMetadata.from_abstract_page_create`.
+    """
 
     __params_type__: ClassVar[Type[AbstractParams]] = PaginationParams
 
@@ -87,9 +252,473 @@ class AbstractPagedResponseSchema(AbstractPage[T], AbstractResponseSchema[T], Ge
         arbitrary_types_allowed = True
 
 
+class CachedCount:
+    """Caches the result of an async count for `ttl` seconds, e.g. `SELECT COUNT(*)` on a large table.
+    Requests served while the count is fresh reuse it, an expired count is computed by the next request.
+    """
+
+    def __init__(self, count: Callable[[], Awaitable[int]], ttl: float = 60.0) -> None:
+        """Counts are cached per instance, create one per counted query.
+
+        Args:
+            count (Callable[[], Awaitable[int]]): Computes the total.
+            ttl (float, optional): Seconds the total is reused for. Defaults to 60.0.
+        """
+        self.count = count
+        self.ttl = ttl
+        self._total: Optional[int] = None
+        self._expires_at = 0.0
+
+    async def __call__(self) -> int:
+        if self._total is None or time.monotonic() >= self._expires_at:
+            self._total = await self.count()
+            self._expires_at = time.monotonic() + self.ttl
+        return self._total
+
+    def invalidate(self) -> None:
+        """Drops the cached total, the next request counts again."""
+        self._total = None
+
+
+class CountCache:
+    """Caches the totals of paged routes, keyed by route path and normalized filters: path parameters and query
+    parameters other than the pagination ones. Users paging through the same result set share a single count.
+
+    Set it as `PagedSchemaAPIRoute.count_cache`, the routes then cache the totals counted by `paginate_offset`.
+    Totals expire after `ttl` seconds and the least recently used ones are evicted when the cache is full.
+    Writes that change the totals of a route should call `invalidate`.
+    """
+
+    def __init__(
+        self, maxsize: int = 1024, ttl: float = 60.0, ignored_params: Iterable[str] = ("page", "page_size", "cursor")
+    ) -> None:
+        """A single cache can be shared by every route class.
+
+        Args:
+            maxsize (int, optional): Maximum number of cached totals. Defaults to 1024.
+            ttl (float, optional): Seconds a total is reused for. Defaults to 60.0.
+            ignored_params (Iterable[str], optional): Query parameters that do not filter the counted items. \
+                Defaults to ("page", "page_size", "cursor").
+        """
+        self.ttl = ttl
+        self.ignored_params = frozenset(ignored_params)
+        self._entries: LRUCache[Tuple[int, float]] = LRUCache(maxsize=maxsize)
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get_key(self, route: str, params: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]] = ()) -> Hashable:
+        """Builds the cache key of a result set.
+
+        Args:
+            route (str): The route path, e.g. `/owners/{owner_id}/birds`.
+            params (Union[Mapping[str, Any], Iterable[Tuple[str, Any]]], optional): The path and query parameters, \
+                in any order. Defaults to ().
+
+        Returns:
+            Hashable: The cache key.
+        """
+        items = params.items() if isinstance(params, Mapping) else params
+        filters = tuple(sorted((name, str(value)) for name, value in items if name not in self.ignored_params))
+        return (route, self._generations.get(route, 0), filters)
+
+    def get(self, key: Hashable) -> Optional[int]:
+        """Returns a cached total.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Optional[int]: The total, None when it is not cached or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry[1]:
+            return None
+        return entry[0]
+
+    def set(self, key: Hashable, total: int) -> None:
+        """Caches a total for `ttl` seconds.
+
+        Args:
+            key (Hashable): The cache key.
+            total (int): The total.
+        """
+        self._entries.set(key, (total, time.monotonic() + self.ttl))
+
+    def count(self, key: Hashable, count: Callable[[], int]) -> int:
+        """Returns the cached total, counting it on misses.
+
+        Args:
+            key (Hashable): The cache key.
+            count (Callable[[], int]): Computes the total.
+
+        Returns:
+            int: The total.
+        """
+        total = self.get(key)
+        if total is None:
+            total = count()
+            self.set(key, total)
+        return total
+
+    async def acount(self, key: Hashable, count: Callable[[], Awaitable[int]]) -> int:
+        """Returns the cached total, counting it asynchronously on misses.
+
+        Args:
+            key (Hashable): The cache key.
+            count (Callable[[], Awaitable[int]]): Computes the total.
+
+        Returns:
+            int: The total.
+        """
+        total = self.get(key)
+        if total is None:
+            total = await count()
+            self.set(key, total)
+        return total
+
+    def invalidate(
+        self, route: Optional[str] = None, params: Optional[Union[Mapping[str, Any], Iterable[Tuple[str, Any]]]] = None
+    ) -> None:
+        """Drops cached totals: every total when `route` is None, the totals of a route or of a single result set.
+
+        Args:
+            route (Optional[str], optional): The route path. Defaults to None.
+            params (Optional[Union[Mapping[str, Any], Iterable[Tuple[str, Any]]]], optional): The parameters \
+                of a single result set of the route. Defaults to None.
+        """
+        if route is None:
+            self._entries.clear()
+        elif params is not None:
+            self._entries.delete(self.get_key(route, params))
+        else:
+            with self._lock:  # the stale totals are no longer reachable and get evicted as least recently used
+                self._generations[route] = self._generations.get(route, 0) + 1
+
+
+class CountScope(NamedTuple):
+    """The count cache entry of the current request.
+
+    Args:
+        cache (CountCache): The route count cache.
+        key (Hashable): The cache key of the requested result set.
+    """
+
+    cache: CountCache
+    key: Hashable
+
+
+_current_count_scope: ContextVar[Optional[CountScope]] = ContextVar("fastapi_responseschema_count", default=None)
+
+
+def _create_offset_page(
+    items: Sequence[Any], total: Optional[int], total_is_estimate: bool, params: PaginationParams
+) -> Any:
+    has_next = len(items) > params.page_size
+    return create_page(
+        list(items[: params.page_size]),
+        params=params,
+        total=total,
+        has_next=has_next,
+        total_is_estimate=total_is_estimate and total is not None,
+    )
+
+
+def paginate_offset(
+    fetch: Callable[[int, int], Sequence[T]],
+    count: Optional[Callable[[], int]] = None,
+    total_is_estimate: bool = False,
+    params: Optional[PaginationParams] = None,
+) -> Any:
+    """Paginates with `page` and `page_size`, counting the total only when a `count` is provided.
+    The next page is detected by loading one extra item, so the `next` link does not need the total.
+    Totals are cached in the route `count_cache` when it is set.
+
+    Usage:
+
+        @app.get("/birds", response_model=PagedResponseSchema[Bird])
+        def list_birds():
+            query = select(Bird)
+            return paginate_offset(lambda limit, offset: session.scalars(query.limit(limit).offset(offset)).all())
+
+    Args:
+        fetch (Callable[[int, int], Sequence[T]]): Loads at most `limit` items from `offset`, \
+            `limit` is the page size plus one.
+        count (Optional[Callable[[], int]], optional): Computes the total, not counted when None. Defaults to None.
+        total_is_estimate (bool, optional): wether or not `count` returns an estimate, \
+            e.g. from the database statistics. Defaults to False.
+        params (Optional[PaginationParams], optional): The pagination parameters, \
+            the ones of the current request when None. Defaults to None.
+
+    Returns:
+        Any: The page, an instance of the route `AbstractPagedResponseSchema`.
+    """
+    params = resolve_params(params)
+    offset = params.page_size * (params.page - 1)
+    items = fetch(params.page_size + 1, offset)
+    scope = _current_count_scope.get()
+    if count is not None and scope is not None:
+        return _create_offset_page(items, scope.cache.count(scope.key, count), total_is_estimate, params)
+    return _create_offset_page(items, count() if count else None, total_is_estimate, params)
+
+
+async def apaginate_offset(
+    fetch: Callable[[int, int], Awaitable[Sequence[T]]],
+    count: Optional[Callable[[], Awaitable[int]]] = None,
+    total_is_estimate: bool = False,
+    params: Optional[PaginationParams] = None,
+) -> Any:
+    """Paginates with `page` and `page_size`, loading the items and the total asynchronously, see `paginate_offset`.
+    Pass a `CachedCount` as `count` to reuse the total across requests.
+
+    Args:
+        fetch (Callable[[int, int], Awaitable[Sequence[T]]]): Loads at most `limit` items from `offset`.
+        count (Optional[Callable[[], Awaitable[int]]], optional): Computes the total, not counted when None. \
+            Defaults to None.
+        total_is_estimate (bool, optional): wether or not `count` returns an estimate. Defaults to False.
+        params (Optional[PaginationParams], optional): The pagination parameters, \
+            the ones of the current request when None. Defaults to None.
+
+    Returns:
+        Any: The page, an instance of the route `AbstractPagedResponseSchema`.
+    """
+    params = resolve_params(params)
+    offset = params.page_size * (params.page - 1)
+    items = await fetch(params.page_size + 1, offset)
+    scope = _current_count_scope.get()
+    if count is not None and scope is not None:
+        return _create_offset_page(items, await scope.cache.acount(scope.key, count), total_is_estimate, params)
+    return _create_offset_page(items, await count() if count else None, total_is_estimate, params)
+
+
+class Cursor(NamedTuple):
+    """The position of a keyset page, encoded in the opaque cursors of the responses.
+
+    Args:
+        key (Any): The sort key of the item next to the page, any JSON serializable value. \
+            Tuples, e.g. composite keys, are decoded as lists.
+        backwards (bool, optional): wether or not the page ends before `key` instead of starting after it. \
+            Defaults to False.
+    """
+
+    key: Any
+    backwards: bool = False
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Encodes a cursor in an opaque URL safe string.
+
+    Args:
+        cursor (Cursor): The cursor.
+
+    Returns:
+        str: The encoded cursor.
+    """
+    payload = json.dumps([cursor.key, cursor.backwards], separators=(",", ":")).encode()
+    return urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(value: str) -> Cursor:
+    """Decodes a cursor encoded by `encode_cursor`.
+
+    Args:
+        value (str): The encoded cursor.
+
+    Raises:
+        BadRequest: when the value is not a valid cursor.
+
+    Returns:
+        Cursor: The cursor.
+    """
+    try:
+        payload = json.loads(urlsafe_b64decode(value + "=" * (-len(value) % 4)))
+    except (binascii.Error, ValueError):
+        payload = None
+    if not isinstance(payload, list) or len(payload) != 2 or not isinstance(payload[1], bool):
+        raise BadRequest(detail="Invalid cursor.")
+    return Cursor(key=payload[0], backwards=payload[1])
+
+
+class CursorPaginationParams(BaseModel, AbstractParams):  # pragma: no cover
+    """Keyset pagination Querystring parameters
+
+    Args:
+        cursor (Optional[str]): The opaque cursor of the page, the first page when None.
+        page_size (int): Number of items per page.
+    """
+
+    cursor: Optional[str] = Query(None, description="Page cursor")
+    page_size: int = Query(50, ge=1, le=100, description="Page size")
+
+    def to_raw_params(self) -> CursorRawParams:
+        return CursorRawParams(cursor=self.cursor, size=self.page_size)
+
+    def get_cursor(self) -> Optional[Cursor]:
+        """Decodes the page cursor.
+
+        Returns:
+            Optional[Cursor]: The cursor, None for the first page.
+        """
+        return decode_cursor(self.cursor) if self.cursor else None
+
+
+def create_cursor_links(next_cursor: Optional[str] = None, prev_cursor: Optional[str] = None) -> Links:
+    """Builds the links of a keyset page, there is no `last` link.
+
+    Args:
+        next_cursor (Optional[str], optional): The encoded cursor of the next page. Defaults to None.
+        prev_cursor (Optional[str], optional): The encoded cursor of the previous page. Defaults to None.
+
+    Returns:
+        Links: The pagination links.
+    """
+    req = request()
+    template = get_link_template(req, param="cursor")
+    return build_model(
+        Links,
+        self=_only_path(req),
+        first=template.base,
+        last=None,
+        next=template.link(next_cursor) if next_cursor else None,
+        prev=template.link(prev_cursor) if prev_cursor else None,
+    )
+
+
+class CursorPaginationMetadata(BaseModel):
+    """Keyset pagination metadata model, without total.
+
+    Args:
+        page_size (int): Number of items per page.
+        next_cursor (Optional[str]): Opaque cursor of the next page, None on the last page.
+        prev_cursor (Optional[str]): Opaque cursor of the previous page, None on the first page.
+        links (dict): Object containing pagination links.
+    """
+
+    page_size: conint(ge=1)  # type: ignore
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    links: Links
+
+    @classmethod
+    def from_cursors(
+        cls, params: CursorPaginationParams, next_: Optional[Cursor] = None, previous: Optional[Cursor] = None
+    ) -> "CursorPaginationMetadata":
+        """Create keyset pagination metadata, encoding the cursors.
+
+        Args:
+            params (CursorPaginationParams): The pagination parameters.
+            next_ (Optional[Cursor], optional): The cursor of the next page. Defaults to None.
+            previous (Optional[Cursor], optional): The cursor of the previous page. Defaults to None.
+
+        Returns:
+            CursorPaginationMetadata: CursorPaginationMetadata instance
+        """
+        next_cursor = encode_cursor(next_) if next_ is not None else None
+        prev_cursor = encode_cursor(previous) if previous is not None else None
+        return build_model(
+            cls,
+            page_size=params.page_size,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+            links=create_cursor_links(next_cursor, prev_cursor),
+        )
+
+
+class AbstractCursorPagedResponseSchema(AbstractPage[T], AbstractResponseSchema[T], Generic[T]):  # type: ignore[misc]
+    """Abstract generic model for building response schema interfaces with keyset pagination logic.
+    `create` receives the `next_` and `previous` cursors as keyword arguments, see `paginate_keyset`.
+    """
+
+    __params_type__: ClassVar[Type[AbstractParams]] = CursorPaginationParams
+
+    class Config:
+        arbitrary_types_allowed = True
+
+
+def _create_keyset_page(
+    items: Sequence[Any], key: Callable[[Any], Any], cursor: Optional[Cursor], params: CursorPaginationParams
+) -> Any:
+    has_more = len(items) > params.page_size
+    page: List[Any] = list(items[: params.page_size])
+    previous, next_ = None, None
+    if cursor is not None and cursor.backwards:
+        page.reverse()
+        if page:
+            next_ = Cursor(key(page[-1]))
+            previous = Cursor(key(page[0]), backwards=True) if has_more else None
+    elif page:
+        next_ = Cursor(key(page[-1])) if has_more else None
+        previous = Cursor(key(page[0]), backwards=True) if cursor is not None else None
+    return create_page(page, params=params, next_=next_, previous=previous)
+
+
+def _resolve_keyset_params(params: Optional[CursorPaginationParams]) -> Tuple[CursorPaginationParams, Optional[Cursor]]:
+    params = resolve_params(params)
+    return params, params.get_cursor()
+
+
+def paginate_keyset(
+    fetch: Callable[[Optional[Cursor], int], Sequence[T]],
+    key: Callable[[T], Any],
+    params: Optional[CursorPaginationParams] = None,
+) -> Any:
+    """Paginates with keyset pagination: pages are loaded from the sort key of their first or last item,
+    so serving deep pages costs as much as serving the first one and no total is counted.
+
+    Usage:
+
+        def fetch(cursor: Optional[Cursor], limit: int) -> List[Bird]:
+            query = select(Bird).limit(limit)
+            if cursor is None:
+                return session.scalars(query.order_by(Bird.id)).all()
+            if cursor.backwards:
+                return session.scalars(query.where(Bird.id < cursor.key).order_by(Bird.id.desc())).all()
+            return session.scalars(query.where(Bird.id > cursor.key).order_by(Bird.id)).all()
+
+        @app.get("/birds", response_model=CursorPagedResponseSchema[Bird])
+        def list_birds():
+            return paginate_keyset(fetch, key=lambda bird: bird.id)
+
+    Args:
+        fetch (Callable[[Optional[Cursor], int], Sequence[T]]): Loads at most `limit` items sorted by key, \
+            from the first one when the cursor is None, after `cursor.key` or, when `cursor.backwards`, \
+            before `cursor.key` in descending order. `limit` is the page size plus one, \
+            the extra item tells if there is a next page.
+        key (Callable[[T], Any]): Returns the sort key of an item, a JSON serializable value.
+        params (Optional[CursorPaginationParams], optional): The pagination parameters, \
+            the ones of the current request when None. Defaults to None.
+
+    Returns:
+        Any: The page, an instance of the route `AbstractCursorPagedResponseSchema`.
+    """
+    params, cursor = _resolve_keyset_params(params)
+    return _create_keyset_page(fetch(cursor, params.page_size + 1), key, cursor, params)
+
+
+async def apaginate_keyset(
+    fetch: Callable[[Optional[Cursor], int], Awaitable[Sequence[T]]],
+    key: Callable[[T], Any],
+    params: Optional[CursorPaginationParams] = None,
+) -> Any:
+    """Paginates with keyset pagination, loading the items with an async `fetch`, see `paginate_keyset`.
+
+    Args:
+        fetch (Callable[[Optional[Cursor], int], Awaitable[Sequence[T]]]): Loads at most `limit` items sorted by key.
+        key (Callable[[T], Any]): Returns the sort key of an item, a JSON serializable value.
+        params (Optional[CursorPaginationParams], optional): The pagination parameters, \
+            the ones of the current request when None. Defaults to None.
+
+    Returns:
+        Any: The page, an instance of the route `AbstractCursorPagedResponseSchema`.
+    """
+    params, cursor = _resolve_keyset_params(params)
+    return _create_keyset_page(await fetch(cursor, params.page_size + 1), key, cursor, params)
+
+
 class PagedSchemaAPIRoute(SchemaAPIRoute):
     """A SchemaAPIRoute class with pagination support.
     Must be subclassed setting at least SchemaAPIRoute.response_model.
+    Keyset pages are wrapped by `cursor_paged_response_schema`, and the totals counted by `paginate_offset`
+    are shared across requests when `count_cache` is set.
 
     Usage:
 
@@ -110,19 +739,56 @@ class PagedSchemaAPIRoute(SchemaAPIRoute):
     """
 
     paged_response_schema: Type[AbstractPagedResponseSchema[Any]]
+    cursor_paged_response_schema: Optional[Type[AbstractCursorPagedResponseSchema[Any]]] = None
+    count_cache: Optional[CountCache] = None
     response_schema: Optional[Type[AbstractResponseSchema[Any]]] = None  # type: ignore
     error_response_schema: Optional[Type[AbstractResponseSchema[Any]]] = None
 
     def __init_subclass__(cls) -> None:
-        if not hasattr(cls, "paged_response_schema") or getattr(cls, "paged_response_schema") is None:
-            raise AttributeError("`paged_response_schema` must be defined in subclass.")
+        if getattr(cls, "paged_response_schema", None) is None and cls.cursor_paged_response_schema is None:
+            raise AttributeError(
+                "`paged_response_schema` or `cursor_paged_response_schema` must be defined in subclass."
+            )
         if not hasattr(cls, "response_schema") or getattr(cls, "response_schema") is None:
             raise AttributeError("`response_schema` must be defined in subclass.")
         return super().__init_subclass__()
 
+    def get_paged_response_schema(self, response_model: Type[Any]) -> Optional[Type[AbstractResponseSchema[Any]]]:
+        """Returns the response schema of paged response models.
+
+        Args:
+            response_model (Type[Any]): The route response model.
+
+        Returns:
+            Optional[Type[AbstractResponseSchema[Any]]]: The `paged_response_schema` for page models, \
+                the `cursor_paged_response_schema` for keyset page models, None otherwise.
+        """
+        if lenient_issubclass(response_model, AbstractPagedResponseSchema):
+            return getattr(self, "paged_response_schema", None)
+        if lenient_issubclass(response_model, AbstractCursorPagedResponseSchema):
+            return self.cursor_paged_response_schema
+        return None
+
     def get_wrapper_model(self, is_error: bool, response_model: Type[Any]) -> Type[AbstractResponseSchema[Any]]:
-        if issubclass(response_model, AbstractPagedResponseSchema):
+        paged_response_schema = self.get_paged_response_schema(response_model)
+        if paged_response_schema is not None:
             if not self.error_response_schema:
-                return self.paged_response_schema
-            return self.error_response_schema if is_error else self.paged_response_schema
+                return paged_response_schema
+            return self.error_response_schema if is_error else paged_response_schema
         return super().get_wrapper_model(is_error, response_model)
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        if self.count_cache is None or not lenient_issubclass(self.response_model, AbstractPagedResponseSchema):
+            return handler
+        cache, route = self.count_cache, self.path
+
+        async def counted_handler(request: Request) -> Response:
+            params = chain(request.path_params.items(), request.query_params.multi_items())
+            token = _current_count_scope.set(CountScope(cache=cache, key=cache.get_key(route, params)))
+            try:
+                return await handler(request)
+            finally:
+                _current_count_scope.reset(token)
+
+        return counted_handler
@@ -1,5 +1,8 @@
 from __future__ import annotations
-from typing import Optional, Any, Type, List, Union, Set, TypeVar, Generic, NamedTuple, ClassVar, Tuple
+import threading
+from collections.abc import Sized
+from typing import Optional, Any, Callable, Dict, Type, List, Union, Set, TypeVar, Generic, NamedTuple, ClassVar, Tuple
+from typing import Sequence
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 from fastapi import Request, Response
@@ -8,6 +11,8 @@ from fastapi.exceptions import RequestValidationError, HTTPException as FastAPIH
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from .exceptions import BaseGenericHTTPException
 from ._compat import DictIntStrAny, SetIntStr, PydanticGenericModel
+from .offload import estimate_size
+from .registry import parametrization_registry
 
 T = TypeVar("T")
 TResponseSchema = TypeVar("TResponseSchema", bound="AbstractResponseSchema")
@@ -36,8 +41,11 @@ class HTTPExceptionAdapter:
         )
 
     @classmethod
-    def from_request_validation_err(cls, exc: RequestValidationError) -> "HTTPExceptionAdapter":
-        return cls(status_code=422, reason=exc.errors(), headers=None, extra_params=dict())
+    def from_request_validation_err(
+        cls, exc: RequestValidationError, limits: Optional["ValidationErrorLimits"] = None
+    ) -> "HTTPExceptionAdapter":
+        errors = exc.errors() if limits is None else limits.format(exc.errors())
+        return cls(status_code=422, reason=errors, headers=None, extra_params=dict())
 
     @classmethod
     def from_generic_http_exc(cls, exc: BaseGenericHTTPException) -> "HTTPExceptionAdapter":
@@ -49,6 +57,232 @@ class HTTPExceptionAdapter:
         )
 
 
+class ValidationErrorLimits:
+    """Bounds the request validation errors reported in the error responses, it is the default adapter
+    of `RequestValidationError` in `exception_adapters`.
+
+    Only the first `max_errors` errors are formatted, followed by an error of type `too_many_errors`
+    counting the omitted ones, and the inputs echoed by the errors are shortened to about `max_input_size` bytes:
+    a client posting thousands of invalid items gets a small response, built before the error schema.
+    """
+
+    def __init__(self, max_errors: Optional[int] = 50, max_input_size: Optional[int] = 1024) -> None:
+        """Limits set to None are not applied.
+
+        Args:
+            max_errors (Optional[int], optional): Maximum number of reported errors. Defaults to 50.
+            max_input_size (Optional[int], optional): Maximum estimated size, in bytes, of an echoed input. \
+                Longer strings are truncated and larger collections replaced by a description. Defaults to 1024.
+        """
+        self.max_errors = max_errors
+        self.max_input_size = max_input_size
+
+    def shorten_input(self, value: Any) -> Any:
+        """Shortens an input echoed by a validation error.
+
+        Args:
+            value (Any): The input.
+
+        Returns:
+            Any: The input, or its shortened form when it exceeds `max_input_size`.
+        """
+        if self.max_input_size is None or value is None or isinstance(value, (int, float)):
+            return value
+        if isinstance(value, str):
+            return value if len(value) <= self.max_input_size else value[: self.max_input_size] + "..."
+        if isinstance(value, bytes):
+            return value if len(value) <= self.max_input_size else value[: self.max_input_size] + b"..."
+        if estimate_size(value) <= self.max_input_size:
+            return value
+        if isinstance(value, Sized):
+            return f"<{type(value).__name__} of {len(value)} items>"
+        return f"<{type(value).__name__}>"
+
+    def format(self, errors: Sequence[Any]) -> List[Any]:
+        """Formats the reported validation errors.
+
+        Args:
+            errors (Sequence[Any]): The validation errors, e.g. `RequestValidationError.errors()`.
+
+        Returns:
+            List[Any]: The reported errors.
+        """
+        reported = errors if self.max_errors is None else errors[: self.max_errors]
+        formatted = [
+            {**error, "input": self.shorten_input(error["input"])}
+            if isinstance(error, dict) and "input" in error
+            else error
+            for error in reported
+        ]
+        omitted = len(errors) - len(reported)
+        if omitted > 0:
+            formatted.append(
+                {
+                    "type": "too_many_errors",
+                    "loc": [],
+                    "msg": f"{omitted} more validation errors omitted.",
+                    "ctx": {"omitted_errors": omitted},
+                }
+            )
+        return formatted
+
+    def __call__(self, exc: RequestValidationError) -> HTTPExceptionAdapter:
+        return HTTPExceptionAdapter.from_request_validation_err(exc, limits=self)
+
+
+ExceptionAdapter = Callable[[Any], HTTPExceptionAdapter]
+TException = TypeVar("TException", bound=Exception)
+
+
+class ExceptionAdapterRegistry:
+    """Maps exception classes to the adapters building their `HTTPExceptionAdapter`.
+
+    An exception is adapted by the adapter registered for the closest class of its MRO,
+    so registering `Exception` covers every error not handled by a more specific adapter.
+    Resolutions are cached per exception class: after the first occurrence of a class,
+    dispatching its exceptions is a single dictionary lookup.
+    """
+
+    def __init__(self) -> None:
+        """Registries start empty, `exception_adapters` is the registry prefilled with the HTTP exceptions adapters."""
+        self._adapters: Dict[Type[Exception], ExceptionAdapter] = {}
+        self._resolved: Dict[Type[Exception], Optional[ExceptionAdapter]] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self, exception_class: Type[TException], adapter: Callable[[TException], HTTPExceptionAdapter]
+    ) -> None:
+        """Registers the adapter of an exception class and of its subclasses without a more specific adapter.
+        Register the adapters before calling `wrap_error_responses`, which adds an exception handler per class.
+
+        Usage:
+
+            exception_adapters.register(
+                TimeoutError,
+                lambda exc: HTTPExceptionAdapter(reason="Timed out", status_code=504, headers=None, extra_params={}),
+            )
+
+        Args:
+            exception_class (Type[TException]): The exception class.
+            adapter (Callable[[TException], HTTPExceptionAdapter]): Builds the adapter from the exception.
+        """
+        with self._lock:
+            self._adapters[exception_class] = adapter
+            self._resolved = {}  # registering can change the resolution of any subclass
+
+    def resolve(self, exception_class: Type[Exception]) -> Optional[ExceptionAdapter]:
+        """Returns the adapter of the closest registered class in the MRO of `exception_class`.
+
+        Args:
+            exception_class (Type[Exception]): The exception class.
+
+        Returns:
+            Optional[ExceptionAdapter]: The adapter, None when no class of the MRO is registered.
+        """
+        resolved = self._resolved  # a concurrent registration replaces the cache, never updates it
+        try:
+            return resolved[exception_class]
+        except KeyError:
+            pass
+        adapter = next((self._adapters[cls] for cls in exception_class.__mro__ if cls in self._adapters), None)
+        resolved[exception_class] = adapter
+        return adapter
+
+    def adapt(self, exception: Exception) -> HTTPExceptionAdapter:
+        """Adapts an exception with its registered adapter.
+
+        Args:
+            exception (Exception): The raised exception.
+
+        Raises:
+            TypeError: when no class in the exception MRO is registered.
+
+        Returns:
+            HTTPExceptionAdapter: The adapted exception.
+        """
+        adapter = self.resolve(type(exception))
+        if adapter is None:
+            raise TypeError(f"No exception adapter registered for {type(exception).__name__}.")
+        return adapter(exception)
+
+    def copy(self) -> "ExceptionAdapterRegistry":
+        """Returns a registry with the same adapters, e.g. to extend `exception_adapters` for a single application.
+
+        Returns:
+            ExceptionAdapterRegistry: The new registry.
+        """
+        registry = ExceptionAdapterRegistry()
+        registry._adapters = dict(self._adapters)
+        return registry
+
+    def exception_classes(self) -> Tuple[Type[Exception], ...]:
+        """Returns the registered exception classes.
+
+        Returns:
+            Tuple[Type[Exception], ...]: The exception classes, in registration order.
+        """
+        return tuple(self._adapters)
+
+
+exception_adapters = ExceptionAdapterRegistry()
+exception_adapters.register(RequestValidationError, ValidationErrorLimits())
+exception_adapters.register(StarletteHTTPException, HTTPExceptionAdapter.from_starlette_exc)
+exception_adapters.register(FastAPIHTTPException, HTTPExceptionAdapter.from_fastapi_exc)
+exception_adapters.register(BaseGenericHTTPException, HTTPExceptionAdapter.from_generic_http_exc)
+
+
+class RouteContext(NamedTuple):
+    """The route parameters passed to `AbstractResponseSchema.from_route_context`.
+    Built once when the route gets created and shared by every request it serves.
+
+    Args:
+        path (str): Response path info.
+        status_code (int): response status code.
+        response_model (Optional[Type[Any]], optional): The route response model. Defaults to None.
+        tags (Optional[List[Any]], optional): OpenAPI Tags configured in the API Route. Defaults to None.
+        summary (Optional[str], optional): OpenAPI Summary. Defaults to None.
+        description (Optional[str], optional): OpenAPI description. Defaults to None.
+        response_description (str, optional): A string describing the response. Defaults to "Successful Response".
+        deprecated (Optional[bool], optional): OpenAPI deprecation flag. Defaults to None.
+        name (Optional[str], optional): Operation name. Defaults to None.
+        methods (Optional[Union[Set[str], List[str]]], optional): supoported methods. Defaults to None.
+        operation_id (Optional[str], optional): OpenAPI operation ID. Defaults to None.
+        response_model_include (Optional[Union[SetIntStr, DictIntStrAny]], optional): `response_model` \
+            Included fields. Defaults to None.
+        response_model_exclude (Optional[Union[SetIntStr, DictIntStrAny]], optional): `response_model` \
+            Excluded fields. Defaults to None.
+        response_model_by_alias (bool, optional): Enable or disable field aliases in `response_model`. \
+            Defaults to True.
+        response_model_exclude_unset (bool, optional): excludes unset values in `response_model`. Defaults to False.
+        response_model_exclude_defaults (bool, optional): excludes default values in `response_model`. \
+            Defaults to False.
+        response_model_exclude_none (bool, optional): excludes None values in `response_model`. Defaults to False.
+        include_in_schema (bool, optional): wether or not include this operation in the OpenAPI Schema. \
+            Defaults to True.
+        response_class (Optional[Any], optional): FastaAPI/Starlette Response Class. Defaults to None.
+    """
+
+    path: str
+    status_code: int
+    response_model: Optional[Type[Any]] = None
+    tags: Optional[List[Any]] = None
+    summary: Optional[str] = None
+    description: Optional[str] = None
+    response_description: str = "Successful Response"
+    deprecated: Optional[bool] = None
+    name: Optional[str] = None
+    methods: Optional[Union[Set[str], List[str]]] = None
+    operation_id: Optional[str] = None
+    response_model_include: Optional[Union[SetIntStr, DictIntStrAny]] = None
+    response_model_exclude: Optional[Union[SetIntStr, DictIntStrAny]] = None
+    response_model_by_alias: bool = True
+    response_model_exclude_unset: bool = False
+    response_model_exclude_defaults: bool = False
+    response_model_exclude_none: bool = False
+    include_in_schema: bool = True
+    response_class: Optional[Any] = None
+
+
 class AbstractResponseSchema(PydanticGenericModel, Generic[T], ABC):
     """Abstract generic model for building response schema interfaces."""
 
@@ -113,6 +347,50 @@ class AbstractResponseSchema(PydanticGenericModel, Generic[T], ABC):
         """
         pass
 
+    @classmethod
+    def from_route_context(
+        cls: Type[TResponseSchema], content: T, context: RouteContext, metadata: Optional[dict] = None
+    ) -> TResponseSchema:
+        """Builds an instance of response model from the route context, this is what `SchemaAPIRoute` calls.
+        By default it calls `from_api_route` with the context fields updated with the `respond` metadata:
+        overriding it skips building the keyword arguments of `from_api_route` on every request.
+
+        Args:
+            content (Any): The response content.
+            context (RouteContext): The route parameters.
+            metadata (Optional[dict], optional): The metadata passed to `respond`. Defaults to None.
+
+        Returns:
+            TResponseSchema: A ResponseSchema instance
+        """
+        extra = dict(metadata) if metadata else {}
+        get = extra.pop  # the metadata override the context fields, other metadata are passed as they are
+        return cls.from_api_route(
+            content=content,
+            path=get("path", context.path),
+            status_code=get("status_code", context.status_code) or 200,
+            response_model=get("response_model", context.response_model),
+            tags=get("tags", context.tags),
+            summary=get("summary", context.summary),
+            description=get("description", context.description),
+            response_description=get("response_description", context.response_description),
+            deprecated=get("deprecated", context.deprecated),
+            name=get("name", context.name),
+            methods=get("methods", context.methods),
+            operation_id=get("operation_id", context.operation_id),
+            response_model_include=get("response_model_include", context.response_model_include),
+            response_model_exclude=get("response_model_exclude", context.response_model_exclude),
+            response_model_by_alias=get("response_model_by_alias", context.response_model_by_alias),
+            response_model_exclude_unset=get("response_model_exclude_unset", context.response_model_exclude_unset),
+            response_model_exclude_defaults=get(
+                "response_model_exclude_defaults", context.response_model_exclude_defaults
+            ),
+            response_model_exclude_none=get("response_model_exclude_none", context.response_model_exclude_none),
+            include_in_schema=get("include_in_schema", context.include_in_schema),
+            response_class=get("response_class", context.response_class),
+            **extra,
+        )
+
     @classmethod
     @abstractmethod
     def from_exception(
@@ -141,28 +419,38 @@ class AbstractResponseSchema(PydanticGenericModel, Generic[T], ABC):
     def from_exception_handler(
         cls: Type[TResponseSchema],
         request: Request,
-        exception: Union[
-            RequestValidationError, StarletteHTTPException, FastAPIHTTPException, BaseGenericHTTPException
-        ],
+        exception: Exception,
+        adapters: Optional[ExceptionAdapterRegistry] = None,
     ) -> TResponseSchema:
         """Used in exception handlers to build a ResponseSchema instance.
         This method should not be overridden by subclasses.
 
         Args:
             request (Request): A FastaAPI/Starlette Request.
-            exception (Union[RequestValidationError, StarletteHTTPException, FastAPIHTTPException, BaseGenericHTTPException]): The instantiated raised exception.
+            exception (Exception): The instantiated raised exception.
+            adapters (Optional[ExceptionAdapterRegistry], optional): Adapts the exception, \
+                `exception_adapters` when None. Defaults to None.
+
+        Returns:
+            TResponseSchema: A ResponseSchema instance
+        """
+        adapted = (adapters or exception_adapters).adapt(exception)
+        return cls.from_adapted_exception(request=request, adapted=adapted)
+
+    @classmethod
+    def from_adapted_exception(
+        cls: Type[TResponseSchema], request: Request, adapted: HTTPExceptionAdapter
+    ) -> TResponseSchema:
+        """Builds a ResponseSchema instance from an adapted exception.
+        This method should not be overridden by subclasses.
+
+        Args:
+            request (Request): A FastaAPI/Starlette Request.
+            adapted (HTTPExceptionAdapter): The adapted exception.
 
         Returns:
             TResponseSchema: A ResponseSchema instance
         """
-        if isinstance(exception, BaseGenericHTTPException):
-            adapted = HTTPExceptionAdapter.from_generic_http_exc(exception)
-        elif isinstance(exception, FastAPIHTTPException):
-            adapted = HTTPExceptionAdapter.from_fastapi_exc(exception)
-        elif isinstance(exception, StarletteHTTPException):
-            adapted = HTTPExceptionAdapter.from_starlette_exc(exception)
-        else:
-            adapted = HTTPExceptionAdapter.from_request_validation_err(exception)
         return cls.from_exception(
             request=request,
             reason=adapted.reason,
@@ -174,8 +462,12 @@ class AbstractResponseSchema(PydanticGenericModel, Generic[T], ABC):
     def __class_getitem__(
         cls: Type[TResponseSchema], params: Union[Type[Any], Tuple[Type[Any], ...]]
     ) -> Type[TResponseSchema]:
-        cls.__inner_type__ = params
-        return super().__class_getitem__(params)
+        def parametrize() -> Type[TResponseSchema]:
+            model = super(AbstractResponseSchema, cls).__class_getitem__(params)  # type: ignore
+            model.__inner_type__ = params  # set on the parametrized subclass, never on the shared generic
+            return model
+
+        return parametrization_registry.get_or_create(cls, params, parametrize)
 
     class Config:
         arbitrary_types_allowed = True
@@ -0,0 +1,76 @@
+from __future__ import annotations
+import asyncio
+from collections.abc import AsyncIterable, Collection, Iterable
+from typing import Any
+from pydantic import BaseModel
+from .streaming import is_streamable
+
+
+def is_lazy(content: Any) -> bool:
+    """Evaluates whether or not the `respond` content must be resolved before building the response schema.
+    Callables, generators, async generators and iterables that are not collections (e.g. ORM queries) are lazy.
+    The route handler resolves them after the endpoint returns, their resolution is deferred, not their loading:
+    the content is loaded entirely before being encoded.
+
+    Args:
+        content (Any): The `respond` content.
+
+    Returns:
+        bool: wether or not the content is lazy.
+    """
+    if isinstance(content, (type, BaseModel)):
+        return False
+    if callable(content) or isinstance(content, AsyncIterable):
+        return True
+    return isinstance(content, Iterable) and not isinstance(content, Collection)
+
+
+def is_async_lazy(content: Any) -> bool:
+    """Evaluates whether or not the lazy content must be resolved on the event loop.
+
+    Args:
+        content (Any): The `respond` content.
+
+    Returns:
+        bool: wether or not the content is a coroutine function or an async iterable.
+    """
+    return asyncio.iscoroutinefunction(content) or isinstance(content, AsyncIterable)
+
+
+def resolve_content(content: Any, stream: bool = False) -> Any:
+    """Materializes lazy content: callables are called and iterables are collected in a list.
+
+    Args:
+        content (Any): The `respond` content.
+        stream (bool, optional): wether or not the route streams iterators, which are then kept as they are. \
+            Defaults to False.
+
+    Returns:
+        Any: The materialized content.
+    """
+    if callable(content) and not isinstance(content, type):
+        content = content()
+    if stream and is_streamable(content):
+        return content
+    if is_lazy(content) and not isinstance(content, AsyncIterable):
+        return list(content)
+    return content
+
+
+async def aresolve_content(content: Any, stream: bool = False) -> Any:
+    """Materializes the lazy content that needs the event loop: coroutine functions and async iterables.
+    Other lazy content is left to `resolve_content`, which may run in a worker thread.
+
+    Args:
+        content (Any): The `respond` content.
+        stream (bool, optional): wether or not the route streams iterators, which are then kept as they are. \
+            Defaults to False.
+
+    Returns:
+        Any: The content, with its asynchronous parts resolved.
+    """
+    if asyncio.iscoroutinefunction(content):
+        content = await content()
+    if isinstance(content, AsyncIterable) and not (stream and is_streamable(content)):
+        return [item async for item in content]
+    return content
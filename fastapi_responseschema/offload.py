@@ -0,0 +1,261 @@
+from __future__ import annotations
+import asyncio
+import importlib
+import os
+import pickle
+import sys
+from collections.abc import Mapping, Sized
+from concurrent.futures import Executor, Future
+from contextvars import copy_context
+from functools import partial
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, Type
+from starlette.concurrency import run_in_threadpool
+
+if TYPE_CHECKING:  # pragma: no cover
+    from multiprocessing.context import BaseContext
+
+
+def count_items(content: Any) -> int:
+    """Counts the top level items of the endpoint content.
+
+    Args:
+        content (Any): The endpoint content.
+
+    Returns:
+        int: The collection length, 1 for single objects and 0 for None.
+    """
+    if content is None:
+        return 0
+    if isinstance(content, Sized) and not isinstance(content, (str, bytes, bytearray, Mapping)):
+        return len(content)
+    return 1
+
+
+def _approximate_size(value: Any, depth: int) -> int:
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if depth <= 0:
+        return sys.getsizeof(value)
+    if isinstance(value, Mapping):
+        return sum(_approximate_size(k, 0) + _approximate_size(v, depth - 1) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sum(_approximate_size(item, depth - 1) for item in value)
+    fields = getattr(value, "__dict__", None)  # models and plain objects
+    if fields is not None:
+        return _approximate_size(fields, depth)
+    return sys.getsizeof(value)
+
+
+def estimate_size(content: Any, sample_size: int = 8, depth: int = 3) -> int:
+    """Estimates the in-memory size of the endpoint content from a sample of its items.
+    The estimate is only meant to compare payloads against a threshold, it is not an exact measure.
+
+    Args:
+        content (Any): The endpoint content.
+        sample_size (int, optional): Number of leading items measured. Defaults to 8.
+        depth (int, optional): Nesting levels measured for every item. Defaults to 3.
+
+    Returns:
+        int: The estimated size in bytes.
+    """
+    items = count_items(content)
+    if items <= 1 or isinstance(content, (str, bytes, bytearray)):
+        return _approximate_size(content, depth) if content is not None else 0
+    sample = list(islice(content, sample_size))  # type: ignore
+    return _approximate_size(sample, depth + 1) * items // max(len(sample), 1)
+
+
+class OffloadPolicy:
+    """Moves the response schema wrapping and encoding of large async endpoint outputs off the event loop.
+
+    Sync endpoints already run in the threadpool: the policy only applies to async endpoints,
+    whose outputs would otherwise be wrapped on the event loop.
+    An output is offloaded when it exceeds any of the configured thresholds.
+    """
+
+    def __init__(
+        self, max_items: Optional[int] = 1000, max_bytes: Optional[int] = None, executor: Optional[Executor] = None
+    ) -> None:
+        """Thresholds set to None are not evaluated.
+
+        Args:
+            max_items (Optional[int], optional): Maximum number of top level items wrapped on the event loop. \
+                Defaults to 1000.
+            max_bytes (Optional[int], optional): Maximum estimated size, in bytes, wrapped on the event loop. \
+                Defaults to None.
+            executor (Optional[Executor], optional): A thread pool executor, the Starlette threadpool \
+                when None. Defaults to None.
+        """
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.executor = executor
+
+    def should_offload(self, content: Any) -> bool:
+        """Evaluates whether or not the endpoint content must be wrapped off the event loop.
+
+        Args:
+            content (Any): The endpoint content.
+
+        Returns:
+            bool: wether or not the wrapping must be offloaded.
+        """
+        if self.max_items is not None and count_items(content) > self.max_items:
+            return True
+        return self.max_bytes is not None and estimate_size(content) > self.max_bytes
+
+    async def run(self, func: Callable[..., Any], **kwargs: Any) -> Any:
+        """Runs `func` in a worker thread.
+
+        Args:
+            func (Callable[..., Any]): The function to offload.
+            **kwargs: `func` keyword arguments.
+
+        Returns:
+            Any: The `func` result.
+        """
+        if self.executor is None:
+            return await run_in_threadpool(func, **kwargs)
+        # executors do not propagate context variables as the Starlette threadpool does
+        call = partial(copy_context().run, partial(func, **kwargs))
+        return await asyncio.get_running_loop().run_in_executor(self.executor, call)
+
+
+def _preload(modules: Sequence[str]) -> None:
+    for module in modules:
+        importlib.import_module(module)
+
+
+def _ping() -> None:
+    pass
+
+
+def serialize_response(
+    wrapper_model: Type[Any],
+    content: Any,
+    context: Any,
+    metadata: Optional[dict],
+    encoder: Any,
+    options: Dict[str, Any],
+) -> bytes:
+    """Builds and encodes a response schema, this is what runs in the `ProcessPoolSerializer` workers.
+    The schema is parametrized in the worker, where the parametrization registry keeps it for the next payloads.
+
+    Args:
+        wrapper_model (Type[Any]): The response schema wrapping the route response model.
+        content (Any): The endpoint content.
+        context (RouteContext): The route parameters.
+        metadata (Optional[dict]): The metadata passed to `respond`.
+        encoder (ResponseEncoder): Encodes the response schema instance.
+        options (Dict[str, Any]): The `response_model_*` serialization options.
+
+    Returns:
+        bytes: The encoded response body.
+    """
+    wrapped_model = wrapper_model[context.response_model]
+    wrapped_output = wrapped_model.from_route_context(content=content, context=context, metadata=metadata)
+    return encoder.encode(wrapped_output, **options)
+
+
+def _serialize_pickled_response(payload: bytes) -> bytes:
+    return serialize_response(*pickle.loads(payload))
+
+
+class ProcessPoolSerializer:
+    """Builds and encodes very large responses in a pool of worker processes, spreading them across cores.
+
+    Payloads are pickled to the workers and the encoded bodies pickled back, so only outputs large enough
+    to outweigh the transfer should be sent: by default lists longer than 10000 items.
+    A single serializer can be shared by every route class; workers are started on first use or by `warm_up`.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        preload: Sequence[str] = (),
+        mp_context: Optional[BaseContext] = None,
+        min_items: Optional[int] = 10000,
+        min_bytes: Optional[int] = None,
+    ) -> None:
+        """Workers import the `preload` modules once when they start.
+
+        Args:
+            max_workers (Optional[int], optional): Number of worker processes, the number of CPUs when None. \
+                Defaults to None.
+            preload (Sequence[str], optional): Modules imported by every worker at startup, \
+                e.g. the modules defining the response schemas and models. Defaults to ().
+            mp_context (Optional[BaseContext], optional): The multiprocessing context. Defaults to None.
+            min_items (Optional[int], optional): Minimum number of top level items serialized in the pool. \
+                Defaults to 10000.
+            min_bytes (Optional[int], optional): Minimum estimated size, in bytes, serialized in the pool. \
+                Defaults to None.
+        """
+        from concurrent.futures import ProcessPoolExecutor  # imports multiprocessing, only when a pool is created
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_items = min_items
+        self.min_bytes = min_bytes
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=mp_context, initializer=_preload, initargs=(tuple(preload),)
+        )
+
+    def should_serialize(self, content: Any) -> bool:
+        """Evaluates whether or not the endpoint content must be serialized in the pool.
+
+        Args:
+            content (Any): The endpoint content.
+
+        Returns:
+            bool: wether or not the content must be serialized in the pool.
+        """
+        if self.min_items is not None and count_items(content) >= self.min_items:
+            return True
+        return self.min_bytes is not None and estimate_size(content) >= self.min_bytes
+
+    def submit(
+        self,
+        wrapper_model: Type[Any],
+        content: Any,
+        context: Any,
+        metadata: Optional[dict],
+        encoder: Any,
+        options: Dict[str, Any],
+    ) -> "Future[bytes]":
+        """Schedules the serialization of a response in the pool, see `serialize_response`.
+        The payload is pickled before being scheduled, so payloads that can not be sent to the workers fail here
+        and the errors raised by the workers are left to the returned future.
+
+        Args:
+            wrapper_model (Type[Any]): The response schema wrapping the route response model.
+            content (Any): The endpoint content.
+            context (RouteContext): The route parameters.
+            metadata (Optional[dict]): The metadata passed to `respond`.
+            encoder (ResponseEncoder): Encodes the response schema instance.
+            options (Dict[str, Any]): The `response_model_*` serialization options.
+
+        Raises:
+            pickle.PicklingError: when the payload can not be pickled.
+
+        Returns:
+            Future[bytes]: The encoded response body.
+        """
+        try:
+            payload = pickle.dumps(
+                (wrapper_model, content, context, metadata, encoder, options), protocol=pickle.HIGHEST_PROTOCOL
+            )
+        except (TypeError, AttributeError) as error:  # e.g. locks and local objects
+            raise pickle.PicklingError(str(error)) from error
+        return self.executor.submit(_serialize_pickled_response, payload)
+
+    def warm_up(self) -> None:
+        """Starts every worker process, importing the `preload` modules, before the first request."""
+        for future in [self.executor.submit(_ping) for _ in range(self.max_workers)]:
+            future.result()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops the worker processes.
+
+        Args:
+            wait (bool, optional): wether or not to wait for the pending serializations. Defaults to True.
+        """
+        self.executor.shutdown(wait=wait)
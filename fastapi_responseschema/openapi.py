@@ -0,0 +1,107 @@
+from __future__ import annotations
+import threading
+from typing import Any, Dict, Optional, Set
+from fastapi import FastAPI, Request, Response
+from starlette.routing import Route
+from .conditional import etag_matches, hash_etag, new_hasher, not_modified
+from .encoders import render_json
+
+
+class OpenAPICache:
+    """Serves the OpenAPI document of an application from its encoded bytes.
+
+    FastAPI generates the document once, on the first request of `openapi_url`, but encodes it again
+    for every request, which takes hundreds of milliseconds for applications with thousands of routes.
+    The cache encodes the document once, sets a strong ETag on it and answers `304 Not Modified`
+    to the `If-None-Match` requests it matches.
+    The document itself is still generated by FastAPI, only its encoding is cached.
+    """
+
+    def __init__(self, app: FastAPI) -> None:
+        """The document is generated and encoded on the first request, or by `warm_up`.
+
+        Args:
+            app (FastAPI): The application.
+        """
+        self.app = app
+        self._document: Optional[Dict[str, Any]] = None
+        self._body = b""
+        self._etag = ""
+        self._server_urls: Set[str] = {server["url"] for server in app.servers if server.get("url")}
+        self._lock = threading.Lock()
+
+    def render(self) -> bytes:
+        """Returns the encoded document, encoding it again only when the application regenerated it.
+
+        Returns:
+            bytes: The encoded OpenAPI document.
+        """
+        document = self.app.openapi()
+        if document is not self._document:
+            with self._lock:
+                if document is not self._document:
+                    body = render_json(document)
+                    hasher = new_hasher()
+                    hasher.update(body)
+                    self._body, self._etag, self._document = body, hash_etag(hasher), document
+        return self._body
+
+    def warm_up(self) -> None:
+        """Generates and encodes the document before the first request, e.g. in the application lifespan."""
+        self.render()
+
+    def invalidate(self) -> None:
+        """Drops the document, e.g. after adding routes: the next request generates it again."""
+        with self._lock:
+            self.app.openapi_schema = None
+            self._document = None
+
+    async def endpoint(self, request: Request) -> Response:
+        """Serves the encoded document, replacing the `openapi_url` route of FastAPI.
+
+        Args:
+            request (Request): The request.
+
+        Returns:
+            Response: The document, or a `304 Not Modified` response.
+        """
+        root_path = request.scope.get("root_path", "").rstrip("/")
+        if root_path not in self._server_urls:  # as FastAPI does, the first root path is documented as a server
+            if root_path and self.app.root_path_in_servers:
+                self.app.servers.insert(0, {"url": root_path})
+                self._server_urls.add(root_path)
+        body = self.render()
+        if etag_matches(request.headers.get("if-none-match"), self._etag):
+            return not_modified(self._etag)
+        return Response(content=body, media_type="application/json", headers={"etag": self._etag})
+
+
+def cache_openapi(app: FastAPI) -> OpenAPICache:
+    """Serves the OpenAPI document of the application through an `OpenAPICache`.
+
+    Usage:
+
+        openapi_cache = cache_openapi(app)
+
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            openapi_cache.warm_up()  # optional, generates the document at startup
+            yield
+
+    Args:
+        app (FastAPI): The application, with an `openapi_url`.
+
+    Raises:
+        ValueError: when the application does not serve an OpenAPI document.
+
+    Returns:
+        OpenAPICache: The cache serving the document.
+    """
+    if not app.openapi_url:
+        raise ValueError("The application does not serve an OpenAPI document.")
+    cache = OpenAPICache(app)
+    for index, route in enumerate(app.router.routes):
+        if isinstance(route, Route) and route.path == app.openapi_url:
+            app.router.routes[index] = Route(app.openapi_url, cache.endpoint, include_in_schema=False)
+            break
+    return cache
@@ -0,0 +1,210 @@
+from __future__ import annotations
+from contextvars import ContextVar
+from typing import Any, Callable, Coroutine, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple, Type
+from fastapi import Query
+from pydantic import BaseModel
+from .cache import LRUCache
+from .exceptions import BadRequest
+from .streaming import get_item_type
+from ._compat import get_model_field_names, lenient_issubclass
+
+
+class Projection(NamedTuple):
+    """The fields of the route response model emitted in the response.
+
+    Args:
+        fields (FrozenSet[str]): Emitted fields of the response model, or of its items for collections.
+        exclude (Optional[Any], optional): The response schema `exclude` applying a sparse fieldset, \
+            None when the route `response_model_*` parameters already apply the projection. Defaults to None.
+    """
+
+    fields: FrozenSet[str]
+    exclude: Optional[Any] = None
+
+
+_current_projection: ContextVar[Optional[Projection]] = ContextVar("fastapi_responseschema_projection", default=None)
+
+
+async def get_projection() -> Optional[Projection]:
+    """FastAPI dependency returning the projection of the current request.
+
+    Returns:
+        Optional[Projection]: The projection, None when the route does not set a `content_field`.
+    """
+    return _current_projection.get()
+
+
+def current_projection() -> Optional[Projection]:
+    """Returns the projection of the current request outside dependencies, e.g. in a data layer.
+
+    Returns:
+        Optional[Projection]: The projection, None when the route does not set a `content_field`.
+    """
+    return _current_projection.get()
+
+
+def get_projected_model(response_model: Any) -> Tuple[Optional[Type[BaseModel]], bool]:
+    """Extracts the model whose fields get projected from the route `response_model`.
+
+    Args:
+        response_model (Any): The route response model, e.g. `Item` or `List[Item]`.
+
+    Returns:
+        Tuple[Optional[Type[BaseModel]], bool]: The model, None if it is not a pydantic model, \
+            and wether or not the response model is a collection.
+    """
+    item_type = get_item_type(response_model)
+    model, collection = (response_model, False) if item_type is Any else (item_type, True)
+    return (model if lenient_issubclass(model, BaseModel) else None), collection
+
+
+def _is_whole(spec: Any) -> bool:
+    return spec is True or spec is Ellipsis
+
+
+def _get_content_spec(spec: Any, path: List[str], collection: bool, default: Any) -> Any:
+    for key in path:
+        if _is_whole(spec):
+            return True
+        if isinstance(spec, (set, frozenset)):
+            return True if key in spec else None
+        spec = spec.get(key) if isinstance(spec, dict) else None
+    if collection and isinstance(spec, dict):  # items are selected by the `__all__` key
+        return spec.get("__all__", default)
+    return spec
+
+
+def project_fields(
+    model: Type[BaseModel], content_field: str, collection: bool, include: Any = None, exclude: Any = None
+) -> FrozenSet[str]:
+    """Computes the fields of the model emitted with the `response_model_include` and `response_model_exclude`
+    of the response schema, e.g. `{"data": {"__all__": {"id", "name"}}}`.
+
+    Args:
+        model (Type[BaseModel]): The projected model.
+        content_field (str): Dotted path of the content field in the response schema.
+        collection (bool): wether or not the content is a collection of `model`.
+        include (Any, optional): The response schema `include`. Defaults to None.
+        exclude (Any, optional): The response schema `exclude`. Defaults to None.
+
+    Returns:
+        FrozenSet[str]: The emitted field names.
+    """
+    path = content_field.split(".")
+    fields = set(get_model_field_names(model))
+    if include is not None:
+        spec = _get_content_spec(include, path, collection, default=True)
+        if spec is None:
+            return frozenset()
+        if not _is_whole(spec):
+            fields &= set(spec)
+    if exclude is not None:
+        spec = _get_content_spec(exclude, path, collection, default=None)
+        if _is_whole(spec):
+            return frozenset()
+        if isinstance(spec, (set, frozenset)):
+            fields -= spec
+        elif isinstance(spec, dict):
+            fields -= {key for key, value in spec.items() if _is_whole(value)}
+    return frozenset(fields)
+
+
+def merge_specs(first: Any, second: Any) -> Any:
+    """Merges two `exclude` specs, a field excluded by any of them is excluded.
+
+    Args:
+        first (Any): An `exclude` spec.
+        second (Any): An `exclude` spec.
+
+    Returns:
+        Any: The merged spec.
+    """
+    if first is None or _is_whole(second):
+        return second
+    if second is None or _is_whole(first):
+        return first
+    first = dict.fromkeys(first, True) if isinstance(first, (set, frozenset)) else first
+    second = dict.fromkeys(second, True) if isinstance(second, (set, frozenset)) else second
+    merged = dict(first)
+    for key, value in second.items():
+        merged[key] = merge_specs(merged.get(key), value)
+    return merged
+
+
+class FieldProjector:
+    """Resolves the projections of a route response model, caching sparse fieldsets per field combination."""
+
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        content_field: str,
+        collection: bool,
+        include: Any = None,
+        exclude: Any = None,
+        cache_size: int = 256,
+    ) -> None:
+        """The route projection is computed once, from the `response_model_*` parameters.
+
+        Args:
+            model (Type[BaseModel]): The projected model.
+            content_field (str): Dotted path of the content field in the response schema.
+            collection (bool): wether or not the content is a collection of `model`.
+            include (Any, optional): The response schema `include`. Defaults to None.
+            exclude (Any, optional): The response schema `exclude`. Defaults to None.
+            cache_size (int, optional): Maximum number of cached sparse fieldsets. Defaults to 256.
+        """
+        self.model = model
+        self.content_field = content_field
+        self.collection = collection
+        self.exclude = exclude
+        self.projection = Projection(fields=project_fields(model, content_field, collection, include, exclude))
+        self._cache: LRUCache[Projection] = LRUCache(maxsize=cache_size)
+
+    def select(self, fields: Iterable[str]) -> Projection:
+        """Builds the projection of a sparse fieldset.
+
+        Args:
+            fields (Iterable[str]): The requested field names.
+
+        Raises:
+            BadRequest: when a requested field is not emitted by the route.
+
+        Returns:
+            Projection: The projection.
+        """
+        requested = frozenset(fields)
+        projection = self._cache.get(requested)
+        if projection is not None:
+            return projection
+        unknown = requested - self.projection.fields
+        if unknown:
+            raise BadRequest(detail=f"Unknown fields: {', '.join(sorted(unknown))}.")
+        spec: Any = dict.fromkeys(self.projection.fields - requested, True)
+        if self.collection:
+            spec = {"__all__": spec}
+        for key in reversed(self.content_field.split(".")):
+            spec = {key: spec}
+        projection = Projection(fields=requested, exclude=merge_specs(self.exclude, spec))
+        self._cache.set(requested, projection)
+        return projection
+
+    def get_dependency(self, query_param: str) -> Callable[..., Coroutine[Any, Any, Optional[Projection]]]:
+        """Builds the route dependency reading sparse fieldsets from a comma separated query parameter.
+
+        Args:
+            query_param (str): The query parameter name.
+
+        Returns:
+            Callable[..., Coroutine[Any, Any, Optional[Projection]]]: The dependency.
+        """
+
+        async def select_fields(
+            fields: Optional[str] = Query(
+                None, alias=query_param, description="Comma separated fields to include in the response."
+            )
+        ) -> Optional[Projection]:
+            if fields:
+                _current_projection.set(self.select(name.strip() for name in fields.split(",") if name.strip()))
+            return _current_projection.get()
+
+        return select_fields
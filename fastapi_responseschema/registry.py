@@ -0,0 +1,104 @@
+from __future__ import annotations
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Tuple, Type
+
+
+@dataclass(frozen=True)
+class RegistryStats:
+    """Snapshot of a registry's counters.
+
+    Args:
+        hits (int): Lookups served from the registry.
+        misses (int): Lookups that had to build a new entry.
+        evictions (int): Entries dropped to honour `maxsize`.
+        size (int): Current number of entries.
+        maxsize (int): Maximum number of entries.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class ParametrizationRegistry:
+    """Bounded registry mapping `(schema, inner type)` to the concrete parametrized schema.
+
+    Reads are lock-free dictionary lookups; the lock is only taken when a parametrization is missing,
+    so after the application warmed up every subscription is a single O(1) lookup.
+    Counters are updated without locking and are meant for monitoring, not for accounting.
+    """
+
+    def __init__(self, maxsize: int = 2048) -> None:
+        """Registries are bounded to avoid leaking schemas parametrized at runtime.
+
+        Args:
+            maxsize (int, optional): Maximum number of parametrized schemas kept alive by the registry. \
+                The oldest entries are evicted first. Defaults to 2048.
+        """
+        if maxsize < 1:
+            raise ValueError("`maxsize` must be a positive integer.")
+        self.maxsize = maxsize
+        self._entries: Dict[Tuple[Type[Any], Hashable], Type[Any]] = {}
+        self._lock = threading.RLock()  # re-entrant: building a schema can parametrize nested schemas
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_create(self, schema: Type[Any], params: Any, factory: Callable[[], Type[Any]]) -> Type[Any]:
+        """Returns the registered parametrization of `schema`, building it with `factory` when missing.
+
+        Args:
+            schema (Type[Any]): The generic schema being subscripted.
+            params (Any): The subscription parameters.
+            factory (Callable[[], Type[Any]]): Builds the parametrized schema.
+
+        Returns:
+            Type[Any]: The parametrized schema.
+        """
+        key = (schema, params)
+        try:
+            model = self._entries.get(key)
+        except TypeError:  # unhashable parameters cannot be registered
+            self._misses += 1
+            return factory()
+        if model is not None:
+            self._hits += 1
+            return model
+        with self._lock:
+            model = self._entries.get(key)
+            if model is not None:
+                self._hits += 1
+                return model
+            self._misses += 1
+            model = factory()
+            self._entries[key] = model
+            while len(self._entries) > self.maxsize:
+                del self._entries[next(iter(self._entries))]
+                self._evictions += 1
+        return model
+
+    def stats(self) -> RegistryStats:
+        """Returns the registry counters.
+
+        Returns:
+            RegistryStats: A snapshot of the registry counters.
+        """
+        return RegistryStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._entries),
+            maxsize=self.maxsize,
+        )
+
+    def clear(self) -> None:
+        """Drops every entry and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+parametrization_registry = ParametrizationRegistry()
@@ -1,14 +1,101 @@
 from __future__ import annotations
 import asyncio
-from typing import Callable, Optional, Any, Type, List, Sequence, Dict, Union, Set
-from functools import wraps
+import logging
+import pickle
+from time import perf_counter
+from typing import Callable, Coroutine, Optional, Any, Type, List, Sequence, Dict, Union, Set, Tuple
+from concurrent.futures import BrokenExecutor, Future
+from contextvars import ContextVar
+from functools import partial, wraps
+from anyio import from_thread
+from starlette.concurrency import run_in_threadpool
 from starlette.routing import BaseRoute
-from fastapi import params, Response
+from fastapi import params, Request, Response
 from fastapi.routing import APIRoute
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.datastructures import DefaultPlaceholder, Default
-from .interfaces import AbstractResponseSchema, ResponseWithMetadata
+from fastapi.utils import create_cloned_field, create_response_field, is_body_allowed_for_status_code
+from .interfaces import AbstractResponseSchema, ResponseWithMetadata, RouteContext
+from fastapi.encoders import jsonable_encoder
+from .encoders import ResponseEncoder, PydanticResponseEncoder, render_json
+from .cache import LRUCache, ResponseCache
+from .conditional import ConditionalRequest, _current_conditional, apply_etag, etag_matches, make_etag, not_modified
+from .instrumentation import Instrumentation
+from .offload import OffloadPolicy, ProcessPoolSerializer
+from .lazy import aresolve_content, is_async_lazy, is_lazy, resolve_content
+from .projection import FieldProjector, _current_projection, current_projection, get_projected_model
+from .streaming import build_envelope_template, get_item_options, get_item_type, get_record_options
+from .streaming import is_streamable, stream_envelope
+from .streaming import stream_records
 from ._compat import DictIntStrAny, SetIntStr, lenient_issubclass, lenient_isinstance
+from ._compat import PYDANTIC_MAJOR, get_type_serializer
+
+
+_response_fields: LRUCache[Tuple[Any, Any]] = LRUCache(maxsize=2048)
+
+
+def get_shared_response_fields(response_model: Any) -> Tuple[Any, Any]:
+    """Returns the response field of a wrapped response model and its secure clone, built once per model.
+    Building a field compiles the model validator and serializer, the most expensive step of a route construction,
+    so every route returning the same wrapped model shares its fields.
+
+    Args:
+        response_model (Any): The response model wrapped in the response schema.
+
+    Returns:
+        Tuple[ModelField, ModelField]: The field documented in OpenAPI and the field validating the responses.
+    """
+    fields = _response_fields.get(response_model)
+    if fields is None:
+        options: Dict[str, Any] = {"mode": "serialization"} if PYDANTIC_MAJOR >= 2 else {}
+        field = create_response_field(name=f"Response_{response_model.__name__}", type_=response_model, **options)
+        fields = (field, create_cloned_field(field))
+        _response_fields.set(response_model, fields)
+    return fields
+
+
+_logger = logging.getLogger(__name__)
+
+
+_current_sub_response: ContextVar[Optional[Response]] = ContextVar("fastapi_responseschema_sub_response", default=None)
+
+
+async def _capture_sub_response(response: Response) -> None:
+    # FastAPI injects the same sub-response in the endpoint and in every dependency of a request
+    _current_sub_response.set(response)
+
+
+def _apply_sub_response(output: Any) -> Any:
+    """Applies the status code, headers and cookies set on the injected `fastapi.Response` parameter
+    to the responses built by the route, as FastAPI does for the responses it builds.
+    `304 Not Modified` answers keep their status code.
+
+    Args:
+        output (Any): The route output.
+
+    Returns:
+        Any: The output, with the sub-response applied when it is a `Response`.
+    """
+    sub_response = _current_sub_response.get()
+    if sub_response is None or not isinstance(output, Response):
+        return output
+    if sub_response.status_code and output.status_code != 304:
+        output.status_code = sub_response.status_code
+    output.raw_headers.extend(sub_response.raw_headers)
+    return output
+
+
+class _InstrumentedResponseField:
+    """Times the validation and the serialization FastAPI runs on the response field of a route."""
+
+    def __init__(self, field: Any, instrument: Callable[[Callable, str], Callable]) -> None:
+        self._field = field
+        self.validate = instrument(field.validate, "validate")
+        if hasattr(field, "serialize"):  # FastAPI serializes with `jsonable_encoder` on pydantic v1
+            self.serialize = instrument(field.serialize, "serialize")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._field, name)
 
 
 class SchemaAPIRoute(APIRoute):
@@ -30,10 +117,58 @@ class SchemaAPIRoute(APIRoute):
         from fastapi import APIRouter
 
         router = APIRouter(route_class=MyAPIRoute)
+
+    Setting `trust_response_schema = True` encodes the response schema instance built by `from_api_route` directly
+    with the `response_encoder` (`PydanticResponseEncoder` by default), skipping the validation and the serialization
+    FastAPI would run again against the wrapped `response_model`. The `response_model_*` parameters are still honoured.
+
+    Setting `response_encoder` (e.g. `PydanticResponseEncoder()`) encodes the response schema instance
+    straight to the response body, bypassing FastAPI's serialization altogether.
+
+    Setting `stream_content_field` (e.g. `"data"`) streams iterators and async iterators returned by the endpoints:
+    the response schema is built with empty content and its items are encoded `stream_chunk_size` at a time.
+
+    Setting `stream_records = True` streams iterators as `application/x-ndjson` instead: every item is wrapped
+    in its own response schema and a trailer line built by `get_records_trailer` closes the stream.
+
+    Setting `instrumentation` (e.g. `HistogramCollector()`) reports per-phase timings and payload sizes.
+
+    Setting `offload_policy` (e.g. `OffloadPolicy(max_items=1000)`) wraps and encodes large outputs of async endpoints
+    in a worker thread instead of the event loop.
+
+    Setting `serialization_executor` (e.g. `ProcessPoolSerializer()`) builds and encodes very large outputs
+    in a pool of worker processes, returning the encoded bytes.
+
+    Setting `content_field` (e.g. `"data"`) exposes the fields of the `response_model` emitted in the response
+    to the endpoints, through the `get_projection` dependency. Setting `fields_query_param` (e.g. `"fields"`)
+    also lets clients request sparse fieldsets, e.g. `?fields=id,name`.
+
+    Setting `etag = True` sets a strong ETag, hashed from the encoded body, on the successful GET and HEAD responses
+    and answers `304 Not Modified` to the `If-None-Match` requests it matches. Endpoints can provide the ETag with
+    `respond(..., etag=version)`, which skips building and encoding the response schema of matching requests.
+
+    Setting `response_cache` (e.g. `ResponseCache(ttl=30)`) serves the encoded responses of GET requests from a cache,
+    keyed on path, query string, selected headers and response model.
     """
 
     response_schema: Type[AbstractResponseSchema[Any]]
     error_response_schema: Optional[Type[AbstractResponseSchema[Any]]] = None
+    trust_response_schema: bool = False
+    response_encoder: Optional[ResponseEncoder] = None
+    stream_content_field: Optional[str] = None
+    stream_chunk_size: int = 64
+    stream_records: bool = False
+    instrumentation: Optional[Instrumentation] = None
+    offload_policy: Optional[OffloadPolicy] = None
+    serialization_executor: Optional[ProcessPoolSerializer] = None
+    content_field: Optional[str] = None
+    fields_query_param: Optional[str] = None
+    projection_cache_size: int = 256
+    etag: bool = False
+    response_cache: Optional[ResponseCache] = None
+    _stream_item_serializer: Optional[Callable[..., bytes]] = None
+    _stream_record_model: Optional[Type[AbstractResponseSchema[Any]]] = None
+    _response_fields: Optional[Dict[Union[int, str], Any]] = None
 
     def __init_subclass__(cls) -> None:
         if not hasattr(cls, "response_schema"):
@@ -85,41 +220,343 @@ class SchemaAPIRoute(APIRoute):
         # due to: https://github.com/python/mypy/issues/12392 FIXME: when gets fixed
         return wrapper_model[response_model]  # type: ignore
 
+    def _create_projector(self, response_model: Any, include: Any, exclude: Any) -> Optional[FieldProjector]:
+        if self.content_field is None:
+            return None
+        model, collection = get_projected_model(response_model)
+        if model is None:
+            return None
+        return FieldProjector(
+            model=model,
+            content_field=self.content_field,
+            collection=collection,
+            include=include,
+            exclude=exclude,
+            cache_size=self.projection_cache_size,
+        )
+
     def _wrap_endpoint_output(
+        self, endpoint_output: Any, wrapped_model: Type[AbstractResponseSchema], context: RouteContext
+    ) -> Any:
+        if lenient_isinstance(endpoint_output, ResponseWithMetadata):  # Handling the `respond` function
+            return wrapped_model.from_route_context(
+                content=endpoint_output.response_content, context=context, metadata=endpoint_output.metadata
+            )
+        return wrapped_model.from_route_context(content=endpoint_output, context=context)
+
+    def _get_serialization_options(self) -> Dict[str, Any]:
+        return dict(
+            include=self.response_model_include,
+            exclude=self.response_model_exclude,
+            by_alias=self.response_model_by_alias,
+            exclude_unset=self.response_model_exclude_unset,
+            exclude_defaults=self.response_model_exclude_defaults,
+            exclude_none=self.response_model_exclude_none,
+        )
+
+    def _encode_output(self, wrapped_output: Any, **options: Any) -> Response:
+        encoder = self.response_encoder or PydanticResponseEncoder()
+        return Response(
+            content=encoder.encode(wrapped_output, **dict(self._get_serialization_options(), **options)),
+            status_code=self.status_code or 200,
+            media_type=encoder.media_type,
+        )
+
+    def _get_output_serializer(self) -> Optional[Callable[[Any], Any]]:
+        if self.response_encoder is not None or self.trust_response_schema:
+            return self._encode_output
+        return None
+
+    def _stream_endpoint_output(
+        self,
+        endpoint_output: Any,
+        content: Any,
+        wrapped_model: Type[AbstractResponseSchema],
+        context: RouteContext,
+    ) -> StreamingResponse:
+        content_field: str = self.stream_content_field  # type: ignore
+        envelope = self._wrap_endpoint_output(
+            endpoint_output=endpoint_output._replace(response_content=[]) if content is not endpoint_output else [],
+            wrapped_model=wrapped_model,
+            context=context,
+        )
+        options = self._get_serialization_options()
+        projection = current_projection() if self.projector is not None else None
+        if projection is not None and projection.exclude is not None:  # sparse fieldsets
+            options["exclude"] = projection.exclude
+        template = build_envelope_template(envelope, content_field, **options)
+        item_serializer = self._stream_item_serializer
+        if item_serializer is None:  # built on first use, most routes never stream
+            item_serializer = get_type_serializer(get_item_type(context.response_model))
+            self._stream_item_serializer = item_serializer
+        serialize = partial(item_serializer, **get_item_options(content_field, **options))
+        return StreamingResponse(
+            stream_envelope(template, content, serialize, self.stream_chunk_size),
+            status_code=self.status_code or 200,
+            media_type="application/json",
+        )
+
+    def get_records_trailer(self, metadata: dict, count: int) -> Optional[Any]:
+        """Builds the last line of `application/x-ndjson` responses.
+        This method gets called internally and can be overridden to customize or remove the trailer.
+
+        Args:
+            metadata (dict): The metadata passed to `respond`.
+            count (int): The number of streamed records.
+
+        Returns:
+            Optional[Any]: The JSON compatible trailer, None to omit it.
+        """
+        return {"count": count, "metadata": metadata}
+
+    def _stream_endpoint_records(
+        self,
+        endpoint_output: Any,
+        content: Any,
+        context: RouteContext,
+    ) -> StreamingResponse:
+        item_type = get_item_type(context.response_model)
+        record_model = self._stream_record_model
+        if record_model is None:  # built on first use, most routes never stream
+            record_model = self.override_response_model(
+                wrapper_model=self.get_wrapper_model(
+                    is_error=self.is_error_state(status_code=self.status_code), response_model=item_type
+                ),
+                response_model=item_type,
+            )
+            self._stream_record_model = record_model
+        metadata = endpoint_output.metadata if content is not endpoint_output else dict()
+        record_context = context._replace(response_model=item_type)
+        encoder = self.response_encoder or PydanticResponseEncoder()
+        options = self._get_serialization_options()
+        projection = current_projection() if self.projector is not None else None
+        if projection is not None and projection.exclude is not None:  # sparse fieldsets, selected per record
+            options = get_record_options(self.content_field, **dict(options, exclude=projection.exclude))  # type: ignore
+
+        def encode(item: Any) -> bytes:
+            record = record_model.from_route_context(content=item, context=record_context)  # type: ignore
+            return encoder.encode(record, **options)
+
+        def trailer(count: int) -> Optional[bytes]:
+            last_line = self.get_records_trailer(metadata=metadata, count=count)
+            return render_json(jsonable_encoder(last_line)) if last_line is not None else None
+
+        return StreamingResponse(
+            stream_records(content, encode, trailer, self.stream_chunk_size),
+            status_code=self.status_code or 200,
+            media_type="application/x-ndjson",
+        )
+
+    def _resolve_etag(
+        self, endpoint_output: ResponseWithMetadata, context: RouteContext
+    ) -> Tuple[Any, Optional[Response]]:
+        metadata = dict(endpoint_output.metadata)
+        version = metadata.pop("etag")
+        endpoint_output = endpoint_output._replace(metadata=metadata)
+        conditional = _current_conditional.get()
+        if conditional is None or version is None:  # not a GET or HEAD request
+            return endpoint_output, None
+        conditional.etag = make_etag(version)
+        if context.status_code == 200 and etag_matches(conditional.if_none_match, conditional.etag):
+            return endpoint_output, not_modified(conditional.etag)
+        return endpoint_output, None
+
+    def _builds_responses(self) -> bool:
+        # FastAPI returns the responses built by the route as they are, without the injected sub-response
+        return (
+            self.response_encoder is not None
+            or self.trust_response_schema
+            or self.serialization_executor is not None
+            or self.etag
+            or self._streams_content()
+            or (self.projector is not None and self.fields_query_param is not None)
+        )
+
+    def _streams_content(self) -> bool:
+        return self.stream_records or self.stream_content_field is not None
+
+    def _resolve_endpoint_output(self, endpoint_output: ResponseWithMetadata) -> ResponseWithMetadata:
+        content = resolve_content(endpoint_output.response_content, stream=self._streams_content())
+        return endpoint_output._replace(response_content=content)
+
+    async def _aresolve_endpoint_output(self, endpoint_output: ResponseWithMetadata) -> ResponseWithMetadata:
+        content = await aresolve_content(endpoint_output.response_content, stream=self._streams_content())
+        return endpoint_output._replace(response_content=content)
+
+    def _process_endpoint_output(
         self,
         endpoint_output: Any,
-        wrapper_model: Type[AbstractResponseSchema],
-        response_model: Type[Any],
-        **params: Any,
+        wrapped_model: Type[AbstractResponseSchema],
+        context: RouteContext,
+        serialize: Optional[Callable[[Any], Any]],
     ) -> Any:
-        if lenient_isinstance(endpoint_output, ResponseWithMetadata):  # Handling the `respond` function
-            params.update(endpoint_output.metadata)
-            content = endpoint_output.response_content
+        if lenient_isinstance(endpoint_output, ResponseWithMetadata) and is_lazy(endpoint_output.response_content):
+            endpoint_output = self._resolve_endpoint_output(endpoint_output)
+        if self._streams_content():
+            if lenient_isinstance(endpoint_output, ResponseWithMetadata):
+                content = endpoint_output.response_content
+            else:
+                content = endpoint_output
+            if is_streamable(content) and self.stream_records:
+                return self._stream_endpoint_records(
+                    endpoint_output=endpoint_output,
+                    content=content,
+                    context=context,
+                )
+            if is_streamable(content):
+                return self._stream_endpoint_output(
+                    endpoint_output=endpoint_output,
+                    content=content,
+                    wrapped_model=wrapped_model,
+                    context=context,
+                )
+        wrapped_output = self._wrap_endpoint_output(
+            endpoint_output=endpoint_output,
+            wrapped_model=wrapped_model,
+            context=context,
+        )
+        if self.projector is not None:
+            projection = current_projection()
+            if projection is not None and projection.exclude is not None:  # sparse fieldsets
+                return self._encode_output(wrapped_output, exclude=projection.exclude)
+        return serialize(wrapped_output) if serialize else wrapped_output
+
+    def _instrument_phase(self, func: Callable, phase: str) -> Callable:
+        instrumentation: Instrumentation = self.instrumentation  # type: ignore
+
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def timed(*args: Any, **kwargs: Any) -> Any:
+                start = perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    instrumentation.record_timing(self.path, phase, perf_counter() - start)
+
         else:
-            content = endpoint_output
-        params["status_code"] = params.get("status_code") or 200
-        # due to: https://github.com/python/mypy/issues/12392 FIXME: when gets fixed
-        wrapped_model = wrapper_model[response_model]  # type: ignore
-        return wrapped_model.from_api_route(
-            content=content,
-            response_model=response_model,
-            **params,
+
+            @wraps(func)
+            def timed(*args: Any, **kwargs: Any) -> Any:
+                start = perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    instrumentation.record_timing(self.path, phase, perf_counter() - start)
+
+        return timed
+
+    def _instrument_response_class(
+        self, response_class: Union[Type[Response], DefaultPlaceholder]
+    ) -> Union[Type[Response], DefaultPlaceholder]:
+        actual_class = response_class.value if isinstance(response_class, DefaultPlaceholder) else response_class
+        instrumented_class = type(
+            actual_class.__name__, (actual_class,), {"render": self._instrument_phase(actual_class.render, "render")}
         )
+        return Default(instrumented_class) if isinstance(response_class, DefaultPlaceholder) else instrumented_class
+
+    def _get_pool_submitter(self, context: RouteContext) -> Callable[[Any], Optional["Future[bytes]"]]:
+        serializer: ProcessPoolSerializer = self.serialization_executor  # type: ignore
+        wrapper_model = self.get_wrapper_model(
+            is_error=self.is_error_state(status_code=context.status_code),
+            response_model=context.response_model,  # type: ignore[arg-type]
+        )
+        encoder = self.response_encoder or PydanticResponseEncoder()
+        options = dict(
+            include=context.response_model_include,
+            exclude=context.response_model_exclude,
+            by_alias=context.response_model_by_alias,
+            exclude_unset=context.response_model_exclude_unset,
+            exclude_defaults=context.response_model_exclude_defaults,
+            exclude_none=context.response_model_exclude_none,
+        )
+
+        def submit(endpoint_output: Any) -> Optional["Future[bytes]"]:
+            if lenient_isinstance(endpoint_output, ResponseWithMetadata):
+                content, metadata = endpoint_output.response_content, endpoint_output.metadata
+            else:
+                content, metadata = endpoint_output, None
+            if is_streamable(content) or not serializer.should_serialize(content):
+                return None
+            projection = current_projection() if self.projector is not None else None
+            try:
+                return serializer.submit(
+                    wrapper_model,
+                    content,
+                    context,
+                    metadata,
+                    encoder,
+                    dict(options, exclude=projection.exclude) if projection and projection.exclude else options,
+                )
+            except RuntimeError:  # shut down or broken pools
+                return None
+            except pickle.PicklingError:
+                _logger.warning("Serializing %s in process, the payload can not be pickled.", self.path, exc_info=True)
+                return None
+
+        return submit
 
     def _create_endpoint_handler_decorator(
-        self, wrapper_model: Type[AbstractResponseSchema], response_model: Type[Any], **params: Any
+        self, wrapped_model: Type[AbstractResponseSchema], context: RouteContext
     ) -> Callable:
+        serialize = self._get_output_serializer()
+        process = self._process_endpoint_output
+        offload_policy = self.offload_policy
+        submit_to_pool = self._get_pool_submitter(context) if self.serialization_executor is not None else None
+        media_type = (self.response_encoder or PydanticResponseEncoder).media_type
+        resolve_etag = self._resolve_etag if self.etag else None
+        if self.instrumentation is not None:  # without instrumentation no measurement is taken
+            serialize = self._instrument_phase(serialize, "encode") if serialize else None
+            process = self._instrument_phase(process, "wrap")  # type: ignore
+
         def decorator(func: Callable) -> Callable:
+            if self.instrumentation is not None:
+                func = self._instrument_phase(func, "endpoint")
+
             if asyncio.iscoroutinefunction(func):  # Not blocking asncyio loop
 
                 @wraps(func)
                 async def wrapper(*args: Any, **kwargs: Any) -> Any:
                     endpoint_output = await func(*args, **kwargs)
-                    return self._wrap_endpoint_output(
+                    if resolve_etag is not None and lenient_isinstance(endpoint_output, ResponseWithMetadata):
+                        if "etag" in endpoint_output.metadata:
+                            endpoint_output, response = resolve_etag(endpoint_output, context)
+                            if response is not None:
+                                return response
+                    if lenient_isinstance(endpoint_output, ResponseWithMetadata) and is_async_lazy(
+                        endpoint_output.response_content
+                    ):
+                        endpoint_output = await self._aresolve_endpoint_output(endpoint_output)
+                    if lenient_isinstance(endpoint_output, ResponseWithMetadata) and is_lazy(
+                        endpoint_output.response_content
+                    ):  # loaded in a worker thread, the offloading is then decided on the loaded content
+                        endpoint_output = await run_in_threadpool(self._resolve_endpoint_output, endpoint_output)
+                    future = submit_to_pool(endpoint_output) if submit_to_pool is not None else None
+                    if future is not None:
+                        try:
+                            body = await asyncio.wrap_future(future)
+                            return Response(content=body, status_code=context.status_code, media_type=media_type)
+                        except BrokenExecutor:  # e.g. a worker got killed, `BrokenProcessPool`
+                            _logger.warning(
+                                "Serializing %s in process, the process pool failed.", self.path, exc_info=True
+                            )
+                    if offload_policy is not None and offload_policy.should_offload(
+                        endpoint_output.response_content
+                        if lenient_isinstance(endpoint_output, ResponseWithMetadata)
+                        else endpoint_output
+                    ):
+                        return await offload_policy.run(
+                            process,
+                            endpoint_output=endpoint_output,
+                            wrapped_model=wrapped_model,
+                            context=context,
+                            serialize=serialize,
+                        )
+                    return process(
                         endpoint_output=endpoint_output,
-                        wrapper_model=wrapper_model,
-                        response_model=response_model,
-                        **params,
+                        wrapped_model=wrapped_model,
+                        context=context,
+                        serialize=serialize,
                     )
 
             else:
@@ -127,13 +564,50 @@ class SchemaAPIRoute(APIRoute):
                 @wraps(func)
                 def wrapper(*args: Any, **kwargs: Any) -> Any:
                     endpoint_output = func(*args, **kwargs)
-                    return self._wrap_endpoint_output(
+                    if resolve_etag is not None and lenient_isinstance(endpoint_output, ResponseWithMetadata):
+                        if "etag" in endpoint_output.metadata:
+                            endpoint_output, response = resolve_etag(endpoint_output, context)
+                            if response is not None:
+                                return response
+                    if lenient_isinstance(endpoint_output, ResponseWithMetadata) and is_async_lazy(
+                        endpoint_output.response_content
+                    ):  # sync endpoints run in a worker thread of the event loop
+                        endpoint_output = from_thread.run(self._aresolve_endpoint_output, endpoint_output)
+                    if lenient_isinstance(endpoint_output, ResponseWithMetadata) and is_lazy(
+                        endpoint_output.response_content
+                    ):
+                        endpoint_output = self._resolve_endpoint_output(endpoint_output)
+                    future = submit_to_pool(endpoint_output) if submit_to_pool is not None else None
+                    if future is not None:
+                        try:
+                            body = future.result()
+                            return Response(content=body, status_code=context.status_code, media_type=media_type)
+                        except BrokenExecutor:  # e.g. a worker got killed, `BrokenProcessPool`
+                            _logger.warning(
+                                "Serializing %s in process, the process pool failed.", self.path, exc_info=True
+                            )
+                    return process(
                         endpoint_output=endpoint_output,
-                        response_model=response_model,
-                        wrapper_model=wrapper_model,
-                        **params,
+                        wrapped_model=wrapped_model,
+                        context=context,
+                        serialize=serialize,
                     )
 
+            if not self._builds_responses():
+                return wrapper
+            handle = wrapper
+            if asyncio.iscoroutinefunction(handle):
+
+                @wraps(func)
+                async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                    return _apply_sub_response(await handle(*args, **kwargs))
+
+            else:
+
+                @wraps(func)
+                def wrapper(*args: Any, **kwargs: Any) -> Any:
+                    return _apply_sub_response(handle(*args, **kwargs))
+
             return wrapper
 
         return decorator
@@ -167,17 +641,21 @@ class SchemaAPIRoute(APIRoute):
         callbacks: Optional[List["BaseRoute"]] = None,
         **kwargs: Any,
     ) -> None:
+        self.projector: Optional[FieldProjector] = None
+        wrapped_response_model: Optional[Type[Any]] = None
         if response_model and not lenient_issubclass(
             response_model, AbstractResponseSchema
         ):  # If a `response_model` is set, then wrap the `response_model` with a response schema
             WrapperModel = self.get_wrapper_model(
                 is_error=self.is_error_state(status_code=status_code), response_model=response_model
             )
-            endpoint_wrapper = self._create_endpoint_handler_decorator(
+            # The parametrized schema is resolved once here and shared by every request served by this route.
+            WrappedModel = self.override_response_model(wrapper_model=WrapperModel, response_model=response_model)
+            # The route parameters are captured once, requests only add the `respond` metadata.
+            context = RouteContext(
                 path=path,
-                wrapper_model=WrapperModel,
+                status_code=status_code or 200,
                 response_model=response_model,
-                status_code=status_code,
                 tags=tags,
                 summary=summary,
                 description=description,
@@ -195,19 +673,42 @@ class SchemaAPIRoute(APIRoute):
                 include_in_schema=include_in_schema,
                 response_class=response_class,
             )
+            self.projector = self._create_projector(
+                response_model=context.response_model,
+                include=response_model_include,
+                exclude=response_model_exclude,
+            )
+            endpoint_wrapper = self._create_endpoint_handler_decorator(wrapped_model=WrappedModel, context=context)
             endpoint = endpoint_wrapper(endpoint)
-            response_model = self.override_response_model(wrapper_model=WrapperModel, response_model=response_model)
+            response_model = wrapped_response_model = WrappedModel
+            if self.projector is not None and self.fields_query_param is not None:
+                dependencies = [
+                    *(dependencies or []),
+                    params.Depends(self.projector.get_dependency(self.fields_query_param)),
+                ]
+            if self._builds_responses():
+                dependencies = [*(dependencies or []), params.Depends(_capture_sub_response)]
+        for additional_status_code, response in (responses or {}).items():
+            assert isinstance(response, dict), "An additional response must be a dict"
+            assert not response.get("model") or is_body_allowed_for_status_code(
+                additional_status_code
+            ), f"Status code {additional_status_code} must not have a response body"
+        if wrapped_response_model is not None:
+            assert is_body_allowed_for_status_code(
+                status_code
+            ), f"Status code {status_code} must not have a response body"
         super().__init__(
             path,
             endpoint,
-            response_model=response_model,
+            # The response fields of wrapped models are shared between routes and set below.
+            response_model=None if wrapped_response_model is not None else response_model,
             status_code=status_code,
             tags=tags,
             dependencies=dependencies,
             summary=summary,
             description=description,
             response_description=response_description,
-            responses=responses,
+            responses=None,  # additional response fields are only built when OpenAPI reads them
             deprecated=deprecated,
             name=name,
             methods=methods,
@@ -224,14 +725,145 @@ class SchemaAPIRoute(APIRoute):
             callbacks=callbacks,
             **kwargs,
         )
+        self.responses = responses or {}
+        self._response_fields = None
+        if wrapped_response_model is not None:
+            self.response_model = wrapped_response_model
+            self.response_field, self.secure_cloned_response_field = get_shared_response_fields(wrapped_response_model)
+
+    @property  # type: ignore[override]
+    def response_fields(self) -> Dict[Union[int, str], Any]:
+        """The fields of the additional `responses` models, only read by the OpenAPI generation.
+        They are built on first access, so applications that never serve their schema never build them.
+
+        Returns:
+            Dict[Union[int, str], ModelField]: The response fields by status code.
+        """
+        if self._response_fields is None:
+            self._response_fields = {
+                status_code: create_response_field(
+                    name=f"Response_{status_code}_{self.unique_id}", type_=response["model"]
+                )
+                for status_code, response in self.responses.items()
+                if response.get("model")
+            }
+        return self._response_fields
+
+    @response_fields.setter
+    def response_fields(self, value: Dict[Union[int, str], Any]) -> None:
+        self._response_fields = value
+
+    def _instrument_route_handler(
+        self, handler: Callable[[Request], Coroutine[Any, Any, Response]]
+    ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        instrumentation: Instrumentation = self.instrumentation  # type: ignore
+
+        async def instrumented_handler(request: Request) -> Response:
+            start = perf_counter()
+            response = await handler(request)
+            instrumentation.record_timing(self.path, "handler", perf_counter() - start)
+            body = getattr(response, "body", None)
+            if body is not None:
+                instrumentation.record_size(self.path, "response", len(body))
+            return response
+
+        return instrumented_handler
+
+    def _project_route_handler(
+        self, handler: Callable[[Request], Coroutine[Any, Any, Response]]
+    ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        projection = self.projector.projection  # type: ignore
+
+        async def projected_handler(request: Request) -> Response:
+            token = _current_projection.set(projection)
+            try:
+                return await handler(request)
+            finally:
+                _current_projection.reset(token)
+
+        return projected_handler
+
+    def _cached_route_handler(
+        self, handler: Callable[[Request], Coroutine[Any, Any, Response]]
+    ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        cache: ResponseCache = self.response_cache  # type: ignore
+        response_model = self.response_model
+
+        async def compute(request: Request) -> Response:
+            response = await handler(request)
+            conditional = _current_conditional.get()
+            if conditional is not None and conditional.etag is not None and response.status_code == 200:
+                response.headers["etag"] = conditional.etag  # stored with the response, replayed on hits
+            return response
+
+        async def cached_handler(request: Request) -> Response:
+            if request.method != "GET":
+                return await handler(request)
+            return await cache.serve(cache.get_key(request, response_model), partial(compute, request))
+
+        return cached_handler
+
+    def _conditional_route_handler(
+        self, handler: Callable[[Request], Coroutine[Any, Any, Response]]
+    ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        async def conditional_handler(request: Request) -> Response:
+            if request.method not in ("GET", "HEAD"):
+                return await handler(request)
+            conditional = ConditionalRequest(if_none_match=request.headers.get("if-none-match"))
+            token = _current_conditional.set(conditional)
+            try:
+                response = await handler(request)
+            finally:
+                _current_conditional.reset(token)
+            return await apply_etag(response, conditional)
+
+        return conditional_handler
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        # `APIRoute.__init__` asks for the handler before the shared response fields are set,
+        # the handler chain is built once, on the first request.
+        route_handler: Optional[Callable[[Request], Coroutine[Any, Any, Response]]] = None
+
+        async def handler(request: Request) -> Response:
+            nonlocal route_handler
+            if route_handler is None:
+                route_handler = self._build_route_handler()
+            return await route_handler(request)
+
+        return handler
+
+    def _build_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        # The handler validates against `secure_cloned_response_field` and renders with `response_class`,
+        # while OpenAPI keeps using `response_field` and the original response class.
+        response_field, response_class = self.secure_cloned_response_field, self.response_class
+        if self.instrumentation is not None:
+            if self.secure_cloned_response_field is not None:
+                self.secure_cloned_response_field = _InstrumentedResponseField(  # type: ignore[assignment]
+                    self.secure_cloned_response_field, self._instrument_phase
+                )
+            self.response_class = self._instrument_response_class(response_class)
+        try:
+            handler = super().get_route_handler()
+        finally:
+            self.secure_cloned_response_field, self.response_class = response_field, response_class
+        if self.projector is not None:
+            handler = self._project_route_handler(handler)
+        if self.response_cache is not None:
+            handler = self._cached_route_handler(handler)
+        if self.etag:
+            handler = self._conditional_route_handler(handler)
+        if self.instrumentation is not None:
+            return self._instrument_route_handler(handler)
+        return handler
 
 
 def respond(response_content: Optional[Any] = None, **metadata: Any) -> ResponseWithMetadata:
     """Returns the response content with optional metadata
 
     Args:
-        response_content (Optional[Any], optional): Response Content. Defaults to None.
-        **metadata: Arbitrary metadata
+        response_content (Optional[Any], optional): Response Content, callables and iterables that are not \
+            collections are loaded entirely by the route handler, after the endpoint returns. Defaults to None.
+        **metadata: Arbitrary metadata, `etag` provides the ETag of routes with `etag = True`
 
     Returns:
         ResponseWithMetadata: An intermediate data structure to add metadatato a ResponseSchema serialization
@@ -0,0 +1,296 @@
+from __future__ import annotations
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from typing import Any, AsyncIterator as AsyncIteratorType, Callable, Dict, Iterator as IteratorType, List, NamedTuple
+from typing import Optional, Union, get_args, get_origin
+from uuid import uuid4
+from ._compat import model_to_jsonable
+from .encoders import render_json
+
+
+class EnvelopeTemplate(NamedTuple):
+    """The encoded response schema envelope surrounding the streamed items.
+
+    Args:
+        prefix (bytes): Encoded envelope up to the opening bracket of the items array.
+        suffix (bytes): Encoded envelope from the closing bracket of the items array.
+    """
+
+    prefix: bytes
+    suffix: bytes
+
+
+def is_streamable(content: Any) -> bool:
+    """Evaluates whether or not the endpoint content can be streamed.
+    Only iterators and async iterators (e.g. generators) are streamed, materialized collections are not.
+
+    Args:
+        content (Any): The endpoint content.
+
+    Returns:
+        bool: wether or not the content can be streamed.
+    """
+    return isinstance(content, (Iterator, AsyncIterator))
+
+
+def get_item_type(response_model: Any) -> Any:
+    """Extracts the item type from a collection `response_model`.
+
+    Args:
+        response_model (Any): The route response model, e.g. `List[Item]`.
+
+    Returns:
+        Any: The item type, `Any` if the response model is not a collection.
+    """
+    args = get_args(response_model)
+    if args and get_origin(response_model) in (list, set, frozenset, tuple, Sequence, Iterable):
+        return args[0]
+    return Any
+
+
+def _get_items_spec(spec: Any, path: List[str]) -> Any:
+    for key in path:
+        if not isinstance(spec, dict):
+            return None
+        spec = spec.get(key)
+    return spec.get("__all__") if isinstance(spec, dict) else None
+
+
+def get_item_options(content_field: str, **options: Any) -> Dict[str, Any]:
+    """Derives the item serialization options from the response schema ones.
+    Items `include` and `exclude` are read from the `__all__` key of the content field,
+    e.g. `{"data": {"__all__": {"name"}}}`.
+
+    Args:
+        content_field (str): Dotted path of the content field in the response schema.
+        **options: The `response_model_*` serialization options.
+
+    Returns:
+        Dict[str, Any]: The serialization options for every item.
+    """
+    path = content_field.split(".")
+    return dict(
+        options,
+        include=_get_items_spec(options.get("include"), path),
+        exclude=_get_items_spec(options.get("exclude"), path),
+    )
+
+
+def _get_record_spec(spec: Any, path: List[str]) -> Any:
+    if not isinstance(spec, dict) or path[0] not in spec:
+        return spec
+    key, *rest = path
+    node = spec[key]
+    if rest:
+        node = _get_record_spec(node, rest)
+    elif isinstance(node, dict) and "__all__" in node:
+        node = node["__all__"]
+    return dict(spec, **{key: node})
+
+
+def get_record_options(content_field: str, **options: Any) -> Dict[str, Any]:
+    """Derives the record serialization options from the response schema ones.
+    Records wrap a single item: the `__all__` key of the content field is replaced by its value,
+    e.g. `{"data": {"__all__": {"name"}}}` becomes `{"data": {"name"}}`.
+
+    Args:
+        content_field (str): Dotted path of the content field in the response schema.
+        **options: The `response_model_*` serialization options.
+
+    Returns:
+        Dict[str, Any]: The serialization options for every record.
+    """
+    path = content_field.split(".")
+    return dict(
+        options,
+        include=_get_record_spec(options.get("include"), path),
+        exclude=_get_record_spec(options.get("exclude"), path),
+    )
+
+
+def build_envelope_template(envelope: Any, content_field: str, **options: Any) -> EnvelopeTemplate:
+    """Encodes a response schema instance built with empty content, splitting it around the content field.
+
+    Args:
+        envelope (Any): The response schema instance.
+        content_field (str): Dotted path of the content field in the response schema.
+        **options: The `response_model_*` serialization options.
+
+    Raises:
+        ValueError: when the content field is missing in the encoded response schema.
+
+    Returns:
+        EnvelopeTemplate: The encoded envelope.
+    """
+    data = model_to_jsonable(envelope, **options)
+    *parents, field = content_field.split(".")
+    target = data
+    for key in parents:
+        target = target.get(key) if isinstance(target, dict) else None
+    if not isinstance(target, dict) or field not in target:
+        raise ValueError(f"`{content_field}` is not a field of the encoded response schema.")
+    marker = f"fastapi-responseschema-stream-{uuid4().hex}"
+    target[field] = marker
+    prefix, suffix = render_json(data).split(render_json(marker), 1)
+    return EnvelopeTemplate(prefix=prefix + b"[", suffix=b"]" + suffix)
+
+
+def iterate_envelope(
+    template: EnvelopeTemplate, items: IteratorType[Any], serialize: Callable[[Any], bytes], chunk_size: int
+) -> IteratorType[bytes]:
+    """Encodes the envelope and the items, yielding a chunk every `chunk_size` items.
+
+    Args:
+        template (EnvelopeTemplate): The encoded envelope.
+        items (Iterator[Any]): The items to stream.
+        serialize (Callable[[Any], bytes]): Encodes a single item.
+        chunk_size (int): Number of items per chunk.
+
+    Yields:
+        bytes: The encoded response chunks.
+    """
+    yield template.prefix
+    chunk = bytearray()
+    count = 0
+    for item in items:
+        if count:
+            chunk += b","
+        chunk += serialize(item)
+        count += 1
+        if count % chunk_size == 0:
+            yield bytes(chunk)
+            chunk = bytearray()
+    chunk += template.suffix
+    yield bytes(chunk)
+
+
+async def aiterate_envelope(
+    template: EnvelopeTemplate, items: AsyncIteratorType[Any], serialize: Callable[[Any], bytes], chunk_size: int
+) -> AsyncIteratorType[bytes]:
+    """Async version of `iterate_envelope`.
+
+    Args:
+        template (EnvelopeTemplate): The encoded envelope.
+        items (AsyncIterator[Any]): The items to stream.
+        serialize (Callable[[Any], bytes]): Encodes a single item.
+        chunk_size (int): Number of items per chunk.
+
+    Yields:
+        bytes: The encoded response chunks.
+    """
+    yield template.prefix
+    chunk = bytearray()
+    count = 0
+    async for item in items:
+        if count:
+            chunk += b","
+        chunk += serialize(item)
+        count += 1
+        if count % chunk_size == 0:
+            yield bytes(chunk)
+            chunk = bytearray()
+    chunk += template.suffix
+    yield bytes(chunk)
+
+
+def stream_envelope(
+    template: EnvelopeTemplate, items: Any, serialize: Callable[[Any], bytes], chunk_size: int
+) -> Union[IteratorType[bytes], AsyncIteratorType[bytes]]:
+    """Streams the envelope and the items, picking the sync or async iteration.
+    Starlette iterates sync iterators in a threadpool, keeping blocking cursors off the event loop.
+
+    Args:
+        template (EnvelopeTemplate): The encoded envelope.
+        items (Union[Iterator[Any], AsyncIterator[Any]]): The items to stream.
+        serialize (Callable[[Any], bytes]): Encodes a single item.
+        chunk_size (int): Number of items per chunk.
+
+    Returns:
+        Union[Iterator[bytes], AsyncIterator[bytes]]: The encoded response chunks.
+    """
+    if isinstance(items, AsyncIterator):
+        return aiterate_envelope(template, items, serialize, chunk_size)
+    return iterate_envelope(template, items, serialize, chunk_size)
+
+
+def iterate_records(
+    items: IteratorType[Any],
+    encode: Callable[[Any], bytes],
+    trailer: Callable[[int], Optional[bytes]],
+    chunk_size: int,
+) -> IteratorType[bytes]:
+    """Encodes every item as a JSON line, followed by an optional trailer line.
+
+    Args:
+        items (Iterator[Any]): The items to stream.
+        encode (Callable[[Any], bytes]): Encodes a single item as a JSON document.
+        trailer (Callable[[int], Optional[bytes]]): Encodes the trailer from the number of streamed items.
+        chunk_size (int): Number of lines per chunk.
+
+    Yields:
+        bytes: The encoded response chunks.
+    """
+    chunk = bytearray()
+    count = 0
+    for item in items:
+        chunk += encode(item) + b"\n"
+        count += 1
+        if count % chunk_size == 0:
+            yield bytes(chunk)
+            chunk = bytearray()
+    last_line = trailer(count)
+    if last_line is not None:
+        chunk += last_line + b"\n"
+    if chunk:
+        yield bytes(chunk)
+
+
+async def aiterate_records(
+    items: AsyncIteratorType[Any],
+    encode: Callable[[Any], bytes],
+    trailer: Callable[[int], Optional[bytes]],
+    chunk_size: int,
+) -> AsyncIteratorType[bytes]:
+    """Async version of `iterate_records`.
+
+    Args:
+        items (AsyncIterator[Any]): The items to stream.
+        encode (Callable[[Any], bytes]): Encodes a single item as a JSON document.
+        trailer (Callable[[int], Optional[bytes]]): Encodes the trailer from the number of streamed items.
+        chunk_size (int): Number of lines per chunk.
+
+    Yields:
+        bytes: The encoded response chunks.
+    """
+    chunk = bytearray()
+    count = 0
+    async for item in items:
+        chunk += encode(item) + b"\n"
+        count += 1
+        if count % chunk_size == 0:
+            yield bytes(chunk)
+            chunk = bytearray()
+    last_line = trailer(count)
+    if last_line is not None:
+        chunk += last_line + b"\n"
+    if chunk:
+        yield bytes(chunk)
+
+
+def stream_records(
+    items: Any, encode: Callable[[Any], bytes], trailer: Callable[[int], Optional[bytes]], chunk_size: int
+) -> Union[IteratorType[bytes], AsyncIteratorType[bytes]]:
+    """Streams the items as JSON lines, picking the sync or async iteration.
+    Items are pulled only when the previous chunk has been sent, so slow clients throttle the producer.
+
+    Args:
+        items (Union[Iterator[Any], AsyncIterator[Any]]): The items to stream.
+        encode (Callable[[Any], bytes]): Encodes a single item as a JSON document.
+        trailer (Callable[[int], Optional[bytes]]): Encodes the trailer from the number of streamed items.
+        chunk_size (int): Number of lines per chunk.
+
+    Returns:
+        Union[Iterator[bytes], AsyncIterator[bytes]]: The encoded response chunks.
+    """
+    if isinstance(items, AsyncIterator):
+        return aiterate_records(items, encode, trailer, chunk_size)
+    return iterate_records(items, encode, trailer, chunk_size)
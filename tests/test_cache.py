@@ -0,0 +1,293 @@
+import asyncio
+import os
+from typing import Any, List
+import pytest
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from fastapi_responseschema import SchemaAPIRoute, respond
+from fastapi_responseschema.cache import (
+    CachedResponse,
+    ErrorResponseCache,
+    FileResponseStorage,
+    LRUCache,
+    MemoryResponseStorage,
+    ResponseCache,
+)
+from fastapi_responseschema.exceptions import NotFound, GenericHTTPException
+from .common import AResponseModel, SimpleResponseSchema
+
+
+def test_lru_eviction():
+    cache: LRUCache[int] = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (3, 1, 1, 2)
+
+
+def test_lru_delete_and_clear():
+    cache: LRUCache[int] = LRUCache()
+    cache.set("a", 1)
+    cache.delete("a")
+    cache.delete("missing")
+    assert cache.get("a") is None
+    cache.set("b", 2)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats().misses == 0
+
+
+def test_lru_invalid_size():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_error_cache_keys():
+    cache = ErrorResponseCache()
+    assert cache.get_key(NotFound(detail="oh no!"), 404) == cache.get_key(NotFound(detail="oh no!"), 404)
+    assert cache.get_key(NotFound(detail="oh no!"), 404) != cache.get_key(NotFound(detail="oh yes!"), 404)
+    assert cache.get_key(NotFound(detail="a", code=1), 404) != cache.get_key(NotFound(detail="a", code=2), 404)
+
+
+def test_error_cache_not_cacheable():
+    cache = ErrorResponseCache()
+    assert cache.get_key(GenericHTTPException(status_code=418), 418) is None
+    assert cache.get_key(HTTPException(status_code=404), 404) is None
+    assert cache.get_key(NotFound(detail={"unhashable": ["detail"]}), 404) is None
+
+
+def test_error_cache_cacheable_exceptions():
+    cache = ErrorResponseCache(cacheable_exceptions=(StarletteHTTPException,))
+    assert cache.get_key(StarletteHTTPException(status_code=404), 404) is not None
+
+
+def cached_response(body: bytes = b"{}") -> CachedResponse:
+    return CachedResponse(body=body, status_code=200, headers={"content-type": "application/json"})
+
+
+def test_memory_response_storage_eviction():
+    storage = MemoryResponseStorage(maxsize=2, max_bytes=10)
+    storage.set("a", cached_response(b"1234"), ttl=60)
+    storage.set("b", cached_response(b"1234"), ttl=60)
+    assert storage.get("a") is not None
+    storage.set("c", cached_response(b"1234"), ttl=60)
+    assert storage.get("b") is None
+    assert len(storage) == 2
+    storage.set("d", cached_response(b"123456"), ttl=60)  # exceeds `max_bytes` with the other responses
+    assert storage.get("a") is None
+    assert storage.get("c") is not None
+    assert storage.size == 10
+    storage.set("e", cached_response(b"x" * 11), ttl=60)
+    assert storage.get("e") is None
+    storage.set("d", cached_response(b"1"), ttl=0)
+    assert storage.get("d") is None
+    assert storage.size == 4
+    storage.set("f", cached_response(), ttl=60)
+    storage.delete("f")
+    storage.set("g", cached_response(), ttl=60)
+    storage.clear()
+    assert storage.get("g") is None
+    assert storage.size == 0
+
+
+def test_file_response_storage(tmp_path):
+    storage = FileResponseStorage(str(tmp_path / "responses"), max_bytes=1000)
+    response = CachedResponse(body=b'{"data":1}', status_code=200, headers={"content-length": "10"})
+    storage.set("a", response, ttl=60)
+    assert storage.get("a") == response
+    assert FileResponseStorage(str(tmp_path / "responses")).get("a") == response  # shared by processes
+    storage.set("a", cached_response(b"2"), ttl=60)
+    assert storage.get("a").body == b"2"
+    storage.set("expired", cached_response(), ttl=-1)
+    assert storage.get("expired") is None
+    assert not (tmp_path / "responses" / "expired.response").exists()
+    assert storage.get("missing") is None
+    (tmp_path / "responses" / "corrupted.response").write_bytes(b"xx")
+    assert storage.get("corrupted") is None
+    storage.delete("a")
+    storage.delete("a")
+    assert storage.get("a") is None
+    storage.set("large", cached_response(b"x" * 1000), ttl=60)
+    assert storage.get("large") is None
+    storage.clear()
+    assert list((tmp_path / "responses").iterdir()) == []
+
+
+def test_file_response_storage_eviction(tmp_path):
+    storage = FileResponseStorage(str(tmp_path), max_bytes=450)  # 128 bytes per response
+    for index in range(3):
+        storage.set(str(index), cached_response(b"x" * 80), ttl=60)
+        os.utime(tmp_path / f"{index}.response", (index, index))
+    storage.get("0")  # recently used
+    storage.set("3", cached_response(b"x" * 80), ttl=60)
+    assert storage.get("1") is None
+    assert storage.get("0") is not None
+    assert storage.get("2") is not None
+    assert storage.get("3") is not None
+
+
+def test_response_cache_keys():
+    cache = ResponseCache(vary_headers=("Authorization",))
+
+    def key(query: bytes = b"", headers=(), model: Any = int) -> str:
+        scope = {"type": "http", "path": "/items", "query_string": query, "headers": list(headers)}
+        return cache.get_key(Request(scope), model)
+
+    assert key(b"a=1&b=2") == key(b"b=2&a=1")
+    assert key(b"a=1") != key(b"a=2")
+    assert key(headers=[(b"authorization", b"x")]) != key(headers=[(b"authorization", b"y")])
+    assert key(headers=[(b"accept", b"x")]) == key()
+    assert key(model=str) != key()
+
+
+def test_response_cache_cacheable_responses():
+    cache = ResponseCache()
+    assert cache.to_cached_response(Response(b"{}")) is not None
+    assert cache.to_cached_response(Response(b"{}", status_code=201)) is None
+    assert cache.to_cached_response(Response(b"{}", headers={"cache-control": "no-store"})) is None
+    assert cache.to_cached_response(Response(b"{}", headers={"set-cookie": "a=b"})) is None
+    assert cache.to_cached_response(StreamingResponse(iter([b"{}"]))) is None
+
+
+def test_response_cache_stampede_protection():
+    cache = ResponseCache()
+    calls = []
+
+    async def compute() -> Response:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return Response(b'{"data":1}')
+
+    async def main():
+        return await asyncio.gather(*[cache.serve("key", compute) for _ in range(5)])
+
+    responses = asyncio.run(main())
+    assert len(calls) == 1
+    assert {response.body for response in responses} == {b'{"data":1}'}
+    asyncio.run(cache.serve("key", compute))
+    assert len(calls) == 1
+    cache.clear()
+    asyncio.run(cache.serve("key", compute))
+    assert len(calls) == 2
+
+
+def test_response_cache_stampede_uncacheable_and_errors():
+    cache = ResponseCache()
+    calls = []
+
+    async def uncacheable() -> Response:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return Response(b"{}", status_code=202)
+
+    async def failing() -> Response:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        raise ValueError()
+
+    async def main(compute):
+        return await asyncio.gather(*[cache.serve("key", compute) for _ in range(3)], return_exceptions=True)
+
+    assert [r.status_code for r in asyncio.run(main(uncacheable))] == [202, 202, 202]
+    assert len(calls) == 3
+    assert all(isinstance(r, ValueError) for r in asyncio.run(main(failing)))
+    assert len(calls) == 6
+
+
+endpoint_calls = []
+
+
+class CachedRoute(SchemaAPIRoute):
+    response_schema = SimpleResponseSchema
+    response_cache = ResponseCache(ttl=60)
+
+
+cached_app = FastAPI()
+cached_app.router.route_class = CachedRoute
+
+
+@cached_app.get("/items", response_model=List[AResponseModel])
+def list_items(limit: int = 2):
+    endpoint_calls.append(limit)
+    return [AResponseModel(id=i, name="item") for i in range(limit)]
+
+
+@cached_app.post("/items", response_model=List[AResponseModel])
+def create_items():
+    endpoint_calls.append(0)
+    return []
+
+
+cached_client = TestClient(cached_app)
+
+
+def test_route_response_cache():
+    endpoint_calls.clear()
+    CachedRoute.response_cache.clear()  # type: ignore
+    first = cached_client.get("/items?limit=2")
+    second = cached_client.get("/items?limit=2")
+    assert endpoint_calls == [2]
+    assert first.content == second.content
+    assert second.headers["content-type"] == "application/json"
+    assert len(second.json()["data"]) == 2
+    cached_client.get("/items?limit=3")
+    cached_client.get("/items?limit=2", headers={"authorization": "Bearer other"})
+    assert endpoint_calls == [2, 3, 2]
+    cached_client.post("/items")
+    cached_client.post("/items")
+    assert endpoint_calls == [2, 3, 2, 0, 0]
+
+
+class CachedConditionalRoute(CachedRoute):
+    response_cache = ResponseCache(ttl=60)
+    etag = True
+
+
+def test_route_response_cache_keeps_etag():
+    app = FastAPI()
+    app.router.route_class = CachedConditionalRoute
+
+    @app.get("/versioned", response_model=AResponseModel)
+    def versioned():
+        endpoint_calls.append("versioned")
+        return respond(AResponseModel(id=1, name="item"), etag="v1")
+
+    endpoint_calls.clear()
+    client = TestClient(app)
+    miss, hit = client.get("/versioned"), client.get("/versioned")
+    assert endpoint_calls == ["versioned"]
+    assert miss.headers["etag"] == hit.headers["etag"] == '"v1"'
+    not_modified = client.get("/versioned", headers={"if-none-match": '"v1"'})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == '"v1"'
+    assert endpoint_calls == ["versioned"]
+
+
+def test_route_response_cache_replays_sub_response():
+    app = FastAPI()
+    app.router.route_class = CachedConditionalRoute
+
+    @app.get("/versioned", response_model=AResponseModel)
+    def versioned(response: Response):
+        endpoint_calls.append("versioned")
+        response.status_code = 200
+        response.headers["x-version"] = "v1"
+        return respond(AResponseModel(id=1, name="item"), etag="v1")
+
+    endpoint_calls.clear()
+    CachedConditionalRoute.response_cache.clear()  # type: ignore
+    client = TestClient(app)
+    miss, hit = client.get("/versioned"), client.get("/versioned")
+    assert miss.status_code == hit.status_code == 200
+    assert hit.headers["x-version"] == "v1"
+    not_modified = client.get("/versioned", headers={"if-none-match": '"v1"'})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["x-version"] == "v1"
+    assert endpoint_calls == ["versioned"]
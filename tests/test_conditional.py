@@ -0,0 +1,233 @@
+from typing import Generic, List, TypeVar
+from fastapi import FastAPI, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from fastapi_responseschema import SchemaAPIRoute, respond, wrap_app_responses
+from fastapi_responseschema.conditional import etag_matches, make_etag
+from fastapi_responseschema.encoders import PydanticResponseEncoder
+from fastapi_responseschema.exceptions import NotFound
+from .common import SimpleResponseSchema, SimpleErrorResponseSchema, AResponseModel
+
+T = TypeVar("T")
+
+
+def test_make_etag():
+    assert make_etag(3) == '"3"'
+    assert make_etag('"abc"') == '"abc"'
+    assert make_etag('W/"abc"') == 'W/"abc"'
+
+
+def test_etag_matches():
+    assert etag_matches('"a"', '"a"')
+    assert etag_matches('"b", W/"a"', '"a"')
+    assert etag_matches("*", '"a"')
+    assert etag_matches('"a"', 'W/"a"')
+    assert not etag_matches('"b"', '"a"')
+    assert not etag_matches(None, '"a"')
+
+
+class Route(SchemaAPIRoute):
+    response_schema = SimpleResponseSchema
+    error_response_schema = SimpleErrorResponseSchema
+    etag = True
+
+
+class EncodedRoute(Route):
+    response_encoder = PydanticResponseEncoder()
+
+
+class StreamedRoute(Route):
+    stream_content_field = "data"
+
+
+class RecordsRoute(Route):
+    stream_records = True
+
+
+wrapped_outputs = []
+
+
+class CountingResponseSchema(SimpleResponseSchema[T], Generic[T]):
+    @classmethod
+    def from_api_route(cls, content, status_code: int, **others):
+        wrapped_outputs.append(content)
+        assert "etag" not in others
+        return super().from_api_route(content, status_code, **others)
+
+
+class VersionedRoute(Route):
+    response_schema = CountingResponseSchema
+
+
+ITEMS = [AResponseModel(id=i, name=f"item-{i}") for i in range(3)]
+app = FastAPI()
+wrap_app_responses(app, Route)
+
+
+@app.get("/items", response_model=List[AResponseModel])
+def list_items():
+    return ITEMS
+
+
+@app.post("/items", response_model=List[AResponseModel])
+def create_items():
+    return ITEMS
+
+
+@app.get("/missing", response_model=AResponseModel)
+def missing():
+    raise NotFound(detail="missing")
+
+
+@app.get("/text")
+def text():
+    return PlainTextResponse("text")
+
+
+@app.get("/file")
+def file():
+    return StreamingResponse(iter([b"raw"]))
+
+
+app.router.route_class = EncodedRoute
+
+
+@app.get("/encoded", response_model=List[AResponseModel])
+async def encoded():
+    return ITEMS
+
+
+app.router.route_class = StreamedRoute
+
+
+@app.get("/streamed", response_model=List[AResponseModel])
+def streamed():
+    return iter(ITEMS)
+
+
+@app.get("/streamed-versioned", response_model=List[AResponseModel])
+def streamed_versioned():
+    return respond(iter(ITEMS), etag="v1")
+
+
+app.router.route_class = RecordsRoute
+
+
+@app.get("/records", response_model=List[AResponseModel])
+async def records():
+    async def items():
+        for item in ITEMS:
+            yield item
+
+    return items()
+
+
+app.router.route_class = VersionedRoute
+
+
+@app.get("/versioned", response_model=List[AResponseModel])
+def versioned():
+    return respond(ITEMS, etag=2)
+
+
+@app.get("/versioned-async", response_model=List[AResponseModel])
+async def versioned_async():
+    return respond(ITEMS, etag='"abc"', description="versioned")
+
+
+@app.get("/versioned-sub-response", response_model=List[AResponseModel])
+def versioned_sub_response(response: Response):
+    response.status_code = 202
+    response.headers["x-version"] = "2"
+    return respond(ITEMS, etag=2)
+
+
+@app.get("/created", response_model=List[AResponseModel], status_code=201)
+def created():
+    return respond(ITEMS, etag=2)
+
+
+client = TestClient(app)
+
+
+def assert_conditional(path: str):
+    r = client.get(path)
+    assert r.status_code == 200
+    etag = r.headers["etag"]
+    assert etag.startswith('"') and len(etag) == 34
+    assert client.get(path).headers["etag"] == etag
+    not_modified = client.get(path, headers={"if-none-match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert "content-type" not in not_modified.headers
+    modified = client.get(path, headers={"if-none-match": '"outdated"'})
+    assert modified.status_code == 200
+    assert modified.content == r.content
+    assert int(modified.headers["content-length"]) == len(r.content)
+    return r
+
+
+def test_etag_default_serialization():
+    r = assert_conditional("/items")
+    assert r.json()["data"][0]["id"] == 0
+
+
+def test_etag_encoder():
+    assert_conditional("/encoded")
+
+
+def test_etag_streamed_envelope_is_not_buffered():
+    r = client.get("/streamed")
+    assert len(r.json()["data"]) == 3
+    assert r.headers["content-type"] == "application/json"
+    assert "etag" not in r.headers
+    assert "content-length" not in r.headers
+
+
+def test_etag_streamed_records_is_not_buffered():
+    r = client.get("/records", headers={"if-none-match": '"any"'})
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/x-ndjson"
+    assert "etag" not in r.headers
+
+
+def test_etag_skipped():
+    assert "etag" not in client.post("/items").headers
+    assert "etag" not in client.get("/missing").headers
+    assert "etag" not in client.get("/file").headers
+    assert "etag" in client.get("/text").headers
+
+
+def test_respond_etag_skips_encoding():
+    wrapped_outputs.clear()
+    r = client.get("/versioned")
+    assert r.headers["etag"] == '"2"'
+    assert len(wrapped_outputs) == 1
+    r = client.get("/versioned", headers={"if-none-match": '"2"'})
+    assert r.status_code == 304
+    assert r.headers["etag"] == '"2"'
+    assert len(wrapped_outputs) == 1
+    r = client.get("/versioned-async", headers={"if-none-match": '"abc"'})
+    assert r.status_code == 304
+    assert client.get("/versioned-async").headers["etag"] == '"abc"'
+
+
+def test_respond_etag_keeps_not_modified_status():
+    r = client.get("/versioned-sub-response", headers={"if-none-match": '"2"'})
+    assert r.status_code == 304
+    assert r.headers["x-version"] == "2"
+    assert client.get("/versioned-sub-response").status_code == 202
+
+
+def test_respond_etag_not_success():
+    r = client.get("/created", headers={"if-none-match": '"2"'})
+    assert r.status_code == 201
+    assert "etag" not in r.headers
+
+
+def test_respond_etag_keeps_streaming():
+    r = client.get("/streamed-versioned")
+    assert r.headers["etag"] == '"v1"'
+    assert "content-length" not in r.headers
+    assert client.get("/streamed-versioned", headers={"if-none-match": '"v1"'}).status_code == 304
@@ -0,0 +1,90 @@
+import json
+from datetime import date
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+from fastapi_responseschema import SchemaAPIRoute, respond, wrap_app_responses
+from fastapi_responseschema.encoders import PydanticResponseEncoder, OrjsonResponseEncoder, MsgspecResponseEncoder
+from fastapi_responseschema.exceptions import NotFound
+from .common import SimpleResponseSchema, SimpleErrorResponseSchema, AResponseModel
+
+
+@pytest.fixture(params=[PydanticResponseEncoder, OrjsonResponseEncoder])
+def encoder_class(request):
+    if request.param is OrjsonResponseEncoder:
+        pytest.importorskip("orjson")
+    return request.param
+
+
+def test_encode_model(encoder_class):
+    content = SimpleResponseSchema[AResponseModel](data=AResponseModel(id=1, name="hello"), error=False)
+    assert json.loads(encoder_class().encode(content)) == {"data": {"id": 1, "name": "hello"}, "error": False}
+
+
+def test_encode_model_with_options(encoder_class):
+    content = SimpleResponseSchema[AResponseModel](data=AResponseModel(id=1, name="hello"), error=False)
+    encoded = encoder_class().encode(content, exclude={"data": {"name"}}, by_alias=True)
+    assert json.loads(encoded) == {"data": {"id": 1}, "error": False}
+
+
+def test_encode_plain_content(encoder_class):
+    assert json.loads(encoder_class().encode({"day": date(2022, 1, 1)})) == {"day": "2022-01-01"}
+
+
+def test_msgspec_encoder():
+    pytest.importorskip("msgspec")
+    content = SimpleResponseSchema[int](data=1, error=False)
+    assert json.loads(MsgspecResponseEncoder().encode(content)) == {"data": 1, "error": False}
+
+
+class EncodedRoute(SchemaAPIRoute):
+    response_schema = SimpleResponseSchema
+    error_response_schema = SimpleErrorResponseSchema
+    response_encoder = PydanticResponseEncoder()
+
+
+app = FastAPI()
+wrap_app_responses(app, EncodedRoute)
+
+
+@app.get("/", response_model=AResponseModel, status_code=201, response_model_exclude={"data": {"name"}})
+def encoded():
+    return respond({"id": 1, "name": "hello"})
+
+
+@app.get("/sub-response", response_model=AResponseModel)
+async def sub_response(response: Response):
+    response.headers["x-custom"] = "custom"
+    response.set_cookie("session", "abc")
+    response.status_code = 202
+    return {"id": 1, "name": "hello"}
+
+
+@app.get("/not-found")
+def not_found():
+    raise NotFound(detail="oh no!", headers={"x-reason": "missing"})
+
+
+client = TestClient(app)
+
+
+def test_encoded_route():
+    response = client.get("/")
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"data": {"id": 1}, "error": False}
+
+
+def test_encoded_route_applies_sub_response():
+    response = client.get("/sub-response")
+    assert response.status_code == 202
+    assert response.headers["x-custom"] == "custom"
+    assert response.cookies["session"] == "abc"
+    assert response.json() == {"data": {"id": 1, "name": "hello"}, "error": False}
+
+
+def test_encoded_error_response():
+    response = client.get("/not-found")
+    assert response.status_code == 404
+    assert response.headers["x-reason"] == "missing"
+    assert response.json() == {"reason": "oh no!", "error": True}
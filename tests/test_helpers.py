@@ -1,13 +1,19 @@
 import pytest
+from typing import Generic, List, TypeVar
 from fastapi import FastAPI
 from fastapi.exceptions import StarletteHTTPException
 from fastapi.testclient import TestClient
 from fastapi_responseschema import SchemaAPIRoute
-from fastapi_responseschema.exceptions import GenericHTTPException
-from fastapi_responseschema.helpers import wrap_app_responses
+from fastapi_responseschema.cache import ErrorResponseCache
+from fastapi_responseschema.exceptions import GenericHTTPException, NotFound
+from fastapi_responseschema.helpers import wrap_app_responses, wrap_error_responses
+from fastapi_responseschema.interfaces import HTTPExceptionAdapter, exception_adapters
+from fastapi_responseschema._compat import PYDANTIC_MAJOR
 
 from .common import SimpleErrorResponseSchema, SimpleResponseSchema, AResponseModel
 
+T = TypeVar("T")
+
 
 class Route(SchemaAPIRoute):
     response_schema = SimpleResponseSchema
@@ -87,3 +93,127 @@ def test_fallback_error_schema():
     assert response.status_code == 400
     assert response.json().get("data") == "Error"
     assert response.json().get("error")
+
+
+built_error_responses = []
+
+
+class CountingErrorResponseSchema(SimpleErrorResponseSchema[T], Generic[T]):
+    @classmethod
+    def from_exception(cls, reason, status_code: int, **others):
+        built_error_responses.append(reason)
+        return super().from_exception(reason=reason, status_code=status_code, **others)
+
+
+class CachedRoute(SchemaAPIRoute):
+    response_schema = SimpleResponseSchema
+    error_response_schema = CountingErrorResponseSchema
+
+
+error_cache = ErrorResponseCache(maxsize=8)
+app3 = FastAPI()
+wrap_app_responses(app3, CachedRoute, error_cache=error_cache)
+client3 = TestClient(app3)
+
+
+@app3.get("/not-found/{detail}")
+def raise_not_found(detail: str):
+    raise NotFound(detail=detail, headers={"x-detail": detail})
+
+
+@app3.get("/generic")
+def raise_generic():
+    raise GenericHTTPException(status_code=418, detail="teapot")
+
+
+def test_cached_error_responses():
+    built = len(built_error_responses)
+    for _ in range(3):
+        response = client3.get("/not-found/missing")
+        assert response.status_code == 404
+        assert response.headers["x-detail"] == "missing"
+        assert response.json() == {"reason": "missing", "error": True}
+    assert len(built_error_responses) == built + 1
+    assert client3.get("/not-found/other").json() == {"reason": "other", "error": True}
+    assert len(built_error_responses) == built + 2
+
+
+def test_uncacheable_error_responses():
+    built = len(built_error_responses)
+    for _ in range(2):
+        response = client3.get("/generic")
+        assert response.status_code == 418
+        assert response.json() == {"reason": "teapot", "error": True}
+    assert len(built_error_responses) == built + 2
+
+
+adapters = exception_adapters.copy()
+adapters.register(
+    TimeoutError,
+    lambda exc: HTTPExceptionAdapter(
+        reason="timed out", status_code=504, headers={"retry-after": "1"}, extra_params={}
+    ),
+)
+adapters.register(
+    Exception, lambda exc: HTTPExceptionAdapter(reason="oops", status_code=500, headers=None, extra_params={})
+)
+app4 = FastAPI()
+app4.router.route_class = Route
+wrap_error_responses(app4, SimpleErrorResponseSchema, adapters=adapters)
+client4 = TestClient(app4, raise_server_exceptions=False)
+
+
+@app4.get("/timeout")
+def raise_timeout():
+    raise TimeoutError()
+
+
+@app4.get("/crash")
+def raise_crash():
+    raise RuntimeError("crash")
+
+
+@app4.get("/not-found")
+def raise_not_found_adapted():
+    raise NotFound(detail="missing")
+
+
+def test_registered_exception_adapters():
+    response = client4.get("/timeout")
+    assert response.status_code == 504
+    assert response.headers["retry-after"] == "1"
+    assert response.json() == {"reason": "timed out", "error": True}
+    response = client4.get("/crash")
+    assert response.status_code == 500
+    assert response.json() == {"reason": "oops", "error": True}
+    assert client4.get("/not-found").json() == {"reason": "missing", "error": True}
+    assert client4.get("/missing-route").json() == {"reason": "Not Found", "error": True}
+    assert TimeoutError not in exception_adapters.exception_classes()
+
+
+def test_wrap_app_responses_adapters():
+    app = FastAPI()
+    wrap_app_responses(app, Route, adapters=adapters)
+    app.get("/timeout")(raise_timeout)
+    response = TestClient(app).get("/timeout")
+    assert response.status_code == 504
+    assert response.json() == {"reason": "timed out", "error": True}
+
+
+@app.post("/bulk")
+def bulk(items: List[AResponseModel]):
+    return len(items)
+
+
+def test_bounded_validation_errors():
+    response = client.post("/bulk", json=[{"id": "x", "name": "item"}] * 1000)
+    assert response.status_code == 422
+    errors = response.json()["reason"]
+    assert len(errors) == 51
+    assert errors[0]["loc"] == ["body", 0, "id"]
+    assert errors[-1]["ctx"] == {"omitted_errors": 950}
+    response = client.post("/bulk", json={"items": ["x" * 100] * 1000})
+    if PYDANTIC_MAJOR >= 2:  # pydantic v1 errors do not carry the input
+        assert response.json()["reason"][0]["input"] == "<dict of 1 items>"
+    else:
+        assert "input" not in response.json()["reason"][0]
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+import pytest
+import fastapi_responseschema
+from fastapi_responseschema import integrations
+from fastapi_responseschema._compat import PYDANTIC_MAJOR
+
+# Cumulative import time of the package modules, the dependencies being already imported.
+IMPORT_BUDGET_US = 100_000
+DEPENDENCIES = "import fastapi, fastapi.routing, pydantic, starlette.responses"
+
+
+def run(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *options, "-c", code], check=True, capture_output=True, text=True)
+
+
+def package_import_time(statement: str) -> int:
+    """Runs `statement` with `-X importtime`, returning the microseconds spent importing the package modules."""
+    stderr = run(f"{DEPENDENCIES}\n{statement}", "-X", "importtime").stderr
+    total = 0
+    for line in stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.startswith(" fastapi_responseschema"):  # top level entries, nested imports are cumulated
+            total += int(cumulative)
+    return total
+
+
+def test_package_import_is_lazy():
+    loaded = run(
+        "import sys, fastapi_responseschema, fastapi_responseschema.integrations\n"
+        "print(sorted(m for m in sys.modules if m.startswith(('fastapi', 'pydantic', 'starlette'))))"
+    ).stdout
+    assert loaded.strip() == "['fastapi_responseschema', 'fastapi_responseschema.integrations']"
+
+
+def test_public_api_import_budget():
+    statement = "from fastapi_responseschema import *"
+    elapsed = min(package_import_time(statement) for _ in range(3))
+    assert 0 < elapsed < IMPORT_BUDGET_US, f"importing the public API took {elapsed}us"
+
+
+@pytest.mark.skipif(PYDANTIC_MAJOR < 2, reason="pydantic.v1 is pydantic itself")
+def test_public_api_skips_optional_modules():
+    loaded = run(
+        "import sys\nfrom fastapi_responseschema import *\n"
+        "print([m for m in ('pydantic.v1', 'multiprocessing') if m in sys.modules])"
+    ).stdout
+    assert loaded.strip() == "[]"
+
+
+def test_lazy_attributes():
+    assert fastapi_responseschema.SchemaAPIRoute.__name__ == "SchemaAPIRoute"
+    assert set(fastapi_responseschema.__all__) <= set(dir(fastapi_responseschema))
+    assert integrations.pagination.__name__ == "fastapi_responseschema.integrations.pagination"
+    assert "pagination" in dir(integrations)
+    with pytest.raises(AttributeError):
+        fastapi_responseschema.missing
+    with pytest.raises(AttributeError):
+        integrations.missing
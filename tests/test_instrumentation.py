@@ -0,0 +1,94 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_responseschema import SchemaAPIRoute, wrap_app_responses
+from fastapi_responseschema._compat import PYDANTIC_MAJOR
+from fastapi_responseschema.encoders import PydanticResponseEncoder
+from fastapi_responseschema.exceptions import NotFound
+from fastapi_responseschema.instrumentation import Histogram, HistogramCollector, to_prometheus_text
+from .common import SimpleResponseSchema, SimpleErrorResponseSchema, AResponseModel
+
+
+def test_histogram():
+    histogram = Histogram(buckets=(1.0, 2.0, 4.0))
+    for value in (0.5, 1.5, 1.5, 3.0, 8.0):
+        histogram.observe(value)
+    assert histogram.counts == [1, 2, 1, 1]
+    assert histogram.count == 5
+    assert histogram.sum == 14.5
+    assert histogram.quantile(0.5) == 2.0
+    assert histogram.quantile(0.99) == float("inf")
+
+
+def test_prometheus_text():
+    collector = HistogramCollector(duration_buckets=(0.1, 1.0), size_buckets=(1024,))
+    collector.record_timing('/items/{id}"', "wrap", 0.05)
+    collector.record_size("/items", "response", 2048)
+    text = to_prometheus_text(collector, namespace="app")
+    assert "# TYPE app_phase_duration_seconds histogram" in text
+    assert 'app_phase_duration_seconds_bucket{route="/items/{id}\\"",phase="wrap",le="0.1"} 1' in text
+    assert 'app_phase_duration_seconds_bucket{route="/items/{id}\\"",phase="wrap",le="+Inf"} 1' in text
+    assert 'app_payload_size_bytes_bucket{route="/items",phase="response",le="1024.0"} 0' in text
+    assert 'app_payload_size_bytes_count{route="/items",phase="response"} 1' in text
+    collector.clear()
+    assert not collector.timings
+
+
+collector = HistogramCollector()
+
+
+class InstrumentedRoute(SchemaAPIRoute):
+    response_schema = SimpleResponseSchema
+    error_response_schema = SimpleErrorResponseSchema
+    response_encoder = PydanticResponseEncoder()
+    instrumentation = collector
+
+
+app = FastAPI()
+wrap_app_responses(app, InstrumentedRoute)
+
+
+@app.get("/items/{item_id}", response_model=AResponseModel)
+async def get_item(item_id: int):
+    if item_id < 0:
+        raise NotFound(detail="missing")
+    return {"id": item_id, "name": "hello"}
+
+
+client = TestClient(app)
+
+
+class ValidatedRoute(InstrumentedRoute):
+    response_encoder = None
+
+
+validated_app = FastAPI()
+validated_app.router.route_class = ValidatedRoute
+validated_app.get("/validated", response_model=AResponseModel)(lambda: {"id": 1, "name": "hello"})
+
+
+def test_route_instrumentation():
+    collector.clear()
+    response = client.get("/items/1")
+    assert response.json() == {"data": {"id": 1, "name": "hello"}, "error": False}
+    for phase in ("endpoint", "wrap", "encode", "handler"):
+        assert collector.timings[("/items/{item_id}", phase)].count == 1
+    assert collector.sizes[("/items/{item_id}", "response")].sum == len(response.content)
+
+
+def test_fastapi_serialization_instrumentation():
+    collector.clear()
+    response = TestClient(validated_app).get("/validated")
+    assert response.json() == {"data": {"id": 1, "name": "hello"}, "error": False}
+    phases = ("validate", "render", "handler") if PYDANTIC_MAJOR < 2 else ("validate", "serialize", "render", "handler")
+    for phase in phases:
+        assert collector.timings[("/validated", phase)].count == 1
+    assert ("/validated", "encode") not in collector.timings
+
+
+def test_error_instrumentation():
+    collector.clear()
+    response = client.get("/items/-1")
+    assert response.status_code == 404
+    assert collector.timings[("/items/{item_id}", "error")].count == 1
+    client.get("/missing")
+    assert collector.sizes[("unmatched", "error")].count == 1
@@ -1,9 +1,15 @@
-from typing import Any
+from typing import Any, Generic, TypeVar
+import pytest
 from fastapi import Request
 from fastapi_responseschema.exceptions import NotFound
+from fastapi_responseschema.interfaces import ExceptionAdapterRegistry, HTTPExceptionAdapter, RouteContext
+from fastapi_responseschema.interfaces import ValidationErrorLimits
 from .common import SimpleResponseSchema
 
 
+T = TypeVar("T")
+
+
 def test_from_exception():
     exc = NotFound(detail="oh no!")
     resp = SimpleResponseSchema[Any].from_exception(reason=exc.detail, status_code=exc.status_code)
@@ -29,3 +35,99 @@ def test_from_api_route():
     resp = SimpleResponseSchema[dict].from_api_route(content={"hello": "world"}, status_code=201)
     assert not resp.error
     assert resp.data.get("hello") == "world"
+
+
+def test_from_route_context():
+    context = RouteContext(path="/", status_code=200)
+    resp = SimpleResponseSchema[dict].from_route_context(content={"hello": "world"}, context=context)
+    assert not resp.error
+    resp = SimpleResponseSchema[dict].from_route_context(content={}, context=context, metadata={"status_code": 404})
+    assert resp.error
+
+
+def test_from_route_context_metadata():
+    class RecordingSchema(SimpleResponseSchema[T], Generic[T]):
+        @classmethod
+        def from_api_route(cls, content: T, status_code: int, **others):
+            return cls(data=dict(others, status_code=status_code), error=False)
+
+    context = RouteContext(path="/items", status_code=201, summary="Items")
+    params = RecordingSchema[dict].from_route_context(content={}, context=context).data
+    assert (params["path"], params["status_code"], params["summary"]) == ("/items", 201, "Items")
+    metadata = {"summary": "Overridden", "result_code": "OK", "status_code": None}
+    params = RecordingSchema[dict].from_route_context(content={}, context=context, metadata=metadata).data
+    assert (params["summary"], params["result_code"], params["status_code"]) == ("Overridden", "OK", 200)
+    assert metadata == {"summary": "Overridden", "result_code": "OK", "status_code": None}
+
+
+def test_from_route_context_override():
+    class FastResponseSchema(SimpleResponseSchema[T], Generic[T]):
+        @classmethod
+        def from_route_context(cls, content, context, metadata=None):
+            return cls(data=content, error=(metadata or {}).get("status_code", context.status_code) >= 400)
+
+    resp = FastResponseSchema[dict].from_route_context(content={}, context=RouteContext(path="/", status_code=503))
+    assert resp.error
+
+
+def adapt_as(status_code: int):
+    return lambda exc: HTTPExceptionAdapter(reason=str(exc), status_code=status_code, headers=None, extra_params={})
+
+
+def test_exception_adapter_registry_resolves_mro():
+    registry = ExceptionAdapterRegistry()
+    registry.register(Exception, adapt_as(500))
+    registry.register(LookupError, adapt_as(404))
+    assert registry.adapt(KeyError("missing")).status_code == 404
+    assert registry.adapt(ValueError("bad")).status_code == 500
+    assert registry.resolve(IndexError) is registry.resolve(LookupError)
+    assert registry.exception_classes() == (Exception, LookupError)
+
+
+def test_exception_adapter_registry_cache_invalidation():
+    registry = ExceptionAdapterRegistry()
+    registry.register(LookupError, adapt_as(404))
+    assert registry.adapt(KeyError("missing")).status_code == 404
+    registry.register(KeyError, adapt_as(400))
+    assert registry.adapt(KeyError("missing")).status_code == 400
+    assert registry.resolve(ValueError) is None
+    with pytest.raises(TypeError):
+        registry.adapt(ValueError("bad"))
+
+
+def test_from_exception_handler_with_adapters():
+    registry = ExceptionAdapterRegistry()
+    registry.register(TimeoutError, adapt_as(504))
+    resp = SimpleResponseSchema[Any].from_exception_handler(
+        request=Request({"type": "http"}), exception=TimeoutError("slow"), adapters=registry
+    )
+    assert resp.error
+    assert resp.data == "slow"
+
+
+def test_validation_error_limits_format():
+    errors = [{"type": "int_parsing", "loc": ["body", i], "msg": "invalid", "input": "x"} for i in range(5)]
+    formatted = ValidationErrorLimits(max_errors=2).format(errors)
+    assert formatted[:2] == errors[:2]
+    assert formatted[2] == {
+        "type": "too_many_errors",
+        "loc": [],
+        "msg": "3 more validation errors omitted.",
+        "ctx": {"omitted_errors": 3},
+    }
+    assert ValidationErrorLimits(max_errors=None).format(errors) == errors
+    assert ValidationErrorLimits(max_errors=5).format(errors) == errors
+
+
+def test_validation_error_limits_shorten_input():
+    limits = ValidationErrorLimits(max_input_size=4)
+    assert limits.shorten_input("abc") == "abc"
+    assert limits.shorten_input("abcdef") == "abcd..."
+    assert limits.shorten_input(b"abcdef") == b"abcd..."
+    assert limits.shorten_input(1) == 1
+    assert limits.shorten_input(["abcdef"] * 3) == "<list of 3 items>"
+    assert limits.shorten_input(("abcdef", "ghijkl")) == "<tuple of 2 items>"
+    assert limits.shorten_input(object()) == "<object>"
+    assert ValidationErrorLimits(max_input_size=None).shorten_input("abcdef") == "abcdef"
+    error = {"type": "missing", "loc": ["body"], "msg": "missing"}
+    assert limits.format([error, "raw"]) == [error, "raw"]
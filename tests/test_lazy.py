@@ -0,0 +1,104 @@
+import asyncio
+from typing import List
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_responseschema import SchemaAPIRoute, respond
+from fastapi_responseschema.lazy import aresolve_content, is_async_lazy, is_lazy, resolve_content
+from .common import SimpleResponseSchema, AResponseModel
+
+
+class Query:
+    """An iterable that is not a collection, as ORM queries are."""
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.executed = False
+
+    def __iter__(self):
+        self.executed = True
+        return iter({"id": i, "name": "hello"} for i in range(self.count))
+
+
+async def agenerate(count: int):
+    for i in range(count):
+        yield {"id": i, "name": "hello"}
+
+
+def test_is_lazy():
+    assert is_lazy(lambda: [])
+    assert is_lazy(Query(1))
+    assert is_lazy(iter([]))
+    assert is_lazy(agenerate(1))
+    assert not is_lazy([1, 2])
+    assert not is_lazy({"a": 1})
+    assert not is_lazy("text")
+    assert not is_lazy(AResponseModel(id=1, name="hello"))
+    assert not is_lazy(AResponseModel)
+
+
+def test_is_async_lazy():
+    async def load():
+        return []
+
+    assert is_async_lazy(load)
+    assert is_async_lazy(agenerate(1))
+    assert not is_async_lazy(lambda: [])
+
+
+def test_resolve_content():
+    assert resolve_content(lambda: Query(2)) == [{"id": 0, "name": "hello"}, {"id": 1, "name": "hello"}]
+    generator = iter([1, 2])
+    assert resolve_content(generator, stream=True) is generator
+    assert resolve_content([1]) == [1]
+
+
+def test_aresolve_content():
+    async def load():
+        return agenerate(2)
+
+    def load_sync():
+        return [1]
+
+    assert len(asyncio.run(aresolve_content(load))) == 2
+    assert asyncio.run(aresolve_content(load_sync)) is load_sync  # left to `resolve_content`
+
+
+class Route(SchemaAPIRoute):
+    response_schema = SimpleResponseSchema
+
+
+app = FastAPI()
+app.router.route_class = Route
+query = Query(3)
+
+
+@app.get("/query", response_model=List[AResponseModel])
+async def get_query():
+    return respond(query)
+
+
+@app.get("/callable", response_model=List[AResponseModel])
+def get_callable():
+    return respond(lambda: Query(2))
+
+
+@app.get("/async-generator", response_model=List[AResponseModel])
+async def get_async_generator():
+    return respond(agenerate(2))
+
+
+@app.get("/sync-async-generator", response_model=List[AResponseModel])
+def get_sync_async_generator():
+    return respond(agenerate(4))
+
+
+client = TestClient(app)
+
+
+def test_lazy_content_routes():
+    assert not query.executed
+    assert len(client.get("/query").json()["data"]) == 3
+    assert query.executed
+    assert len(client.get("/callable").json()["data"]) == 2
+    assert len(client.get("/async-generator").json()["data"]) == 2
+    assert len(client.get("/sync-async-generator").json()["data"]) == 4
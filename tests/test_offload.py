@@ -0,0 +1,191 @@
+import json
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generic, List, TypeVar
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_responseschema import SchemaAPIRoute, respond
+from fastapi_responseschema.encoders import PydanticResponseEncoder
+from fastapi_responseschema.interfaces import RouteContext
+from fastapi_responseschema.offload import OffloadPolicy, ProcessPoolSerializer, count_items, estimate_size
+from fastapi_responseschema.offload import serialize_response
+from .common import SimpleResponseSchema, AResponseModel
+
+
+T = TypeVar("T")
+wrapping_threads: List[str] = []
+loading_threads: List[str] = []
+
+
+class ThreadRecordingSchema(SimpleResponseSchema[T], Generic[T]):
+    @classmethod
+    def from_api_route(cls, content: T, status_code: int, **others):
+        wrapping_threads.append(threading.current_thread().name)
+        return super().from_api_route(content=content, status_code=status_code, **others)
+
+
+def test_count_items():
+    assert count_items(None) == 0
+    assert count_items({"a": 1, "b": 2}) == 1
+    assert count_items("hello") == 1
+    assert count_items([1, 2, 3]) == 3
+
+
+def test_estimate_size():
+    assert estimate_size(None) == 0
+    assert estimate_size(b"12345") == 5
+    items = [AResponseModel(id=i, name="x" * 100) for i in range(100)]
+    assert 10_000 < estimate_size(items) < 20_000
+    assert estimate_size(items[:10]) < estimate_size(items)
+
+
+def test_should_offload():
+    assert OffloadPolicy(max_items=2).should_offload([1, 2, 3])
+    assert not OffloadPolicy(max_items=3).should_offload([1, 2, 3])
+    assert OffloadPolicy(max_items=None, max_bytes=100).should_offload({"data": "x" * 1000})
+    assert not OffloadPolicy(max_items=None, max_bytes=None).should_offload([1] * 10_000)
+
+
+class OffloadedRoute(SchemaAPIRoute):
+    response_schema = ThreadRecordingSchema
+    offload_policy = OffloadPolicy(max_items=2)
+
+
+class ExecutorRoute(SchemaAPIRoute):
+    response_schema = ThreadRecordingSchema
+    response_encoder = PydanticResponseEncoder()
+    offload_policy = OffloadPolicy(max_items=None, max_bytes=1000, executor=ThreadPoolExecutor(thread_name_prefix="io"))
+
+
+def build_client(route_class) -> TestClient:
+    app = FastAPI()
+    app.router.route_class = route_class
+
+    @app.get("/items", response_model=List[AResponseModel])
+    async def items(count: int):
+        return [{"id": i, "name": "x" * 100} for i in range(count)]
+
+    @app.get("/with-metadata", response_model=List[AResponseModel])
+    async def with_metadata(count: int):
+        return respond([{"id": i, "name": "x" * 100} for i in range(count)], description="items")
+
+    @app.get("/lazy", response_model=List[AResponseModel])
+    async def lazy(count: int):
+        loading_threads.append(threading.current_thread().name)  # the event loop thread
+
+        def produce():
+            loading_threads.append(threading.current_thread().name)
+            return [{"id": i, "name": "x" * 100} for i in range(count)]
+
+        return respond(produce)
+
+    return TestClient(app)
+
+
+def test_offload_large_outputs():
+    client = build_client(OffloadedRoute)
+    wrapping_threads.clear()
+    assert len(client.get("/items", params={"count": 1}).json()["data"]) == 1
+    assert len(client.get("/items", params={"count": 5}).json()["data"]) == 5
+    assert len(client.get("/with-metadata", params={"count": 5}).json()["data"]) == 5
+    loop_thread, *worker_threads = wrapping_threads
+    assert all(thread != loop_thread for thread in worker_threads)
+
+
+def test_offload_lazy_content():
+    client = build_client(OffloadedRoute)
+    wrapping_threads.clear()
+    loading_threads.clear()
+    assert len(client.get("/lazy", params={"count": 10}).json()["data"]) == 10
+    loop_thread, loading_thread = loading_threads
+    assert loading_thread != loop_thread
+    assert wrapping_threads[0] != loop_thread
+
+
+def test_offload_to_executor():
+    client = build_client(ExecutorRoute)
+    wrapping_threads.clear()
+    assert len(client.get("/items", params={"count": 50}).json()["data"]) == 50
+    assert wrapping_threads[0].startswith("io")
+
+
+pool_serializer = ProcessPoolSerializer(
+    max_workers=1, preload=("tests.common",), mp_context=multiprocessing.get_context("spawn"), min_items=10
+)
+
+
+class PoolRoute(SchemaAPIRoute):
+    response_schema = SimpleResponseSchema
+    serialization_executor = pool_serializer
+
+
+def test_should_serialize():
+    assert ProcessPoolSerializer(max_workers=1, min_items=3).should_serialize([1, 2, 3])
+    assert not ProcessPoolSerializer(max_workers=1, min_items=None).should_serialize([1] * 10_000)
+    assert ProcessPoolSerializer(max_workers=1, min_items=None, min_bytes=100).should_serialize("x" * 1000)
+
+
+def test_serialize_response():
+    body = serialize_response(
+        SimpleResponseSchema,
+        [{"id": 1, "name": "hello"}],
+        RouteContext(path="/", status_code=200, response_model=List[AResponseModel]),
+        None,
+        PydanticResponseEncoder(),
+        {"exclude": {"data": {"__all__": {"name"}}}},
+    )
+    assert json.loads(body) == {"data": [{"id": 1}], "error": False}
+
+
+def test_process_pool_serialization():
+    pool_serializer.warm_up()
+    client = build_client(PoolRoute)
+    response = client.get("/items", params={"count": 20})
+    assert response.headers["content-type"] == "application/json"
+    assert len(response.json()["data"]) == 20
+    assert len(client.get("/with-metadata", params={"count": 20}).json()["data"]) == 20
+    assert len(client.get("/items", params={"count": 2}).json()["data"]) == 2
+
+
+def test_process_pool_serialization_of_lazy_content(monkeypatch):
+    submitted = []
+    submit = pool_serializer.submit
+    monkeypatch.setattr(pool_serializer, "submit", lambda *args: submitted.append(args[1]) or submit(*args))
+    response = build_client(PoolRoute).get("/lazy", params={"count": 20})
+    assert len(response.json()["data"]) == 20
+    assert len(submitted) == 1 and len(submitted[0]) == 20
+
+
+def test_process_pool_fallback():
+    serializer = ProcessPoolSerializer(max_workers=1, min_items=1)
+    serializer.shutdown()
+
+    class ShutdownPoolRoute(SchemaAPIRoute):
+        response_schema = SimpleResponseSchema
+        serialization_executor = serializer
+
+    app = FastAPI()
+    app.router.route_class = ShutdownPoolRoute
+    app.get("/", response_model=List[AResponseModel])(lambda: [{"id": 1, "name": "hello"}])
+    assert TestClient(app).get("/").json() == {"data": [{"id": 1, "name": "hello"}], "error": False}
+
+
+def test_process_pool_unpicklable_payload(caplog):
+    app = FastAPI()
+    app.router.route_class = PoolRoute
+    lock = threading.Lock()  # extra fields are ignored by the response model, but can not be pickled
+    app.get("/", response_model=List[AResponseModel])(lambda: [{"id": i, "name": "x", "lock": lock} for i in range(20)])
+    assert len(TestClient(app).get("/").json()["data"]) == 20
+    assert "the payload can not be pickled" in caplog.text
+
+
+def test_process_pool_worker_errors(monkeypatch):
+    submit = pool_serializer.submit
+    monkeypatch.setattr(pool_serializer, "submit", lambda *args: submit(*args[:-1], {"unknown_option": True}))
+    app = FastAPI()
+    app.router.route_class = PoolRoute
+    app.get("/", response_model=List[AResponseModel])(lambda: [{"id": i, "name": "x"} for i in range(20)])
+    with pytest.raises(TypeError):  # raised by the encoder in the worker, not serialized again in process
+        TestClient(app).get("/")
@@ -0,0 +1,79 @@
+import json
+from typing import List
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_responseschema import SchemaAPIRoute
+from fastapi_responseschema.openapi import cache_openapi
+from .common import SimpleResponseSchema, SimpleErrorResponseSchema, AResponseModel
+
+
+class Route(SchemaAPIRoute):
+    response_schema = SimpleResponseSchema
+    error_response_schema = SimpleErrorResponseSchema
+
+
+def create_app(routes: int) -> FastAPI:
+    app = FastAPI()
+    app.router.route_class = Route
+    for i in range(routes):
+        app.get(f"/items-{i}", response_model=List[AResponseModel])(lambda: [])
+        app.get(f"/item-{i}", response_model=AResponseModel)(lambda: {"id": 1, "name": "item"})
+    app.get("/gone", response_model=AResponseModel, status_code=410)(lambda: None)
+    return app
+
+
+def test_envelopes_are_shared_components():
+    document = create_app(routes=20).openapi()
+    envelopes = [name for name in document["components"]["schemas"] if "ResponseSchema" in name]
+    assert len(envelopes) == 3  # the component names depend on the pydantic version
+    refs = {
+        path: operation["get"]["responses"][next(iter(operation["get"]["responses"]))]["content"]["application/json"][
+            "schema"
+        ]["$ref"]
+        for path, operation in document["paths"].items()
+    }
+    assert refs["/items-0"] == refs["/items-19"] != refs["/item-0"] == refs["/item-19"]
+    assert {refs["/items-0"], refs["/item-0"], refs["/gone"]} == {f"#/components/schemas/{name}" for name in envelopes}
+
+
+def test_envelope_names_are_stable():
+    assert create_app(routes=1).openapi()["components"] == create_app(routes=50).openapi()["components"]
+
+
+def test_cache_openapi():
+    app = create_app(routes=2)
+    openapi_cache = cache_openapi(app)
+    client = TestClient(app)
+    r = client.get("/openapi.json")
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/json"
+    assert r.json() == json.loads(json.dumps(app.openapi()))
+    etag = r.headers["etag"]
+    assert openapi_cache.render() is openapi_cache.render()
+    not_modified = client.get("/openapi.json", headers={"if-none-match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert len([route for route in app.routes if getattr(route, "path", None) == "/openapi.json"]) == 1
+
+    app.get("/added", response_model=AResponseModel)(lambda: None)
+    assert "/added" not in client.get("/openapi.json").json()["paths"]
+    openapi_cache.invalidate()
+    r = client.get("/openapi.json", headers={"if-none-match": etag})
+    assert r.status_code == 200
+    assert "/added" in r.json()["paths"]
+    assert r.headers["etag"] != etag
+
+
+def test_cache_openapi_warm_up_and_root_path():
+    app = FastAPI(root_path="/api")
+    openapi_cache = cache_openapi(app)
+    openapi_cache.warm_up()
+    assert openapi_cache._document is app.openapi_schema
+    app.openapi_schema = None  # the root path is documented, as FastAPI does, when the document is generated again
+    assert TestClient(app).get("/openapi.json").json()["servers"] == [{"url": "/api"}]
+
+
+def test_cache_openapi_requires_openapi_url():
+    with pytest.raises(ValueError):
+        cache_openapi(FastAPI(openapi_url=None))
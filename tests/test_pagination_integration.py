@@ -1,14 +1,32 @@
-from typing import TypeVar, Generic, Any, Sequence, Union
+from typing import TypeVar, Generic, Any, List, Optional, Sequence, Union
+import anyio
 import pytest
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, Request
 from fastapi.testclient import TestClient
 from fastapi_responseschema.integrations.pagination import (
+    AbstractCursorPagedResponseSchema,
     AbstractPagedResponseSchema,
+    CachedCount,
+    CountCache,
+    Cursor,
+    CursorPaginationMetadata,
+    CursorPaginationParams,
     PagedSchemaAPIRoute,
     PaginationMetadata,
     PaginationParams,
+    apaginate_keyset,
+    apaginate_offset,
+    create_page_links,
+    decode_cursor,
+    encode_cursor,
+    get_link_template,
+    paginate_keyset,
+    paginate_offset,
 )
+from fastapi_responseschema.exceptions import BadRequest
 from fastapi_pagination import paginate, add_pagination
+from fastapi_pagination.api import _req_val
+from fastapi_pagination.links.bases import create_links
 from .common import SimpleResponseSchema
 
 
@@ -26,10 +44,9 @@ class SimplePagedResponseSchema(AbstractPagedResponseSchema[T], Generic[T]):
     pagination: PaginationMetadata
 
     @classmethod
-    def create(cls, items: Sequence[T], params: PaginationParams, total: int):  #
-        return cls(
-            data=items, error=False, pagination=PaginationMetadata.from_abstract_page_create(total=total, params=params)
-        )
+    def create(cls, items: Sequence[T], params: PaginationParams, total: Optional[int] = None, **kwargs):
+        pagination = PaginationMetadata.from_abstract_page_create(total, params, **kwargs)
+        return cls(data=items, error=False, pagination=pagination)
 
     @classmethod
     def from_exception(cls, reason, status_code, **others):
@@ -146,3 +163,397 @@ def test_response_model_paginated_wrapping_in_router():
     assert not r.get("data")[1]
     assert r.get("pagination").get("total") == 4
     assert not r.get("error")
+
+
+@pytest.fixture
+def set_request():
+    tokens = []
+
+    def set_query(query_string: str) -> Request:
+        req = Request({"type": "http", "path": "/items", "query_string": query_string.encode(), "headers": []})
+        tokens.append(_req_val.set(req))
+        return req
+
+    yield set_query
+    for token in reversed(tokens):
+        _req_val.reset(token)
+
+
+@pytest.mark.parametrize(
+    "query_string,page,total",
+    [
+        ("", 1, 0),
+        ("page=2&page_size=10", 2, 45),
+        ("q=a%20b&page=3&page_size=10&tag=x&tag=y", 3, 30),
+        ("page_size=10&page=5", 5, 100),
+    ],
+)
+def test_create_page_links_matches_create_links(set_request, query_string, page, total):
+    set_request(query_string)
+    params = PaginationParams(page=page, page_size=10)
+    expected = create_links(
+        first={"page": 1},
+        last={"page": -(-total // 10) if total > 0 else 1},
+        next={"page": page + 1} if page * 10 < total else None,
+        prev={"page": page - 1} if page > 1 else None,
+    )
+    assert create_page_links(total, params) == expected
+
+
+def test_link_template_is_shared_across_pages(set_request):
+    first = get_link_template(set_request("page=1&page_size=10"))
+    assert get_link_template(set_request("page=7&page_size=10")) is first
+    assert get_link_template(set_request("page=1&page_size=20")) is not first
+    assert first.link(3) == "/items?page_size=10&page=3"
+
+
+def test_pagination_metadata_from_params(set_request):
+    set_request("page=2&page_size=10")
+    params = PaginationParams(page=2, page_size=10)
+    assert PaginationMetadata.from_params(total=25, params=params) == PaginationMetadata.from_abstract_page_create(
+        total=25, params=params
+    )
+    with pytest.raises(ValueError):
+        PaginationMetadata.from_params(total=-1, params=params)
+
+
+def test_response_model_paginated_links_in_app():
+    links = client.get("/with-model?page=2&page_size=1").json()["pagination"]["links"]
+    assert links == {
+        "first": "/with-model?page_size=1&page=1",
+        "last": "/with-model?page_size=1&page=4",
+        "self": "/with-model?page=2&page_size=1",
+        "next": "/with-model?page_size=1&page=3",
+        "prev": "/with-model?page_size=1&page=1",
+    }
+
+
+class SimpleCursorPagedResponseSchema(AbstractCursorPagedResponseSchema[T], Generic[T]):
+    data: Union[Sequence[T], T]
+    error: bool
+    pagination: Optional[CursorPaginationMetadata] = None
+
+    @classmethod
+    def create(cls, items: Sequence[T], params: CursorPaginationParams, **kwargs):
+        pagination = CursorPaginationMetadata.from_cursors(
+            params, next_=kwargs.get("next_"), previous=kwargs.get("previous")
+        )
+        return cls(data=items, error=False, pagination=pagination)
+
+    @classmethod
+    def from_exception(cls, reason, status_code, **others):
+        return cls(data=reason, error=status_code >= 400)
+
+    @classmethod
+    def from_api_route(cls, content: Any, status_code: int, **others):
+        return cls(error=status_code >= 400, data=content.data, pagination=content.pagination)
+
+
+def test_cursor_round_trip():
+    for cursor in [Cursor(key=1), Cursor(key="b", backwards=True), Cursor(key=[3, "c"])]:
+        assert decode_cursor(encode_cursor(cursor)) == cursor
+    assert "=" not in encode_cursor(Cursor(key=1))
+
+
+@pytest.mark.parametrize("value", ["not-base64!", encode_cursor(Cursor(key=1))[:-2], "InN0ciI"])
+def test_decode_invalid_cursor(value):
+    with pytest.raises(BadRequest):
+        decode_cursor(value)
+
+
+def test_get_wrapper_model_cursor_pagination():
+    class CursorRoute(PagedSchemaAPIRoute):
+        response_schema = SimpleResponseSchema
+        cursor_paged_response_schema = SimpleCursorPagedResponseSchema
+
+    r = CursorRoute("/", lambda: [True], response_model=SimpleCursorPagedResponseSchema[bool])
+    assert r.get_wrapper_model(is_error=False, response_model=SimpleCursorPagedResponseSchema[bool]) == (
+        SimpleCursorPagedResponseSchema
+    )
+    assert r.get_wrapper_model(is_error=False, response_model=List[bool]) == SimpleResponseSchema
+    assert r.get_paged_response_schema(SimplePagedResponseSchema[bool]) is None
+
+
+BIRDS = list(range(1, 8))
+fetched_limits = []
+
+
+def fetch_birds(cursor: Optional[Cursor], limit: int) -> List[int]:
+    fetched_limits.append(limit)
+    if cursor is None:
+        return BIRDS[:limit]
+    if cursor.backwards:
+        return [bird for bird in reversed(BIRDS) if bird < cursor.key][:limit]
+    return [bird for bird in BIRDS if bird > cursor.key][:limit]
+
+
+async def afetch_birds(cursor: Optional[Cursor], limit: int) -> List[int]:
+    return fetch_birds(cursor, limit)
+
+
+class KeysetRoute(PagedSchemaAPIRoute):
+    response_schema = SimpleResponseSchema
+    paged_response_schema = SimplePagedResponseSchema
+    cursor_paged_response_schema = SimpleCursorPagedResponseSchema
+
+
+keyset_app = FastAPI()
+keyset_app.router.route_class = KeysetRoute
+
+
+@keyset_app.get("/birds", response_model=SimpleCursorPagedResponseSchema[int])
+def list_birds():
+    return paginate_keyset(fetch_birds, key=lambda bird: bird)
+
+
+@keyset_app.get("/async-birds", response_model=SimpleCursorPagedResponseSchema[int])
+async def alist_birds():
+    return await apaginate_keyset(afetch_birds, key=lambda bird: bird)
+
+
+add_pagination(keyset_app)
+keyset_client = TestClient(keyset_app)
+
+
+@pytest.mark.parametrize("path", ["/birds", "/async-birds"])
+def test_keyset_pagination_walk(path):
+    first = keyset_client.get(f"{path}?page_size=3&q=x").json()
+    assert first["data"] == [1, 2, 3]
+    assert first["pagination"]["prev_cursor"] is None
+    links = first["pagination"]["links"]
+    assert links["first"] == f"{path}?page_size=3&q=x"
+    assert links["last"] is None
+    assert "total" not in first["pagination"]
+
+    second = keyset_client.get(links["next"]).json()
+    assert second["data"] == [4, 5, 6]
+    third = keyset_client.get(second["pagination"]["links"]["next"]).json()
+    assert third["data"] == [7]
+    assert third["pagination"]["next_cursor"] is None
+
+    back = keyset_client.get(third["pagination"]["links"]["prev"]).json()
+    assert back["data"] == [4, 5, 6]
+    back = keyset_client.get(back["pagination"]["links"]["prev"]).json()
+    assert back["data"] == [1, 2, 3]
+    assert back["pagination"]["prev_cursor"] is None
+    assert back["pagination"]["next_cursor"] == first["pagination"]["next_cursor"]
+
+
+def test_keyset_pagination_fetches_one_extra_item():
+    fetched_limits.clear()
+    keyset_client.get("/birds?page_size=2")
+    assert fetched_limits == [3]
+
+
+def test_keyset_pagination_invalid_cursor():
+    r = keyset_client.get("/birds?cursor=invalid")
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Invalid cursor."
+
+
+def test_create_page_links_without_total(set_request):
+    set_request("page=2&page_size=10")
+    params = PaginationParams(page=2, page_size=10)
+    links = create_page_links(None, params, has_next=True)
+    assert links.last is None
+    assert links.next == "/items?page_size=10&page=3"
+    assert links.prev == "/items?page_size=10&page=1"
+    assert create_page_links(None, params).next is None
+
+
+def test_pagination_metadata_estimated_total(set_request):
+    set_request("page=1&page_size=10")
+    params = PaginationParams(page=1, page_size=10)
+    metadata = PaginationMetadata.from_params(1000, params, total_is_estimate=True)
+    assert metadata.total == 1000
+    assert metadata.total_is_estimate
+    assert metadata.links.last is None
+    assert metadata.links.next == "/items?page_size=10&page=2"
+    assert PaginationMetadata.from_params(1000, params, has_next=False).links.next is None
+
+
+def test_cached_count():
+    counts = []
+
+    async def count() -> int:
+        counts.append(1)
+        return 42
+
+    cached = CachedCount(count, ttl=60)
+    assert anyio.run(cached) == 42
+    assert anyio.run(cached) == 42
+    assert len(counts) == 1
+    cached.invalidate()
+    assert anyio.run(cached) == 42
+    assert len(counts) == 2
+    expired = CachedCount(count, ttl=0)
+    anyio.run(expired)
+    anyio.run(expired)
+    assert len(counts) == 4
+
+
+offset_fetches = []
+offset_counts = []
+
+
+def fetch_offset(limit: int, offset: int) -> List[int]:
+    offset_fetches.append((limit, offset))
+    return BIRDS[offset : offset + limit]
+
+
+async def afetch_offset(limit: int, offset: int) -> List[int]:
+    return fetch_offset(limit, offset)
+
+
+async def estimate_birds() -> int:
+    offset_counts.append(1)
+    return 10
+
+
+cached_estimate = CachedCount(estimate_birds, ttl=60)
+offset_app = FastAPI()
+offset_app.router.route_class = Route
+
+
+@offset_app.get("/offset-birds", response_model=SimplePagedResponseSchema[int])
+def list_offset_birds():
+    return paginate_offset(fetch_offset)
+
+
+@offset_app.get("/counted-birds", response_model=SimplePagedResponseSchema[int])
+def list_counted_birds():
+    return paginate_offset(fetch_offset, count=lambda: len(BIRDS))
+
+
+@offset_app.get("/estimated-birds", response_model=SimplePagedResponseSchema[int])
+async def list_estimated_birds():
+    return await apaginate_offset(afetch_offset, count=cached_estimate, total_is_estimate=True)
+
+
+add_pagination(offset_app)
+offset_client = TestClient(offset_app)
+
+
+def test_paginate_offset_without_total():
+    offset_fetches.clear()
+    r = offset_client.get("/offset-birds?page=2&page_size=3").json()
+    assert offset_fetches == [(4, 3)]
+    assert r["data"] == [4, 5, 6]
+    assert r["pagination"]["total"] is None
+    assert r["pagination"]["links"]["last"] is None
+    assert r["pagination"]["links"]["next"] == "/offset-birds?page_size=3&page=3"
+    last = offset_client.get("/offset-birds?page=3&page_size=3").json()
+    assert last["data"] == [7]
+    assert last["pagination"]["links"]["next"] is None
+
+
+def test_paginate_offset_with_total():
+    r = offset_client.get("/counted-birds?page=1&page_size=3").json()
+    assert r["pagination"]["total"] == 7
+    assert not r["pagination"]["total_is_estimate"]
+    assert r["pagination"]["links"]["last"] == "/counted-birds?page_size=3&page=3"
+
+
+def test_apaginate_offset_with_cached_estimate():
+    offset_counts.clear()
+    cached_estimate.invalidate()
+    r = offset_client.get("/estimated-birds?page=3&page_size=3").json()
+    offset_client.get("/estimated-birds?page=1&page_size=3")
+    assert len(offset_counts) == 1
+    assert r["pagination"]["total"] == 10
+    assert r["pagination"]["total_is_estimate"]
+    assert r["pagination"]["links"]["last"] is None
+    assert r["pagination"]["links"]["next"] is None  # the extra item wins over the estimate
+
+
+def test_count_cache_keys():
+    cache = CountCache()
+    key = cache.get_key("/birds", [("q", "a"), ("page", 2), ("owner", 1)])
+    assert key == cache.get_key("/birds", {"owner": "1", "q": "a", "page_size": 10})
+    assert key != cache.get_key("/birds", {"owner": "2", "q": "a"})
+    assert key != cache.get_key("/owners", {"owner": "1", "q": "a"})
+
+
+def test_count_cache_ttl_and_invalidation():
+    cache = CountCache(ttl=60)
+    key = cache.get_key("/birds", {"q": "a"})
+    assert cache.count(key, lambda: 3) == 3
+    assert cache.count(key, lambda: 4) == 3
+    cache.invalidate("/birds", {"q": "a"})
+    assert cache.count(key, lambda: 5) == 5
+    cache.invalidate("/birds")
+    key = cache.get_key("/birds", {"q": "a"})
+    assert cache.get(key) is None
+    assert anyio.run(cache.acount, key, estimate_birds) == 10
+    cache.invalidate()
+    assert cache.get(key) is None
+    expired = CountCache(ttl=0)
+    expired.set(key, 1)
+    assert expired.get(key) is None
+
+
+def test_count_cache_lru_eviction():
+    cache = CountCache(maxsize=2)
+    for owner in range(3):
+        cache.set(cache.get_key("/birds", {"owner": owner}), owner)
+    assert cache.get(cache.get_key("/birds", {"owner": 0})) is None
+    assert cache.get(cache.get_key("/birds", {"owner": 2})) == 2
+
+
+count_cache = CountCache(ttl=60)
+birds_counts = []
+
+
+class CountedRoute(Route):
+    count_cache = count_cache
+
+
+def count_birds() -> int:
+    birds_counts.append(1)
+    return len(BIRDS)
+
+
+async def acount_birds() -> int:
+    return count_birds()
+
+
+counted_app = FastAPI()
+counted_app.router.route_class = CountedRoute
+
+
+@counted_app.get("/owners/{owner}/birds", response_model=SimplePagedResponseSchema[int])
+def list_owner_birds(owner: int, q: Optional[str] = None):
+    return paginate_offset(fetch_offset, count=count_birds)
+
+
+@counted_app.get("/async-birds", response_model=SimplePagedResponseSchema[int])
+async def alist_counted_birds():
+    return await apaginate_offset(afetch_offset, count=acount_birds)
+
+
+@counted_app.get("/plain", response_model=List[int])
+def plain():
+    return BIRDS
+
+
+add_pagination(counted_app)
+counted_client = TestClient(counted_app)
+
+
+def test_route_count_cache():
+    birds_counts.clear()
+    count_cache.invalidate()
+    for page in (1, 2, 3):
+        r = counted_client.get(f"/owners/1/birds?page={page}&page_size=3&q=x").json()
+        assert r["pagination"]["total"] == 7
+    assert len(birds_counts) == 1
+    counted_client.get("/owners/1/birds?page=1&page_size=3")
+    counted_client.get("/owners/2/birds?page=1&page_size=3&q=x")
+    assert len(birds_counts) == 3
+    count_cache.invalidate("/owners/{owner}/birds", {"owner": 1, "q": "x"})
+    counted_client.get("/owners/1/birds?q=x")
+    assert len(birds_counts) == 4
+    counted_client.get("/async-birds?page=2")
+    counted_client.get("/async-birds?page=3")
+    assert len(birds_counts) == 5
+    assert counted_client.get("/plain").json()["data"] == BIRDS
@@ -0,0 +1,165 @@
+import json
+from typing import List, Optional
+from fastapi import Depends, FastAPI, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from fastapi_responseschema import SchemaAPIRoute, wrap_app_responses
+from fastapi_responseschema._compat import model_to_dict
+from fastapi_responseschema.encoders import PydanticResponseEncoder
+from fastapi_responseschema.projection import (
+    FieldProjector,
+    Projection,
+    current_projection,
+    get_projected_model,
+    get_projection,
+    merge_specs,
+    project_fields,
+)
+from .common import SimpleResponseSchema, SimpleErrorResponseSchema, AResponseModel
+
+
+class Book(BaseModel):  # fields that may not be loaded have defaults
+    id: int
+    title: Optional[str] = None
+    author: Optional[str] = None
+    summary: Optional[str] = None
+
+
+def test_get_projected_model():
+    assert get_projected_model(Book) == (Book, False)
+    assert get_projected_model(List[Book]) == (Book, True)
+    assert get_projected_model(dict) == (None, False)
+
+
+def test_project_fields():
+    all_fields = frozenset({"id", "title", "author", "summary"})
+    assert project_fields(Book, "data", False) == all_fields
+    assert project_fields(Book, "data", False, include={"data": {"id", "title"}}) == {"id", "title"}
+    assert project_fields(Book, "data", False, include={"error"}) == frozenset()
+    assert project_fields(Book, "data", False, include={"data", "error"}) == all_fields
+    assert project_fields(Book, "data", True, include={"data": {"__all__": {"id"}}}) == {"id"}
+    assert project_fields(Book, "data", True, exclude={"data": {"__all__": {"summary"}}}) == all_fields - {"summary"}
+    assert project_fields(Book, "data", False, exclude={"data": {"author": True, "title": {"x"}}}) == all_fields - {
+        "author"
+    }
+    assert project_fields(Book, "data", False, exclude={"data"}) == frozenset()
+    assert project_fields(Book, "result.items", True, include={"result": {"items": {"__all__": {"id"}}}}) == {"id"}
+
+
+def test_merge_specs():
+    assert merge_specs(None, {"a"}) == {"a"}
+    assert merge_specs({"a"}, None) == {"a"}
+    assert merge_specs({"a": {"b"}}, {"a": {"c": True}}) == {"a": {"b": True, "c": True}}
+    assert merge_specs({"a": {"b"}}, {"a": True}) == {"a": True}
+
+
+def test_field_projector_select():
+    projector = FieldProjector(Book, "data", True, exclude={"data": {"__all__": {"summary"}}})
+    projection = projector.select(["id"])
+    assert projection.fields == {"id"}
+    assert projection.exclude == {"data": {"__all__": {"summary": True, "title": True, "author": True}}}
+    assert projector.select(["id"]) is projection
+    assert projector._cache.stats().hits == 1
+
+
+class ProjectedRoute(SchemaAPIRoute):
+    response_schema = SimpleResponseSchema
+    error_response_schema = SimpleErrorResponseSchema
+    content_field = "data"
+    fields_query_param = "fields"
+
+
+class EncodedProjectedRoute(ProjectedRoute):
+    response_encoder = PydanticResponseEncoder()
+
+
+class StreamedProjectedRoute(ProjectedRoute):
+    stream_content_field = "data"
+
+
+class RecordsProjectedRoute(ProjectedRoute):
+    stream_records = True
+
+
+def build_client(route_class) -> TestClient:
+    app = FastAPI()
+    wrap_app_responses(app, route_class)
+    books = [Book(id=i, title="title", author="author", summary="summary") for i in range(3)]
+
+    @app.get("/books", response_model=List[Book], response_model_exclude={"data": {"__all__": {"summary"}}})
+    async def list_books(projection: Projection = Depends(get_projection)):
+        assert projection == current_projection()
+        return [model_to_dict(book, include=set(projection.fields)) for book in books]
+
+    @app.get("/books/{book_id}", response_model=Book)
+    def get_book(book_id: int, projection: Projection = Depends(get_projection)):
+        return model_to_dict(books[book_id], include=set(projection.fields) | {"id"})  # primary keys are always loaded
+
+    @app.get("/export", response_model=List[Book], response_model_exclude={"data": {"__all__": {"summary"}}})
+    def export_books():
+        return iter(books)
+
+    @app.get("/plain", response_model=AResponseModel)
+    def plain():
+        assert current_projection() is not None
+        return {"id": 1, "name": "hello"}
+
+    return TestClient(app)
+
+
+def test_projection_dependency():
+    client = build_client(ProjectedRoute)
+    assert client.get("/books").json()["data"][0] == {"id": 0, "title": "title", "author": "author"}
+    assert client.get("/books/1").json()["data"]["summary"] == "summary"
+
+
+def test_sparse_fieldsets():
+    for route_class in (ProjectedRoute, EncodedProjectedRoute):
+        client = build_client(route_class)
+        response = client.get("/books", params={"fields": "id, title"})
+        assert response.json() == {"data": [{"id": i, "title": "title"} for i in range(3)], "error": False}
+        assert client.get("/books/2", params={"fields": "author"}).json()["data"] == {"author": "author"}
+        assert client.get("/plain", params={"fields": ""}).json()["data"] == {"id": 1, "name": "hello"}
+
+
+def test_streamed_sparse_fieldsets():
+    client = build_client(StreamedProjectedRoute)
+    response = client.get("/export", params={"fields": "id"})
+    assert response.json() == {"data": [{"id": i} for i in range(3)], "error": False}
+    response = client.get("/export")
+    assert response.json()["data"][0] == {"id": 0, "title": "title", "author": "author"}
+
+
+def test_streamed_records_sparse_fieldsets():
+    client = build_client(RecordsProjectedRoute)
+    lines = [json.loads(line) for line in client.get("/export", params={"fields": "id, title"}).text.splitlines()]
+    assert lines[:3] == [{"data": {"id": i, "title": "title"}, "error": False} for i in range(3)]
+    assert lines[3] == {"count": 3, "metadata": {}}
+
+
+def test_sparse_fieldsets_keep_sub_response():
+    app = FastAPI()
+    wrap_app_responses(app, ProjectedRoute)
+
+    @app.get("/item", response_model=Book)
+    def get_item(response: Response):
+        response.headers["x-custom"] = "custom"
+        response.set_cookie("session", "abc")
+        return Book(id=1, title="title", author="author", summary="summary")
+
+    response = TestClient(app).get("/item", params={"fields": "id"})
+    assert response.json()["data"] == {"id": 1}
+    assert response.headers["x-custom"] == "custom"
+    assert response.cookies["session"] == "abc"
+
+
+def test_sparse_fieldsets_validation():
+    client = build_client(ProjectedRoute)
+    response = client.get("/books", params={"fields": "id,summary,isbn"})
+    assert response.status_code == 400
+    assert response.json()["reason"] == "Unknown fields: isbn, summary."
+
+
+def test_sparse_fieldsets_openapi():
+    schema = build_client(ProjectedRoute).get("/openapi.json").json()
+    assert schema["paths"]["/books"]["get"]["parameters"][0]["name"] == "fields"
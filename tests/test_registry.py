@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+import pytest
+from fastapi_responseschema.interfaces import AbstractResponseSchema
+from fastapi_responseschema.registry import ParametrizationRegistry, parametrization_registry
+from .common import SimpleResponseSchema, AResponseModel
+
+
+def test_parametrization_is_registered():
+    assert SimpleResponseSchema[AResponseModel] is SimpleResponseSchema[AResponseModel]
+
+
+def test_inner_type_is_set_on_parametrized_schema():
+    assert SimpleResponseSchema[int].__inner_type__ is int
+    assert SimpleResponseSchema[str].__inner_type__ is str
+    assert "__inner_type__" not in vars(SimpleResponseSchema)
+    assert "__inner_type__" not in vars(AbstractResponseSchema)
+
+
+def test_concurrent_parametrization():
+    inner_types = [int, str, float, bytes, bool, AResponseModel, List[int], Dict[str, int]] * 32
+
+    def parametrize(inner_type):
+        return SimpleResponseSchema[inner_type].__inner_type__ == inner_type
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(parametrize, inner_types))
+
+
+def test_registry_stats():
+    registry = ParametrizationRegistry(maxsize=2)
+    registry.get_or_create(SimpleResponseSchema, int, lambda: SimpleResponseSchema[int])
+    registry.get_or_create(SimpleResponseSchema, int, lambda: SimpleResponseSchema[int])
+    registry.get_or_create(SimpleResponseSchema, str, lambda: SimpleResponseSchema[str])
+    registry.get_or_create(SimpleResponseSchema, bool, lambda: SimpleResponseSchema[bool])
+    stats = registry.stats()
+    assert stats.hits == 1
+    assert stats.misses == 3
+    assert stats.evictions == 1
+    assert stats.size == 2
+    registry.clear()
+    assert registry.stats().size == 0
+
+
+def test_registry_unhashable_params():
+    registry = ParametrizationRegistry()
+    assert registry.get_or_create(SimpleResponseSchema, [int], lambda: SimpleResponseSchema) is SimpleResponseSchema
+    assert registry.stats().size == 0
+
+
+def test_registry_invalid_size():
+    with pytest.raises(ValueError):
+        ParametrizationRegistry(maxsize=0)
+
+
+def test_global_registry_hits():
+    SimpleResponseSchema[bytes]
+    hits = parametrization_registry.stats().hits
+    SimpleResponseSchema[bytes]
+    assert parametrization_registry.stats().hits == hits + 1
@@ -1,13 +1,18 @@
 import asyncio
+from typing import Generic, TypeVar
 import pytest
+import fastapi.routing
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from fastapi.routing import APIRoute
 from fastapi_responseschema.routing import respond, SchemaAPIRoute
-from fastapi_responseschema.interfaces import ResponseWithMetadata
+from fastapi_responseschema.interfaces import ResponseWithMetadata, RouteContext
 from .common import SimpleResponseSchema, SimpleErrorResponseSchema, AResponseModel
 
 
+T = TypeVar("T")
+
+
 def test_respond_returns_type():
     out = respond()
     assert isinstance(out, ResponseWithMetadata)
@@ -74,6 +79,19 @@ class TestSchemaAPIRouteOverridables:
             == SimpleResponseSchema[AResponseModel]
         )
 
+    def test_wrapped_model_resolved_at_construction(self):
+        class Route(SchemaAPIRoute):
+            response_schema = SimpleResponseSchema
+
+        r = Route("/", lambda: {"id": 1, "name": "hello"}, response_model=AResponseModel)
+        assert r.response_model == SimpleResponseSchema[AResponseModel]
+        out = r._wrap_endpoint_output(
+            endpoint_output={"id": 1, "name": "hello"},
+            wrapped_model=r.response_model,
+            context=RouteContext(path="/", status_code=200, response_model=AResponseModel),
+        )
+        assert isinstance(out, r.response_model)
+
 
 class SimpleRoute(SchemaAPIRoute):
     response_schema = SimpleResponseSchema
@@ -149,3 +167,117 @@ def test_async_behavior():
     assert r.get("data").get("id") == 1
     assert r.get("data").get("name") == "hello"
     assert not r.get("error")
+
+
+class TrustedRoute(SchemaAPIRoute):
+    response_schema = SimpleResponseSchema
+    error_response_schema = SimpleErrorResponseSchema
+    trust_response_schema = True
+
+
+trusted_app = FastAPI()
+trusted_app.router.route_class = TrustedRoute
+
+
+@trusted_app.get("/with-model", response_model=AResponseModel)
+def trusted_with_response_model():
+    return {"id": 1, "name": "hello"}
+
+
+@trusted_app.get("/exclude", response_model=AResponseModel, response_model_exclude={"data": {"name"}})
+async def trusted_exclude():
+    return respond({"id": 1, "name": "hello"})
+
+
+trusted_client = TestClient(trusted_app)
+
+
+def test_trusted_response_model_wrapping():
+    r = trusted_client.get("/with-model").json()
+    assert r == {"data": {"id": 1, "name": "hello"}, "error": False}
+
+
+def test_trusted_response_model_exclude():
+    r = trusted_client.get("/exclude").json()
+    assert r == {"data": {"id": 1}, "error": False}
+
+
+def test_trusted_route_keeps_openapi_response_model():
+    route = next(r for r in trusted_app.routes if getattr(r, "path", None) == "/with-model")
+    assert route.response_field is not None
+    schema = trusted_client.get("/openapi.json").json()
+    assert "SimpleResponseSchema_AResponseModel_" in schema["components"]["schemas"]
+
+
+def test_trusted_route_skips_response_validation():
+    class UncheckedSchema(SimpleResponseSchema[T], Generic[T]):
+        @classmethod
+        def from_api_route(cls, content, status_code, **others):
+            return {"data": content, "error": "unchecked"}
+
+    class StrictRoute(SchemaAPIRoute):
+        response_schema = UncheckedSchema
+
+    class UncheckedRoute(StrictRoute):
+        trust_response_schema = True
+
+    for route_class, status_code in ((StrictRoute, 500), (UncheckedRoute, 200)):
+        local_app = FastAPI()
+        local_app.router.route_class = route_class
+        local_app.get("/", response_model=AResponseModel)(lambda: {"id": 1, "name": "hello"})
+        assert TestClient(local_app, raise_server_exceptions=False).get("/").status_code == status_code
+
+
+def test_routes_share_response_fields():
+    class Route(SchemaAPIRoute):
+        response_schema = SimpleResponseSchema
+
+    first = Route("/first", lambda: None, response_model=AResponseModel)
+    second = Route("/second", lambda: None, response_model=AResponseModel)
+    assert first.response_model is second.response_model
+    assert first.response_field is second.response_field
+    assert first.secure_cloned_response_field is second.secure_cloned_response_field
+    with pytest.raises(AssertionError):
+        Route("/empty", lambda: None, response_model=AResponseModel, status_code=204)
+
+
+def test_route_handler_is_built_once(monkeypatch):
+    class Route(SchemaAPIRoute):
+        response_schema = SimpleResponseSchema
+
+    built = []
+    get_request_handler = fastapi.routing.get_request_handler
+    monkeypatch.setattr(
+        fastapi.routing, "get_request_handler", lambda **kw: built.append(1) or get_request_handler(**kw)
+    )
+    route = Route("/", lambda: {"id": 1, "name": "hello"}, response_model=AResponseModel)
+    assert built == []  # built on the first request, once the shared response fields are set
+    local_app = FastAPI()
+    local_app.router.routes.append(route)
+    client = TestClient(local_app)
+    for _ in range(2):
+        assert client.get("/").json() == {"data": {"id": 1, "name": "hello"}, "error": False}
+    assert len(built) == 1
+
+
+def test_additional_response_fields_are_deferred():
+    class Route(SchemaAPIRoute):
+        response_schema = SimpleResponseSchema
+
+    local_app = FastAPI()
+    local_app.router.route_class = Route
+    local_app.get("/", response_model=AResponseModel, responses={404: {"model": AResponseModel}, 301: {}})(
+        lambda: {"id": 1, "name": "hello"}
+    )
+    route = local_app.routes[-1]
+    assert route._response_fields is None
+    local_client = TestClient(local_app)
+    assert local_client.get("/").json() == {"data": {"id": 1, "name": "hello"}, "error": False}
+    assert route._response_fields is None
+    schema = local_client.get("/openapi.json").json()
+    assert set(route.response_fields) == {404}
+    assert schema["paths"]["/"]["get"]["responses"]["404"]["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/AResponseModel"
+    }
+    with pytest.raises(AssertionError):
+        Route("/", lambda: None, responses={204: {"model": AResponseModel}})
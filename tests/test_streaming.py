@@ -0,0 +1,165 @@
+import asyncio
+import json
+from typing import Any, List, Sequence
+import pytest
+from fastapi import FastAPI, APIRouter
+from fastapi.testclient import TestClient
+from fastapi_responseschema import SchemaAPIRoute, respond
+from fastapi_responseschema.streaming import (
+    build_envelope_template,
+    get_item_options,
+    get_item_type,
+    is_streamable,
+    iterate_envelope,
+)
+from .common import SimpleResponseSchema, AResponseModel
+
+
+def test_is_streamable():
+    assert is_streamable(iter([1]))
+    assert is_streamable(i for i in range(1))
+    assert not is_streamable([1])
+    assert not is_streamable({"a": 1})
+
+
+def test_get_item_type():
+    assert get_item_type(List[AResponseModel]) is AResponseModel
+    assert get_item_type(Sequence[int]) is int
+    assert get_item_type(AResponseModel) is Any
+
+
+def test_get_item_options():
+    options = get_item_options("data", include=None, exclude={"data": {"__all__": {"name"}}}, exclude_none=True)
+    assert options == {"include": None, "exclude": {"name"}, "exclude_none": True}
+
+
+def test_envelope_template():
+    envelope = SimpleResponseSchema[List[int]](data=[], error=False)
+    template = build_envelope_template(envelope, "data")
+    assert b"".join(iterate_envelope(template, iter([1, 2, 3]), lambda i: str(i).encode(), 2)) == (
+        b'{"data":[1,2,3],"error":false}'
+    )
+
+
+def test_envelope_template_missing_field():
+    envelope = SimpleResponseSchema[List[int]](data=[], error=False)
+    with pytest.raises(ValueError):
+        build_envelope_template(envelope, "missing.data")
+
+
+class StreamingRoute(SchemaAPIRoute):
+    response_schema = SimpleResponseSchema
+    stream_content_field = "data"
+    stream_chunk_size = 3
+
+
+app = FastAPI()
+app.router.route_class = StreamingRoute
+
+
+@app.get("/sync", response_model=List[AResponseModel])
+def sync_items():
+    return ({"id": i, "name": f"item-{i}", "secret": True} for i in range(10))
+
+
+@app.get("/async", response_model=List[AResponseModel], response_model_exclude={"data": {"__all__": {"name"}}})
+async def async_items():
+    async def items():
+        for i in range(5):
+            await asyncio.sleep(0)
+            yield AResponseModel(id=i, name=f"item-{i}")
+
+    return respond(items())
+
+
+@app.get("/empty", response_model=List[AResponseModel])
+def empty_items():
+    return iter([])
+
+
+@app.get("/materialized", response_model=List[AResponseModel])
+def materialized_items():
+    return [{"id": 1, "name": "item-1"}]
+
+
+client = TestClient(app)
+
+
+def test_stream_sync_iterator():
+    response = client.get("/sync")
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"data": [{"id": i, "name": f"item-{i}"} for i in range(10)], "error": False}
+
+
+def test_stream_async_iterator():
+    response = client.get("/async")
+    assert response.json() == {"data": [{"id": i} for i in range(5)], "error": False}
+
+
+def test_stream_empty_iterator():
+    assert client.get("/empty").json() == {"data": [], "error": False}
+
+
+def test_materialized_content_is_not_streamed():
+    response = client.get("/materialized")
+    assert "content-length" in response.headers
+    assert response.json() == {"data": [{"id": 1, "name": "item-1"}], "error": False}
+
+
+class RecordsRoute(SchemaAPIRoute):
+    response_schema = SimpleResponseSchema
+    stream_records = True
+    stream_chunk_size = 2
+
+
+class NoTrailerRecordsRoute(RecordsRoute):
+    def get_records_trailer(self, metadata, count):
+        return None
+
+
+records_app = FastAPI()
+records_app.router.route_class = RecordsRoute
+
+
+@records_app.get("/export", response_model=List[AResponseModel])
+def export_items():
+    return respond(({"id": i, "name": f"item-{i}"} for i in range(3)), exported_by="tests")
+
+
+@records_app.get("/async-export", response_model=List[AResponseModel], response_model_exclude={"data": {"name"}})
+async def async_export_items():
+    async def items():
+        for i in range(4):
+            yield AResponseModel(id=i, name=f"item-{i}")
+
+    return items()
+
+
+no_trailer_router = APIRouter(route_class=NoTrailerRecordsRoute)
+
+
+@no_trailer_router.get("/no-trailer", response_model=List[AResponseModel])
+def no_trailer_items():
+    return iter([{"id": 1, "name": "item-1"}])
+
+
+records_app.include_router(no_trailer_router)
+records_client = TestClient(records_app)
+
+
+def test_stream_records():
+    response = records_client.get("/export")
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[:3] == [{"data": {"id": i, "name": f"item-{i}"}, "error": False} for i in range(3)]
+    assert lines[3] == {"count": 3, "metadata": {"exported_by": "tests"}}
+
+
+def test_stream_async_records():
+    lines = [json.loads(line) for line in records_client.get("/async-export").text.splitlines()]
+    assert lines == [{"data": {"id": i}, "error": False} for i in range(4)] + [{"count": 4, "metadata": {}}]
+
+
+def test_stream_records_without_trailer():
+    lines = records_client.get("/no-trailer").text.splitlines()
+    assert [json.loads(line) for line in lines] == [{"data": {"id": 1, "name": "item-1"}, "error": False}]